@@ -0,0 +1,4 @@
+# Load the celery app with django so that @shared_task binds to it
+from .celery import celery as celery_app  # noqa
+
+__all__ = ('celery_app',)
@@ -14,6 +14,9 @@ from django.core.asgi import get_asgi_application
 
 # os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.django.local')
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.django.base')
+# Django 4.0 runs the sync code of each ASGI request in a thread of its own, a
+# persistent connection would never be reused and stay open, see README.md
+os.environ.setdefault('DATABASE_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
 
@@ -28,6 +28,7 @@ THIRD_PARTY_APPS = [
     'django_celery_beat',
     'corsheaders',
     'drf_spectacular',
+    'rest_framework_simplejwt.token_blacklist',
     'django_extensions',
 ]
 
@@ -45,9 +46,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'user_role_management.api.middleware.TracingMiddleware',
+    'user_role_management.api.middleware.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'user_role_management.api.middleware.MetricsMiddleware',
+    'user_role_management.api.middleware.QueryCountMiddleware',
+    'user_role_management.api.middleware.SlowQueryMiddleware',
+    'user_role_management.api.middleware.ReplicaRoutingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'user_role_management.api.middleware.StaticFilesMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -86,6 +93,25 @@ DATABASES = {
 
 DATABASES['default']['ATOMIC_REQUESTS'] = True
 
+# Persistent connections, each worker thread keeps its connection for DATABASE_CONN_MAX_AGE
+# seconds (0 connects per request) and checks it is still alive before each request.
+# config.asgi defaults it to 0, ASGI requests don't reuse their threads
+connection_options = {
+    'CONN_MAX_AGE': env.int('DATABASE_CONN_MAX_AGE', default=60),
+    'CONN_HEALTH_CHECKS': env.bool('DATABASE_CONN_HEALTH_CHECKS', default=True),
+    # Behind a transaction pooling PgBouncer a server side cursor doesn't outlive its transaction
+    'DISABLE_SERVER_SIDE_CURSORS': env.bool('DATABASE_POOLER', default=False),
+}
+DATABASES['default'].update(connection_options)
+
+# Read replicas, the safe method requests read from them, see user_role_management.core.routers
+DATABASE_REPLICAS = []
+for index, url in enumerate(env.list('DATABASE_REPLICA_URLS', default=[])):
+    DATABASE_REPLICAS.append(f'replica_{index}')
+    DATABASES[f'replica_{index}'] = {**env.db_url_config(url), **connection_options, 'TEST': {'MIRROR': 'default'}}
+
+DATABASE_ROUTERS = ['user_role_management.core.routers.ReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
@@ -178,5 +204,15 @@ from config.settings.jwt import *  # noqa
 from config.settings.sessions import *  # noqa
 from config.settings.celery import *  # noqa
 from config.settings.swagger import *  # noqa
+from config.settings.guardian import *  # noqa
+from config.settings.query_count import *  # noqa
+from config.settings.metrics import *  # noqa
+from config.settings.profiling import *  # noqa
+from config.settings.tracing import *  # noqa
+from config.settings.slow_query import *  # noqa
+from config.settings.replicas import *  # noqa
+from config.settings.asgi import *  # noqa
+from config.settings.concurrency import *  # noqa
+from config.settings.logging import *  # noqa
 #from config.settings.sentry import *  # noqa
 #from config.settings.email_sending import *  # noqa
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .test import *  # noqa
+from config.env import env
+
+# Benchmarks run on SQLite unless pointed to a database, e.g. a local PostgreSQL container
+DATABASES = {
+    'default': env.db('BENCHMARK_DATABASE_URL', default='sqlite:///db.sqlite3'),
+}
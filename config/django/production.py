@@ -5,6 +5,9 @@ DEBUG = False
 
 SECRET_KEY = env('SECRET_KEY')
 
+# EXPLAIN ANALYZE runs the slow query a second time
+SLOW_QUERY_EXPLAIN_SAMPLE_RATE = 0.0
+
 ALLOWED_HOSTS = env.list('ALLOWED_HOSTS', default=[])
 
 CORS_ALLOW_ALL_ORIGINS = False
@@ -0,0 +1,5 @@
+from config.env import env
+
+# Serve the GETs of the read-heavy APIs with async views, for uvicorn deployments.
+# See user_role_management.api.asynchronous
+ASYNC_READ_APIS = env.bool('ASYNC_READ_APIS', default=False)
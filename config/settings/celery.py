@@ -16,5 +16,9 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'config.tasks.notify_customers',
         'schedule': 500,
         'args': ['Hello World'],
-    }
+    },
+    'prune_expired_tokens': {
+        'task': 'user_role_management.authentication.tasks.prune_expired_tokens',
+        'schedule': 60 * 60,
+    },
 }
\ No newline at end of file
@@ -0,0 +1,6 @@
+from config.env import env
+
+# Threads per process running independent selectors of a request concurrently, e.g. the
+# dashboard sections, each with its own database connection. 0 runs them sequentially.
+# See user_role_management.core.concurrency
+FAN_OUT_MAX_WORKERS = env.int('FAN_OUT_MAX_WORKERS', default=4)
@@ -0,0 +1,9 @@
+from config.env import env
+
+# Bigint keyed object permission models, see user_role_management.guardian.models.BaseIntegerGenericObjectPermission.
+# Copy the existing rows with `manage.py copy_object_permissions_to_integer_keys` before turning it on.
+GUARDIAN_INTEGER_OBJECT_KEYS = env.bool('GUARDIAN_INTEGER_OBJECT_KEYS', default=False)
+
+if GUARDIAN_INTEGER_OBJECT_KEYS:
+    GUARDIAN_USER_OBJ_PERMS_MODEL = 'guardian.IntegerUserObjectPermission'
+    GUARDIAN_GROUP_OBJ_PERMS_MODEL = 'guardian.IntegerGroupObjectPermission'
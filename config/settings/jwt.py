@@ -9,3 +9,17 @@ SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=1000),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
 }
+
+# Embed the action permissions of the user in the access tokens, url_action_perm
+# then authorizes from them while their version is current. See README.md
+JWT_PERMISSION_CLAIMS = env.bool('JWT_PERMISSION_CLAIMS', default=False)
+# Users granted more actions get tokens without claims and are checked in the database
+JWT_PERMISSION_CLAIMS_MAX_ACTIONS = env.int('JWT_PERMISSION_CLAIMS_MAX_ACTIONS', default=2000)
+
+# Seconds the user snapshots CachedJWTAuthentication authenticates from are cached, 0 loads the user per request
+AUTH_USER_SNAPSHOT_TTL = env.int('AUTH_USER_SNAPSHOT_TTL', default=60)
+
+# Tokens a process remembers as blacklisted, the others are checked in the cache
+TOKEN_BLACKLIST_LOCAL_SIZE = env.int('TOKEN_BLACKLIST_LOCAL_SIZE', default=10000)
+# Expired outstanding tokens deleted per statement by prune_expired_tokens
+TOKEN_BLACKLIST_PRUNE_BATCH_SIZE = env.int('TOKEN_BLACKLIST_PRUNE_BATCH_SIZE', default=5000)
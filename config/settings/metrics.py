@@ -0,0 +1,5 @@
+from config.env import env
+
+# See user_role_management.core.metrics, /metrics requires METRICS_TOKEN unless DEBUG is on
+METRICS_ENABLED = env.bool('METRICS_ENABLED', default=True)
+METRICS_TOKEN = env('METRICS_TOKEN', default='')
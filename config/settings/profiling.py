@@ -0,0 +1,8 @@
+from config.env import env
+
+# See user_role_management.api.middleware.ProfilingMiddleware
+PROFILING_ENABLED = env.bool('PROFILING_ENABLED', default=False)
+PROFILING_SAMPLE_RATE = env.float('PROFILING_SAMPLE_RATE', default=0.0)
+PROFILING_TOKEN = env('PROFILING_TOKEN', default='')
+PROFILING_INTERVAL = env.float('PROFILING_INTERVAL', default=0.001)  # Seconds between stack samples
+PROFILING_KEEP = env.int('PROFILING_KEEP', default=500)  # Older profiles are deleted
@@ -0,0 +1,6 @@
+from config.env import env
+
+# See user_role_management.api.middleware.QueryCountMiddleware
+QUERY_COUNT_ENABLED = env.bool('QUERY_COUNT_ENABLED', default=True)
+QUERY_COUNT_WARNING_THRESHOLD = env.int('QUERY_COUNT_WARNING_THRESHOLD', default=30)
+QUERY_COUNT_DUPLICATE_THRESHOLD = env.int('QUERY_COUNT_DUPLICATE_THRESHOLD', default=5)
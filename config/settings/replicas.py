@@ -0,0 +1,5 @@
+from config.env import env
+
+# See user_role_management.api.middleware.ReplicaRoutingMiddleware, DATABASE_REPLICA_URLS in config/django/base.py
+# Seconds a client reads from the primary after a write, longer than the replication lag
+DATABASE_REPLICA_STICKY_SECONDS = env.int('DATABASE_REPLICA_STICKY_SECONDS', default=5)
@@ -0,0 +1,7 @@
+from config.env import env
+
+# See user_role_management.api.middleware.SlowQueryMiddleware
+SLOW_QUERY_ENABLED = env.bool('SLOW_QUERY_ENABLED', default=True)
+SLOW_QUERY_THRESHOLD_MS = env.float('SLOW_QUERY_THRESHOLD_MS', default=100)
+# Share of the slow SELECTs explained, EXPLAIN ANALYZE runs the query again (off in production)
+SLOW_QUERY_EXPLAIN_SAMPLE_RATE = env.float('SLOW_QUERY_EXPLAIN_SAMPLE_RATE', default=0.1)
@@ -0,0 +1,10 @@
+from config.env import env
+
+# See user_role_management.core.tracing, spans are exported by OTLP/HTTP to a
+# collector or appended as JSON lines to TRACING_FILE_PATH
+TRACING_ENABLED = env.bool('TRACING_ENABLED', default=False)
+TRACING_SERVICE_NAME = env('TRACING_SERVICE_NAME', default='user_role_management')
+TRACING_EXPORTER = env('TRACING_EXPORTER', default='otlp')  # otlp or file
+TRACING_OTLP_ENDPOINT = env('TRACING_OTLP_ENDPOINT', default='http://localhost:4318/v1/traces')
+TRACING_FILE_PATH = env('TRACING_FILE_PATH', default='traces.jsonl')
+TRACING_SAMPLE_RATE = env.float('TRACING_SAMPLE_RATE', default=1.0)
@@ -9,6 +9,8 @@ from drf_spectacular.views import (
 )
 from drf_spectacular.settings import spectacular_settings
 
+from user_role_management.core.metrics import metrics_view
+
 
 urlpatterns = [
 
@@ -16,6 +18,11 @@ urlpatterns = [
     path('api/v1/', include(('user_role_management.api.urls', 'api'))),
 ]
 
+if settings.METRICS_ENABLED:
+    urlpatterns += [
+        path('metrics', metrics_view, name='metrics'),
+    ]
+
 if settings.DEBUG:
     spectacular_settings.SWAGGER_UI_SETTINGS = {
         'deepLinking': True,
@@ -10,6 +10,10 @@ python manage.py migrate
 python manage.py collectstatic --clear --noinput
 python manage.py collectstatic --noinput
 
+# Workers share their Prometheus metrics through this directory, it must start empty
+export PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus_multiproc}
+rm -rf "$PROMETHEUS_MULTIPROC_DIR" && mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 # Start server
 echo "--> Starting web process"
 #gunicorn config.wsgi:application -b 0.0.0.0:8000
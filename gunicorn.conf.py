@@ -0,0 +1,6 @@
+from prometheus_client import multiprocess
+
+
+def child_exit(server, worker):
+    # Drop the live metrics of dead workers, see user_role_management.core.metrics
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,82 @@
+"""
+Load test scenarios for the REST API.
+
+Users log in with the JWT endpoints as users of a dataset generated by
+``generate_synthetic_data --manifest``, see README.md:
+
+    LOADTEST_MANIFEST=manifest.json LOADTEST_PASSWORD=secret \
+        locust -f loadtests/locustfile.py --host http://localhost:8000 \
+        --headless -u 200 -r 20 -t 5m --csv loadtests/results/baseline
+
+Locust reports latency percentiles per endpoint name, the csv files of two
+runs can be compared before a deployment.
+"""
+import json
+import os
+import random
+import uuid
+
+from locust import HttpUser, between, events, task
+
+API = '/api/v1'
+
+manifest = {}
+
+
+@events.init.add_listener
+def load_manifest(environment, **kwargs):
+    with open(os.environ.get('LOADTEST_MANIFEST', 'manifest.json')) as manifest_file:
+        manifest.update(json.load(manifest_file))
+
+
+class ApiUser(HttpUser):
+    """
+    A user of one company: mostly reads its employees and permissions, now and
+    then adds an employee or edits the object permissions of a company group.
+    """
+    wait_time = between(0.5, 2)
+
+    def on_start(self):
+        self.company = random.choice(manifest['companies'])
+        self.user = random.choice(self.company['users'])
+        response = self.client.post(f'{API}/auth/jwt/login/', name='auth login',
+                                    json={'email': self.user['email'], 'password': os.environ['LOADTEST_PASSWORD']})
+        response.raise_for_status()
+        self.client.headers['Authorization'] = f"Bearer {response.json()['access']}"
+
+    @task(10)
+    def list_employees(self):
+        self.client.get(f'{API}/manage/employee/', name='employee list',
+                        params={'limit': 50, 'offset': random.choice([0, 0, 0, 50, 100])})
+
+    @task(5)
+    def search_employees(self):
+        self.client.get(f'{API}/manage/employee/', name='employee search',
+                        params={'search': str(random.randrange(len(self.company['users']))), 'limit': 50})
+
+    @task(10)
+    def check_user_permissions(self):
+        self.client.get(f'{API}/manage/user_permissions/', name='user permissions')
+
+    @task(2)
+    def create_employee(self):
+        # Users of other companies, so the employee is new unless picked twice
+        other_company = random.choice(manifest['companies'])
+        with self.client.post(f'{API}/manage/employee/', name='employee create (url_action_perm)', json={
+            'company_id': self.company['company_id'],
+            'user_id': random.choice(other_company['users'])['id'],
+            'personnel_code': uuid.uuid4().hex[:12],
+        }, catch_response=True) as response:
+            # 400 is a duplicate employee, the permission check passed anyway
+            if response.status_code in (200, 400):
+                response.success()
+
+    @task(1)
+    def edit_group_object_permissions(self):
+        action_ids = random.sample(self.company['action_ids'], min(20, len(self.company['action_ids'])))
+        self.client.put(f'{API}/permission/group_object_permission/set/', name='group object permissions set', json={
+            'group_id': random.choice(self.company['company_group_ids']),
+            'content_type_id': manifest['action_content_type_id'],
+            'permissions': {action_id: random.choice([[manifest['action_permission']], []])
+                            for action_id in action_ids},
+        })
@@ -0,0 +1,62 @@
+from typing import Type
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework.views import APIView
+
+from user_role_management.core import tracing
+
+
+def async_api(api_class: Type[APIView]):
+    """
+    Async view serving the GETs of an `ApiAuthMixin` API for ASGI deployments.
+
+    Content negotiation, permission classes and the response finalization run in the
+    event loop. The database and cache work can't, Django 4.0 has no async ORM: the
+    authentication and the GET handler each run in the request's thread by
+    sync_to_async. The `aget` of an API, the async variant of its `get`, is awaited
+    instead, it can then run independent selectors concurrently. The other methods
+    are served by the sync API.
+    """
+    sync_view = sync_to_async(api_class.as_view())
+
+    async def view(request, *args, **kwargs):
+        if request.method != 'GET':
+            return await sync_view(request, *args, **kwargs)
+
+        api = api_class()
+        api.args, api.kwargs = args, kwargs
+        drf_request = api.initialize_request(request, *args, **kwargs)
+        api.request = drf_request
+        api.headers = api.default_response_headers
+        with tracing.span(f"{api_class.__name__}.get"):
+            try:
+                # Authenticates, `initial` then reads the user it set
+                await sync_to_async(lambda: drf_request.user)()
+                api.initial(drf_request, *args, **kwargs)
+                if hasattr(api, 'aget'):
+                    response = await api.aget(drf_request, *args, **kwargs)
+                else:
+                    response = await sync_to_async(api.get)(drf_request, *args, **kwargs)
+            except Exception as exc:
+                response = api.handle_exception(exc)
+            # Rendered by the handler, in a thread
+            return api.finalize_response(drf_request, response, *args, **kwargs)
+
+    # Introspected like the DRF views by the metrics and the OpenAPI schema
+    view.view_class = view.cls = api_class
+    view.initkwargs = {}
+    # Like the DRF views, which leave CSRF to SessionAuthentication
+    view.csrf_exempt = True
+    # The GETs run in autocommit, the sync API opens the transaction of its writes
+    view._non_atomic_requests = set(settings.DATABASES)
+    return view
+
+
+def read_api(api_class: Type[APIView]):
+    """
+    The view of a read-heavy API for the URLconf, `async_api` with ASYNC_READ_APIS.
+    """
+    if settings.ASYNC_READ_APIS:
+        return async_api(api_class)
+    return api_class.as_view()
@@ -0,0 +1,497 @@
+import asyncio
+import hashlib
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db.models.sql.compiler import SQLCompiler
+from django.http import HttpRequest, HttpResponse
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from user_role_management.common.models import Request_profile
+from user_role_management.common.profiling import StackSampler, to_speedscope
+from user_role_management.core import metrics, tracing
+from user_role_management.core.connections import query_wrapper
+from user_role_management.core.routers import replica_reads
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger('user_role_management.slow_queries')
+
+
+def get_query_fingerprint(sql: str) -> str:
+    """
+    Queries are executed with their parameters apart, so the SQL text is the
+    same for every `WHERE id = %s` lookup of an N+1 loop.
+    """
+    return hashlib.sha1(" ".join(sql.split()).encode()).hexdigest()[:10]
+
+
+class QueryCollector:
+    """
+    Database execute wrapper recording every query run while it is installed.
+    """
+
+    def __init__(self):
+        self.queries: List[Dict] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({
+                'sql': sql,
+                'alias': context['connection'].alias,
+                'start': start,
+                'duration': time.perf_counter() - start,
+            })
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def duration(self) -> float:
+        return sum(query['duration'] for query in self.queries)
+
+    def get_duplicates(self, min_count: int = 2) -> Dict[str, Dict]:
+        """
+        Returns `{fingerprint: {'count': n, 'sql': sql}}` for every query run
+        at least `min_count` times, the most repeated first.
+        """
+        counts = Counter(get_query_fingerprint(query['sql']) for query in self.queries)
+        sql_by_fingerprint = {get_query_fingerprint(query['sql']): query['sql'] for query in self.queries}
+        return {fingerprint: {'count': count, 'sql': sql_by_fingerprint[fingerprint]}
+                for fingerprint, count in counts.most_common() if count >= min_count}
+
+
+@contextmanager
+def collect_queries():
+    with query_wrapper(QueryCollector()) as collector:
+        yield collector
+
+
+class AsyncCapableMiddleware:
+    """
+    Base of the middlewares wrapping the rest of the chain, run by `__call__` under
+    WSGI and awaited as `__acall__` under ASGI. Django runs the chain below a sync
+    only middleware in a thread, which the async views of `api.asynchronous` would
+    then hold for the whole request.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self._async_check()
+
+    def _async_check(self):
+        # Like Django's MiddlewareMixin, the handler awaits the instances marked as coroutines
+        if asyncio.iscoroutinefunction(self.get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+        else:
+            self._is_coroutine = None
+
+
+def get_view_name(request: HttpRequest) -> str:
+    resolver_match = getattr(request, 'resolver_match', None)
+    if resolver_match is None:
+        return request.path
+    view = getattr(resolver_match.func, 'view_class', resolver_match.func)
+    return view.__name__
+
+
+class QueryCountMiddleware(AsyncCapableMiddleware):
+    """
+    Records query count, total DB time and repeated queries per request.
+
+    The numbers are kept on `request.query_stats`, sent back as `X-DB-*`
+    headers when DEBUG is on and logged when a request goes over
+    QUERY_COUNT_WARNING_THRESHOLD queries or repeats a query
+    QUERY_COUNT_DUPLICATE_THRESHOLD times.
+    """
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self._is_coroutine:
+            return self.__acall__(request)
+        if not settings.QUERY_COUNT_ENABLED:
+            return self.get_response(request)
+
+        with collect_queries() as collector:
+            response = self.get_response(request)
+        return self.record(request, response, collector)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.QUERY_COUNT_ENABLED:
+            return await self.get_response(request)
+
+        with collect_queries() as collector:
+            response = await self.get_response(request)
+        return self.record(request, response, collector)
+
+    def record(self, request: HttpRequest, response: HttpResponse, collector: QueryCollector) -> HttpResponse:
+        duplicates = collector.get_duplicates(min_count=settings.QUERY_COUNT_DUPLICATE_THRESHOLD)
+        request.query_stats = {
+            'view': get_view_name(request),
+            'count': collector.count,
+            'duration': collector.duration,
+            'duplicates': {fingerprint: duplicate['count'] for fingerprint, duplicate in duplicates.items()},
+        }
+
+        if settings.DEBUG:
+            response['X-DB-Query-Count'] = str(collector.count)
+            response['X-DB-Time-Ms'] = f"{collector.duration * 1000:.2f}"
+            response['X-DB-Duplicate-Queries'] = ",".join(
+                f"{fingerprint}={duplicate['count']}" for fingerprint, duplicate in duplicates.items())
+
+        if collector.count > settings.QUERY_COUNT_WARNING_THRESHOLD or duplicates:
+            logger.warning(
+                "%s %s ran %s queries in %.2fms",
+                request.method, request.query_stats['view'], collector.count, collector.duration * 1000,
+                extra={'query_stats': request.query_stats,
+                       'duplicate_sql': {fingerprint: duplicate['sql']
+                                         for fingerprint, duplicate in duplicates.items()}},
+            )
+
+        return response
+
+
+_ORIGIN_MODULE = re.compile(r'^user_role_management\.\w+\.(selectors|services)(\.|$)'
+                            r'|^user_role_management\.guardian\.shortcuts$')
+
+
+def get_query_origin(frame) -> Optional[str]:
+    """
+    The selector or service a query comes from: the `query.origin` tag of
+    `core.instrumentation` on the compiled queryset, else the innermost
+    selector/service function on the stack.
+    """
+    caller = None
+    while frame is not None:
+        if frame.f_code.co_name == 'execute_sql':
+            compiler = frame.f_locals.get('self')
+            if isinstance(compiler, SQLCompiler) and getattr(compiler.query, 'origin', None):
+                return compiler.query.origin
+        module = frame.f_globals.get('__name__', '')
+        if caller is None and _ORIGIN_MODULE.match(module):
+            caller = f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return caller
+
+
+class SlowQueryLogger:
+    """
+    Database execute wrapper logging, as JSON, the queries slower than
+    SLOW_QUERY_THRESHOLD_MS with the selector or service they come from. A
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE share of the slow SELECTs is explained,
+    `EXPLAIN (ANALYZE, BUFFERS)` on PostgreSQL and `EXPLAIN QUERY PLAN` on SQLite.
+    """
+
+    def __init__(self, threshold: float, explain_sample_rate: float):
+        self.threshold = threshold
+        self.explain_sample_rate = explain_sample_rate
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        result = execute(sql, params, many, context)
+        duration = time.perf_counter() - start
+        if duration * 1000 >= self.threshold:
+            self.log(sql, params, many, context['connection'], duration)
+        return result
+
+    def log(self, sql, params, many, connection, duration: float):
+        slow_query = {
+            'sql': sql,
+            'alias': connection.alias,
+            'duration_ms': round(duration * 1000, 3),
+            'threshold_ms': self.threshold,
+            'origin': get_query_origin(sys._getframe(2)),
+        }
+        if not many and sql.lstrip()[:6].upper() == 'SELECT' and random.random() < self.explain_sample_rate:
+            slow_query['explain'] = self.explain(sql, params, connection)
+        slow_query_logger.warning("Slow query %.2fms in %s", slow_query['duration_ms'], slow_query['origin'],
+                                  extra={'slow_query': slow_query})
+
+    @staticmethod
+    def explain(sql, params, connection):
+        if connection.vendor == 'postgresql':
+            explain_sql = f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"
+        elif connection.vendor == 'sqlite':
+            explain_sql = f"EXPLAIN QUERY PLAN {sql}"
+        else:
+            return None
+
+        # The backend's own cursor does not go through the execute wrappers, the
+        # savepoint keeps a failed EXPLAIN from breaking the request's transaction
+        cursor = connection.create_cursor()
+        try:
+            if connection.in_atomic_block:
+                cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute(explain_sql, params)
+                plan = [row[0] if len(row) == 1 else list(row) for row in cursor.fetchall()]
+            except Exception as exc:
+                if connection.in_atomic_block:
+                    cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                return {'error': str(exc)}
+            if connection.in_atomic_block:
+                cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        finally:
+            cursor.close()
+
+
+class SlowQueryMiddleware(AsyncCapableMiddleware):
+    """
+    Installs a SlowQueryLogger on every database for the request (SLOW_QUERY_ENABLED).
+    """
+
+    def __init__(self, get_response):
+        if not settings.SLOW_QUERY_ENABLED:
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    @staticmethod
+    def get_query_logger() -> SlowQueryLogger:
+        return SlowQueryLogger(threshold=settings.SLOW_QUERY_THRESHOLD_MS,
+                               explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self._is_coroutine:
+            return self.__acall__(request)
+        with query_wrapper(self.get_query_logger()):
+            return self.get_response(request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with query_wrapper(self.get_query_logger()):
+            return await self.get_response(request)
+
+
+class ReplicaRoutingMiddleware(AsyncCapableMiddleware):
+    """
+    Lets the safe method requests read from DATABASE_REPLICAS, unless the client
+    wrote in the last DATABASE_REPLICA_STICKY_SECONDS. Writes mark the client with
+    a cookie and, when it sends an access token, a cache marker of its user, so it
+    reads its own writes from the primary until the replicas caught up.
+
+    Removed from the middleware chain when there are no replicas.
+    """
+
+    STICKY_PRIMARY_COOKIE = 'sticky_primary'
+    STICKY_PRIMARY_KEY = 'sticky_primary:{user_id}'
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    @staticmethod
+    def get_user_id(request: HttpRequest) -> Optional[int]:
+        # Only picks the database, the view authenticates the token
+        header = request.headers.get('Authorization', '').split()
+        if len(header) != 2:
+            return None
+        try:
+            return AccessToken(header[1], verify=False).get(api_settings.USER_ID_CLAIM)
+        except TokenError:
+            return None
+
+    def is_sticky(self, request: HttpRequest) -> bool:
+        if self.STICKY_PRIMARY_COOKIE in request.COOKIES:
+            return True
+        user_id = self.get_user_id(request)
+        return user_id is not None and cache.get(self.STICKY_PRIMARY_KEY.format(user_id=user_id)) is not None
+
+    def make_sticky(self, request: HttpRequest, response: HttpResponse) -> None:
+        sticky_seconds = settings.DATABASE_REPLICA_STICKY_SECONDS
+        response.set_cookie(self.STICKY_PRIMARY_COOKIE, '1', max_age=sticky_seconds, httponly=True, samesite='Lax')
+        user_id = self.get_user_id(request)
+        if user_id is not None:
+            cache.set(self.STICKY_PRIMARY_KEY.format(user_id=user_id), True, timeout=sticky_seconds)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self._is_coroutine:
+            return self.__acall__(request)
+        if request.method in SAFE_METHODS:
+            with replica_reads(not self.is_sticky(request)):
+                return self.get_response(request)
+
+        response = self.get_response(request)
+        self.make_sticky(request, response)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if request.method in SAFE_METHODS:
+            with replica_reads(not await sync_to_async(self.is_sticky)(request)):
+                return await self.get_response(request)
+
+        response = await self.get_response(request)
+        await sync_to_async(self.make_sticky)(request, response)
+        return response
+
+
+class MetricsMiddleware(AsyncCapableMiddleware):
+    """
+    Observes the latency, query count and DB time of each request per view in
+    the Prometheus metrics of `core.metrics`. Goes before QueryCountMiddleware
+    whose `request.query_stats` it reads.
+    """
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self._is_coroutine:
+            return self.__acall__(request)
+        if not settings.METRICS_ENABLED:
+            return self.get_response(request)
+
+        start = time.perf_counter()
+        response = self.get_response(request)
+        return self.observe(request, response, time.perf_counter() - start)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.METRICS_ENABLED:
+            return await self.get_response(request)
+
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        return self.observe(request, response, time.perf_counter() - start)
+
+    @staticmethod
+    def observe(request: HttpRequest, response: HttpResponse, duration: float) -> HttpResponse:
+        # Unresolved paths are not used as label, they are unbounded
+        view = get_view_name(request) if getattr(request, 'resolver_match', None) else 'unresolved'
+        metrics.REQUEST_LATENCY.labels(view=view, method=request.method, status=response.status_code).observe(duration)
+        query_stats = getattr(request, 'query_stats', None)
+        if query_stats:
+            metrics.REQUEST_QUERIES.labels(view=view).observe(query_stats['count'])
+            metrics.REQUEST_DB_DURATION.labels(view=view).observe(query_stats['duration'])
+
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Opt-in (PROFILING_ENABLED) sampling profiler. Profiles a PROFILING_SAMPLE_RATE
+    share of the requests and those sent with `X-Profile: <PROFILING_TOKEN>`,
+    storing their stack samples and SQL timeline as a `Request_profile`.
+
+    Removed from the middleware chain when disabled, so it costs nothing then.
+    Sync only, it samples the stack of the thread running the request: under ASGI
+    the profiled requests then hold a thread.
+    """
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def should_profile(self, request: HttpRequest) -> bool:
+        if settings.PROFILING_TOKEN and request.headers.get('X-Profile') == settings.PROFILING_TOKEN:
+            return True
+        return random.random() < settings.PROFILING_SAMPLE_RATE
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        with StackSampler(threading.get_ident(), interval=settings.PROFILING_INTERVAL) as sampler, \
+                collect_queries() as collector:
+            response = self.get_response(request)
+
+        name = f"{request.method} {request.path}"
+        profile = Request_profile.objects.create(
+            method=request.method,
+            path=request.path[:2048],
+            view=get_view_name(request)[:255],
+            status_code=response.status_code,
+            duration=sampler.ended_at - sampler.started_at,
+            query_count=collector.count,
+            sql_timeline=[{'sql': query['sql'], 'alias': query['alias'],
+                           'start_ms': round((query['start'] - sampler.started_at) * 1000, 3),
+                           'duration_ms': round(query['duration'] * 1000, 3)} for query in collector.queries],
+            speedscope=to_speedscope(name=name, weighted_stacks=sampler.get_weighted_stacks()),
+        )
+        Request_profile.objects.filter(
+            id__in=Request_profile.objects.order_by('-id').values('id')[settings.PROFILING_KEEP:]).delete()
+
+        response['X-Profile-Id'] = str(profile.id)
+        return response
+
+
+class TracingMiddleware(AsyncCapableMiddleware):
+    """
+    Opt-in (TRACING_ENABLED) OpenTelemetry tracing. Runs each request in a
+    server span, continuing the trace of an incoming `traceparent` header, with
+    a child span per DB query. The API methods, selectors, services and
+    `url_action_perm` checks open their own spans, see `core.tracing`.
+    """
+
+    def __init__(self, get_response):
+        if not settings.TRACING_ENABLED:
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    @staticmethod
+    def server_span(request: HttpRequest):
+        return tracing.server_span(f"{request.method} {request.path}", request.headers, **{
+            'http.method': request.method,
+            'http.target': request.path,
+        })
+
+    @staticmethod
+    def end(request: HttpRequest, response: HttpResponse, span) -> None:
+        # Named after the view once resolved, paths have ids in them
+        if getattr(request, 'resolver_match', None):
+            span.update_name(f"{request.method} {get_view_name(request)}")
+        span.set_attribute('http.status_code', response.status_code)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self._is_coroutine:
+            return self.__acall__(request)
+        with self.server_span(request) as span, query_wrapper(tracing.trace_query):
+            response = self.get_response(request)
+            self.end(request, response, span)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with self.server_span(request) as span, query_wrapper(tracing.trace_query):
+            response = await self.get_response(request)
+            self.end(request, response, span)
+        return response
+
+
+class StaticFilesMiddleware(AsyncCapableMiddleware, WhiteNoiseMiddleware):
+    """
+    WhiteNoiseMiddleware, which is sync only, made async capable. Static files are
+    served in a thread, the other requests go down the chain in the event loop.
+    """
+
+    def __init__(self, get_response):
+        WhiteNoiseMiddleware.__init__(self, get_response)
+        self._async_check()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if self._is_coroutine:
+            return self.__acall__(request)
+        return WhiteNoiseMiddleware.__call__(self, request)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        # Looked up on the disk only with autorefresh, in DEBUG
+        if self.autorefresh or request.path_info in self.files:
+            response = await sync_to_async(self.process_request, thread_sensitive=False)(request)
+            if response is not None:
+                return response
+        return await self.get_response(request)
@@ -1,3 +1,4 @@
+from contextlib import ExitStack
 from typing import Sequence, Type, TYPE_CHECKING
 
 from importlib import import_module
@@ -6,10 +7,14 @@ from django.conf import settings
 
 from django.contrib import auth
 
-from rest_framework.permissions import IsAuthenticated, BasePermission
+from django.db import connections, transaction
+
+from rest_framework.permissions import IsAuthenticated, BasePermission, SAFE_METHODS
 from rest_framework.authentication import BaseAuthentication
 
-from rest_framework_simplejwt.authentication import JWTAuthentication 
+from user_role_management.authentication.backends import CachedJWTAuthentication
+
+from user_role_management.core import tracing
 
 
 def get_auth_header(headers):
@@ -33,8 +38,36 @@ else:
     PermissionClassesType = Sequence[Type[BasePermission]]
 
 
-class ApiAuthMixin:
+class SafeMethodsAutocommitMixin:
+    """
+    Runs the safe method handlers in autocommit instead of the ATOMIC_REQUESTS
+    transaction, so read-only requests hold no transaction open. The other methods
+    still run in one per database, rolled back on errors.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Django would wrap every method, dispatch wraps the unsafe ones
+        view._non_atomic_requests = set(settings.DATABASES)
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+        with ExitStack() as stack:
+            for alias, settings_dict in connections.settings.items():
+                if settings_dict['ATOMIC_REQUESTS']:
+                    stack.enter_context(transaction.atomic(using=alias))
+            return super().dispatch(request, *args, **kwargs)
+
+
+class ApiAuthMixin(SafeMethodsAutocommitMixin):
     authentication_classes: Sequence[Type[BaseAuthentication]] = [
-            JWTAuthentication,
+            CachedJWTAuthentication,
     ]
     permission_classes: PermissionClassesType = (IsAuthenticated, )
+
+    def dispatch(self, request, *args, **kwargs):
+        with tracing.span(f"{type(self).__name__}.{request.method.lower()}"):
+            return super().dispatch(request, *args, **kwargs)
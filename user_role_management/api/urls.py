@@ -4,4 +4,5 @@ urlpatterns = [
     path('auth/', include(('user_role_management.authentication.urls', 'auth'))),
     path('manage/', include(('user_role_management.manage.urls', 'manage'))),
     path('permission/', include(('user_role_management.guardian.urls', 'permission'))),
+    path('profiling/', include(('user_role_management.common.urls', 'profiling'))),
 ]
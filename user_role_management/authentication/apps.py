@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AuthenticationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'user_role_management.authentication'
+
+    def ready(self):
+        from user_role_management.authentication import signals  # noqa: F401
@@ -0,0 +1,86 @@
+import time
+from typing import Dict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+BLACKLISTED_TOKEN_KEY = 'blacklisted_token:{jti}'
+
+# jti -> exp of the tokens this process found blacklisted, repeated uses of a revoked
+# token are rejected without asking the cache. Exact, a false positive would log users out
+_local_blacklist: Dict[str, float] = {}
+
+
+def _remember(jti: str, exp: float) -> None:
+    if len(_local_blacklist) >= settings.TOKEN_BLACKLIST_LOCAL_SIZE:
+        now = time.time()
+        for expired in [jti for jti, expires in _local_blacklist.items() if expires <= now]:
+            del _local_blacklist[expired]
+        if len(_local_blacklist) >= settings.TOKEN_BLACKLIST_LOCAL_SIZE:
+            del _local_blacklist[next(iter(_local_blacklist))]
+    _local_blacklist[jti] = exp
+
+
+def cache_blacklisted_token(jti: str, exp: float) -> None:
+    timeout = int(exp - time.time()) + 1
+    if timeout > 0:
+        cache.set(BLACKLISTED_TOKEN_KEY.format(jti=jti), exp, timeout=timeout)
+
+
+def is_blacklisted(jti: str, exp: float) -> bool:
+    """
+    Looks the token up in the cache, which holds the blacklisted tokens and the ones
+    found in no blacklist. Tokens it does not know (never checked, or evicted, or the
+    cache was flushed) are looked up in the database and cached until they expire.
+    """
+    if jti in _local_blacklist:
+        return True
+    key = BLACKLISTED_TOKEN_KEY.format(jti=jti)
+    cached = cache.get(key)
+    if cached is None:
+        if not BlacklistedToken.objects.filter(token__jti=jti).exists():
+            timeout = int(exp - time.time()) + 1
+            if timeout > 0:
+                # add, not to overwrite the entry of a token blacklisted meanwhile
+                cache.add(key, False, timeout=timeout)
+            return False
+        cache_blacklisted_token(jti, exp)
+        cached = exp
+    if cached is False:
+        return False
+    _remember(jti, cached)
+    return True
+
+
+def prune_expired_tokens(*, batch_size: int) -> int:
+    """
+    Deletes the expired outstanding tokens, with their blacklist entries, in batches
+    of the oldest ids so no statement locks the whole table. Returns the number of
+    outstanding tokens deleted.
+    """
+    now, pruned = aware_utcnow(), 0
+    while True:
+        ids = list(OutstandingToken.objects.filter(expires_at__lte=now).order_by('id')
+                   .values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return pruned
+        OutstandingToken.objects.filter(id__in=ids).delete()
+        pruned += len(ids)
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """
+    A `RefreshToken` checked against the cached blacklist instead of the
+    `BlacklistedToken` table. Blacklisting still records it in the database, which
+    stays the source the cache is filled from, token by token.
+    """
+
+    def check_blacklist(self):
+        if is_blacklisted(self.payload[api_settings.JTI_CLAIM], self.payload['exp']):
+            raise TokenError(_('Token is blacklisted'))
@@ -0,0 +1,131 @@
+import base64
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from user_role_management.guardian.models import ActionGroupObjectPermission
+from user_role_management.manage.models import Action, Process
+
+PERMISSION_VERSION_KEY = 'permission_version:{company_id}'
+ACTION_IDS_KEY = 'action_ids:{company_id}:{version}:{process_name}:{action_name}'
+
+
+def get_permission_version(company_id: int) -> str:
+    """
+    Version of the action permissions of a company, embedded in the access tokens.
+    A missing key gets a new random version, so bumping is deleting the key and
+    an evicted key can never bring an old version back.
+    """
+    key = PERMISSION_VERSION_KEY.format(company_id=company_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex[:8], timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_permission_versions(company_ids: Iterable[int]) -> None:
+    """
+    Bumps now and again on commit: a token minted or an action ids entry cached in
+    between reads the grants still committed under the version created meanwhile.
+    """
+    keys = [PERMISSION_VERSION_KEY.format(company_id=company_id) for company_id in set(company_ids)]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def encode_ids(ids: Iterable[int]) -> str:
+    """
+    Sorted ids as base64 of the varint encoded gaps between them, a few bytes per id.
+    """
+    encoded, previous = bytearray(), 0
+    for id in sorted(set(ids)):
+        gap, previous = id - previous, id
+        while gap >= 0x80:
+            encoded.append(gap & 0x7f | 0x80)
+            gap >>= 7
+        encoded.append(gap)
+    return base64.urlsafe_b64encode(bytes(encoded)).decode().rstrip('=')
+
+
+def decode_ids(encoded: str) -> Set[int]:
+    ids, previous, gap, shift = set(), 0, 0, 0
+    for byte in base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)):
+        gap |= (byte & 0x7f) << shift
+        shift += 7
+        if not byte & 0x80:
+            previous += gap
+            ids.add(previous)
+            gap = shift = 0
+    return ids
+
+
+def get_permission_claims(user) -> Dict[str, Any]:
+    """
+    `cid`, `pv` and `perms` claims: the action ids the user's groups are granted in
+    `last_company_logged_in` per permission codename. Empty when the user has no
+    company or more than JWT_PERMISSION_CLAIMS_MAX_ACTIONS grants.
+    """
+    company_id = user.last_company_logged_in_id
+    if not company_id:
+        return {}
+    # Read before the grants, a change in between leaves the token stale rather than wrong
+    version = get_permission_version(company_id)
+    grants = list(ActionGroupObjectPermission.objects.filter(
+        group__in=user.company_groups.all(), content_object__process__company_id=company_id,
+    ).values_list('permission__codename', 'content_object_id')
+        .distinct()[:settings.JWT_PERMISSION_CLAIMS_MAX_ACTIONS + 1])
+    if len(grants) > settings.JWT_PERMISSION_CLAIMS_MAX_ACTIONS:
+        return {}
+
+    action_ids = {}
+    for codename, action_id in grants:
+        action_ids.setdefault(codename, []).append(action_id)
+    return {
+        'cid': company_id,
+        'pv': version,
+        'perms': {codename: encode_ids(ids) for codename, ids in action_ids.items()},
+    }
+
+
+def get_action_ids(*, company_id: int, version: str, process_name: str, action_name: str) -> Optional[List[int]]:
+    """
+    Ids of the actions url_action_perm checks, cached until the permission version
+    changes. None when the company has no such process.
+    """
+    key = ACTION_IDS_KEY.format(company_id=company_id, version=version, process_name=process_name,
+                                action_name=action_name)
+    action_ids = cache.get(key)
+    if action_ids is None:
+        process = Process.objects.filter(name=process_name, company_id=company_id).last()
+        if not process:
+            return None
+        action_ids = list(Action.objects.filter(process_id=process.id, code_name=action_name)
+                          .values_list('id', flat=True))
+        cache.set(key, action_ids)
+    return action_ids
+
+
+def has_action_perm_from_claims(*, token, user, process_name: str, action_name: str,
+                                permission_codename: str) -> Optional[bool]:
+    """
+    Checks a url_action_perm against the claims of the access token, None when they
+    can't tell: no claims, another company or a stale permission version.
+    """
+    if token is None or 'pv' not in token:
+        return None
+    company_id = user.last_company_logged_in_id
+    if not company_id or token['cid'] != company_id:
+        return None
+    version = get_permission_version(company_id)
+    if token['pv'] != version:
+        return None
+    action_ids = get_action_ids(company_id=company_id, version=version, process_name=process_name,
+                                action_name=action_name)
+    if action_ids is None:
+        return None
+    granted = decode_ids(token['perms'].get(permission_codename, ''))
+    return not granted.isdisjoint(action_ids)
@@ -0,0 +1,65 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from user_role_management.authentication.blacklist import cache_blacklisted_token
+from user_role_management.authentication.claims import bump_permission_versions
+from user_role_management.authentication.snapshots import bump_user_versions
+from user_role_management.guardian.models import ActionGroupObjectPermission
+from user_role_management.guardian.signals import object_permissions_bulk_created
+from user_role_management.manage.models import Action, BaseUser, Company_group, Process
+
+
+# The permission claims of the access tokens go stale whenever the action grants,
+# the actions they name or the memberships of the company groups change, the user
+# snapshots whenever the user or its memberships change. Blacklisted tokens are
+# cached however they were blacklisted: logout, rotation or the admin
+
+
+@receiver([post_save, post_delete], sender=ActionGroupObjectPermission)
+def action_permission_changed(sender, instance, **kwargs):
+    bump_permission_versions(Company_group.objects.filter(pk=instance.group_id).values_list('company_id', flat=True))
+
+
+@receiver(object_permissions_bulk_created, sender=ActionGroupObjectPermission)
+def action_permissions_bulk_created(sender, users_or_groups, **kwargs):
+    bump_permission_versions(group.company_id for group in users_or_groups)
+
+
+@receiver([post_save, post_delete], sender=Process)
+def process_changed(sender, instance, **kwargs):
+    bump_permission_versions([instance.company_id])
+
+
+@receiver([post_save, post_delete], sender=Action)
+def action_changed(sender, instance, **kwargs):
+    bump_permission_versions(Process.objects.filter(pk=instance.process_id).values_list('company_id', flat=True))
+
+
+@receiver([post_save, post_delete], sender=BaseUser)
+def user_changed(sender, instance, **kwargs):
+    bump_user_versions([instance.pk])
+
+
+@receiver(m2m_changed, sender=BaseUser.company_groups.through)
+def company_group_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and reverse:
+        # The members are gone by post_clear
+        instance._cleared_member_ids = list(instance.base_user_set.values_list('id', flat=True))
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        bump_permission_versions([instance.company_id])
+        bump_user_versions(pk_set if pk_set is not None else instance.__dict__.pop('_cleared_member_ids', []))
+        return
+    bump_user_versions([instance.pk])
+    if pk_set:
+        bump_permission_versions(Company_group.objects.filter(pk__in=pk_set).values_list('company_id', flat=True))
+    elif instance.last_company_logged_in_id:
+        bump_permission_versions([instance.last_company_logged_in_id])
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def token_blacklisted(sender, instance, created, **kwargs):
+    if created:
+        cache_blacklisted_token(instance.token.jti, instance.token.expires_at.timestamp())
@@ -0,0 +1,74 @@
+import uuid
+from typing import Any, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from user_role_management.manage.models import BaseUser, Company, Company_group
+
+USER_VERSION_KEY = 'user_version:{user_id}'
+USER_SNAPSHOT_KEY = 'user_snapshot:{user_id}:{version}'
+SNAPSHOT_FIELDS = ['id', 'email', 'is_active', 'is_staff', 'is_superuser', 'is_admin', 'type',
+                   'last_company_logged_in_id']
+
+
+def get_user_version(user_id: int) -> str:
+    """
+    Per user version of the cached snapshots, see `get_permission_version` in claims.py.
+    """
+    key = USER_VERSION_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex[:8], timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_user_versions(user_ids: Iterable[int]) -> None:
+    """
+    Bumps now and again on commit, as `bump_permission_versions` in claims.py: a
+    snapshot cached in between holds the committed user under the version created meanwhile.
+    """
+    keys = [USER_VERSION_KEY.format(user_id=user_id) for user_id in set(user_ids)]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def get_user_snapshot(user_id: int) -> Optional[Dict[str, Any]]:
+    """
+    The fields of the user requests need, with the ids of its company groups, cached
+    for AUTH_USER_SNAPSHOT_TTL seconds. None when there is no such user.
+    """
+    # Read before the user, a change in between bumps it and the snapshot is never read again
+    key = USER_SNAPSHOT_KEY.format(user_id=user_id, version=get_user_version(user_id))
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = BaseUser.objects.filter(id=user_id).values(*SNAPSHOT_FIELDS).first()
+        if snapshot is None:
+            return None
+        snapshot['company_group_ids'] = list(Company_group.objects.filter(base_user=user_id)
+                                             .values_list('id', flat=True))
+        cache.set(key, snapshot, timeout=settings.AUTH_USER_SNAPSHOT_TTL)
+    return snapshot
+
+
+def user_from_snapshot(snapshot: Dict[str, Any]) -> BaseUser:
+    """
+    A `BaseUser` with the snapshot fields loaded and the others deferred, they are
+    loaded on access. `last_company_logged_in` and `company_groups.all()` are served
+    from deferred instances carrying only their ids.
+    """
+    # from_db takes the loaded values in the order of the model fields
+    field_names = [field.attname for field in BaseUser._meta.concrete_fields if field.attname in SNAPSHOT_FIELDS]
+    user = BaseUser.from_db(DEFAULT_DB_ALIAS, field_names, [snapshot[field_name] for field_name in field_names])
+    if snapshot['last_company_logged_in_id']:
+        BaseUser.last_company_logged_in.field.set_cached_value(
+            user, Company.from_db(DEFAULT_DB_ALIAS, ['id'], [snapshot['last_company_logged_in_id']]))
+
+    company_groups = Company_group.objects.filter(id__in=snapshot['company_group_ids'])
+    company_groups._result_cache = [Company_group.from_db(DEFAULT_DB_ALIAS, ['id'], [company_group_id])
+                                    for company_group_id in snapshot['company_group_ids']]
+    company_groups._prefetch_done = True
+    user._prefetched_objects_cache = {BaseUser.company_groups.field.name: company_groups}
+    return user
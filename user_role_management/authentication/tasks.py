@@ -0,0 +1,9 @@
+from celery import shared_task
+from django.conf import settings
+
+from user_role_management.authentication import blacklist
+
+
+@shared_task
+def prune_expired_tokens() -> int:
+    return blacklist.prune_expired_tokens(batch_size=settings.TOKEN_BLACKLIST_PRUNE_BATCH_SIZE)
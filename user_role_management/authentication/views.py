@@ -1,21 +1,55 @@
+from django.conf import settings
 from django.http import HttpRequest
 from django.contrib.auth import logout
 from rest_framework import serializers
 from rest_framework.views import APIView, status
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from user_role_management.manage.models import BaseUser
+from user_role_management.authentication.blacklist import CachedBlacklistRefreshToken
+from user_role_management.authentication.claims import get_permission_claims
 from user_role_management.core.exceptions import success_response, error_response
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView, TokenVerifyView, TokenBlacklistView
+from rest_framework_simplejwt.serializers import TokenBlacklistSerializer, TokenObtainPairSerializer, \
+    TokenRefreshSerializer
+
+
+def add_permission_claims(access: str, user: BaseUser) -> str:
+    token = AccessToken(access)
+    token.payload.update(get_permission_claims(user))
+    return str(token)
 
 @extend_schema(tags=['Authentication'])
 class CustomTokenObtainPairView(TokenObtainPairView):
-    pass
+
+    class PermissionClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+        def validate(self, attrs):
+            data = super().validate(attrs)
+            if settings.JWT_PERMISSION_CLAIMS:
+                data['access'] = add_permission_claims(data['access'], self.user)
+            return data
+
+    serializer_class = PermissionClaimsTokenObtainPairSerializer
 
 
 @extend_schema(tags=['Authentication'])
 class CustomTokenRefreshView(TokenRefreshView):
-    pass
+
+    class PermissionClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+        token_class = CachedBlacklistRefreshToken
+
+        def validate(self, attrs):
+            data = super().validate(attrs)
+            if settings.JWT_PERMISSION_CLAIMS:
+                # Claims are only in the access tokens, a refreshed one gets current permissions
+                user_id = AccessToken(data['access'])[api_settings.USER_ID_CLAIM]
+                user = BaseUser.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+                data['access'] = add_permission_claims(data['access'], user)
+            return data
+
+    serializer_class = PermissionClaimsTokenRefreshSerializer
 
 
 @extend_schema(tags=['Authentication'])
@@ -24,7 +58,11 @@ class CustomTokenVerifyView(TokenVerifyView):
 
 @extend_schema(tags=['Authentication'])
 class CustomTokenBlacklistView(TokenBlacklistView):
-    pass
+
+    class CachedTokenBlacklistSerializer(TokenBlacklistSerializer):
+        token_class = CachedBlacklistRefreshToken
+
+    serializer_class = CachedTokenBlacklistSerializer
 
 
 class LogoutApi(APIView):
@@ -42,7 +80,7 @@ class LogoutApi(APIView):
             return Response(error_response(message='Refresh token is required'), status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            RefreshToken(refresh_token).blacklist()
+            CachedBlacklistRefreshToken(refresh_token).blacklist()
             return Response(success_response(), status=status.HTTP_200_OK)
         except Exception as ex:
             return Response(error_response(message=str(ex)), status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,113 @@
+"""
+Benchmarks of the list endpoints per request with and without persistent
+connections, run them explicitly against PostgreSQL, on SQLite connecting is
+nearly free:
+
+    pytest user_role_management/benchmarks/bench_connections.py --nomigrations --ds=config.django.benchmark
+
+See README.md for BENCHMARK_DATABASE_URL.
+"""
+import asyncio
+
+import pytest
+from django.core.handlers.asgi import ASGIHandler
+from django.db import close_old_connections, connection
+from django.db.backends.signals import connection_created
+from django.test import Client
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from user_role_management.benchmarks.tenants import get_tenant_shape
+from user_role_management.manage.models import BaseUser
+from user_role_management.manage.services.synthetic_data import generate_synthetic_data
+
+pytest.importorskip('pytest_benchmark')
+
+# Committed, the connections are closed between the requests
+pytestmark = pytest.mark.django_db(transaction=True)
+
+LIST_ENDPOINTS = ['api:manage:employees', 'api:manage:companies', 'api:manage:processes']
+
+
+@pytest.fixture
+def authorization():
+    manifest = []
+    generate_synthetic_data(**get_tenant_shape(), manifest=manifest)
+    user = BaseUser.objects.get(id=manifest[0]['users'][0]['id'])
+    return f'Bearer {AccessToken.for_user(user)}'
+
+
+@pytest.fixture
+def client(authorization):
+    return Client(HTTP_AUTHORIZATION=authorization)
+
+
+@pytest.mark.parametrize('url_name', LIST_ENDPOINTS)
+@pytest.mark.parametrize('conn_max_age, health_checks', [(0, False), (60, False), (60, True)],
+                         ids=['per_request', 'persistent', 'persistent_checked'])
+def test_list_endpoint(benchmark, monkeypatch, client, url_name, conn_max_age, health_checks):
+    monkeypatch.setitem(connection.settings_dict, 'CONN_MAX_AGE', conn_max_age)
+    monkeypatch.setitem(connection.settings_dict, 'CONN_HEALTH_CHECKS', health_checks)
+    # close_at is set when connecting
+    connection.close()
+    url = reverse(url_name)
+
+    def request():
+        # The test client leaves out the close_old_connections of the request signals
+        close_old_connections()
+        response = client.get(url)
+        close_old_connections()
+        return response
+
+    assert request().status_code == 200
+    benchmark(request)
+
+
+@pytest.mark.parametrize('url_name', LIST_ENDPOINTS)
+@pytest.mark.parametrize('conn_max_age', [0, 60], ids=['per_request', 'persistent'])
+def test_list_endpoint_asgi(benchmark, monkeypatch, authorization, url_name, conn_max_age):
+    """
+    Through the ASGIHandler, not the test client: it runs the sync code of each
+    request in a new thread, like under uvicorn. `connections_left_open` shows
+    the connections a persistent CONN_MAX_AGE leaves behind, on PostgreSQL: the
+    in-memory SQLite test database ignores closing.
+    """
+    monkeypatch.setitem(connection.settings_dict, 'CONN_MAX_AGE', conn_max_age)
+    application = ASGIHandler()
+    scope = {
+        'type': 'http',
+        'method': 'GET',
+        'path': reverse(url_name),
+        'query_string': b'',
+        'headers': [(b'authorization', authorization.encode())],
+    }
+    opened = []
+
+    def connection_opened(sender, connection, **kwargs):
+        opened.append(connection)
+    connection_created.connect(connection_opened)
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def request():
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+        await application(scope, receive, send)
+        return messages[0]['status']
+
+    # An event loop of its own, async_to_sync would run the sync code in this thread
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(request()) == 200
+        opened.clear()
+        requests = []
+        benchmark(lambda: requests.append(loop.run_until_complete(request())))
+    finally:
+        connection_created.disconnect(connection_opened)
+        loop.close()
+    benchmark.extra_info['connections_per_request'] = len(opened) / len(requests)
+    benchmark.extra_info['connections_left_open'] = sum(1 for opened_connection in opened
+                                                        if opened_connection.connection is not None)
@@ -0,0 +1,114 @@
+"""
+Benchmarks of the permission hot paths, run them explicitly:
+
+    pytest user_role_management/benchmarks/bench_permissions.py --nomigrations
+
+See README.md for the tenant shapes and how to run them against PostgreSQL.
+"""
+import tracemalloc
+
+import pytest
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from user_role_management.api.middleware import collect_queries
+from user_role_management.benchmarks.tenants import get_tenant_shape
+from user_role_management.core.permission import url_action_perm
+from user_role_management.guardian.core import ObjectPermissionChecker
+from user_role_management.guardian.shortcuts import assign_perm, get_objects_for_user, get_users_with_perms
+from user_role_management.guardian.models import ActionGroupObjectPermission
+from user_role_management.manage.models import Action, BaseUser, Company_group
+from user_role_management.manage.services.synthetic_data import ACTION_PERMISSION, generate_synthetic_data
+
+pytest.importorskip('pytest_benchmark')
+
+pytestmark = pytest.mark.django_db
+
+
+def run(benchmark, func, *args, **kwargs):
+    """
+    Benchmarks ``func`` and records the queries and peak memory of a single call
+    in the report's extra info.
+    """
+    with collect_queries() as collector:
+        func(*args, **kwargs)
+    tracemalloc.start()
+    func(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    benchmark.extra_info.update({'queries': collector.count, 'peak_memory_kb': round(peak / 1024, 1)})
+    return benchmark(func, *args, **kwargs)
+
+
+@pytest.fixture
+def tenants():
+    """
+    The ids of the generated tenants, see ``generate_synthetic_data``.
+    """
+    manifest = []
+    generate_synthetic_data(**get_tenant_shape(), manifest=manifest)
+    return manifest
+
+
+@pytest.fixture
+def user(tenants):
+    return BaseUser.objects.get(id=tenants[0]['users'][0]['id'])
+
+
+@pytest.fixture
+def company_actions(tenants, user):
+    return list(Action.objects.filter(process__company_id=user.last_company_logged_in_id))
+
+
+def test_has_perm(benchmark, user, company_actions):
+    action = company_actions[0]
+    run(benchmark, lambda: ObjectPermissionChecker(user).has_perm(ACTION_PERMISSION, action))
+
+
+def test_has_perm_prefetched(benchmark, user, company_actions):
+    checker = ObjectPermissionChecker(user)
+    checker.prefetch_perms(company_actions)
+    run(benchmark, lambda: [checker.has_perm(ACTION_PERMISSION, action) for action in company_actions])
+
+
+def test_prefetch_perms(benchmark, user, company_actions):
+    run(benchmark, lambda: ObjectPermissionChecker(user).prefetch_perms(company_actions))
+
+
+def test_get_objects_for_user(benchmark, user):
+    run(benchmark, lambda: list(get_objects_for_user(user, f'manage.{ACTION_PERMISSION}', klass=Action)))
+
+
+def test_get_users_with_perms(benchmark, company_actions):
+    action = company_actions[0]
+    run(benchmark, lambda: list(get_users_with_perms(action)))
+
+
+def test_url_action_perm(benchmark, user):
+    granted = ActionGroupObjectPermission.objects.filter(group__in=user.company_groups.all())
+    action = Action.objects.select_related('process').get(pk=granted.first().content_object_id)
+    process = action.process
+
+    @url_action_perm(process_name=process.name, action_name=action.code_name, permission_codename=ACTION_PERMISSION)
+    def view(self, request):
+        return Response()
+
+    request = APIRequestFactory().get('/')
+    request.user = user
+    assert view(None, request).status_code == 200
+    run(benchmark, view, None, request)
+
+
+def test_bulk_assign_perm(benchmark, tenants, company_actions):
+    company_group = Company_group.objects.get(id=tenants[0]['company_group_ids'][0])
+    queryset = Action.objects.filter(pk__in=[action.pk for action in company_actions])
+
+    def setup():
+        ActionGroupObjectPermission.objects.filter(group=company_group).delete()
+
+    setup()
+    with collect_queries() as collector:
+        assign_perm(ACTION_PERMISSION, company_group, queryset)
+    benchmark.extra_info['queries'] = collector.count
+    benchmark.pedantic(assign_perm, args=(ACTION_PERMISSION, company_group, queryset), setup=setup, rounds=20)
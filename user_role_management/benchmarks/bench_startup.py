@@ -0,0 +1,32 @@
+"""
+Benchmarks of the startup of a process, what each management command, Celery
+worker and Gunicorn worker pays before its first task:
+
+    pytest user_role_management/benchmarks/bench_startup.py --nomigrations
+
+Each round starts a new interpreter, DJANGO_SETTINGS_MODULE is inherited from
+the run. See README.md for `python -X importtime`.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+
+COMMANDS = {
+    'setup': [sys.executable, '-c', 'import django; django.setup()'],
+    'check': [sys.executable, 'manage.py', 'check'],
+}
+
+
+@pytest.mark.parametrize('command', COMMANDS)
+def test_startup(benchmark, command):
+    def start():
+        return subprocess.run(COMMANDS[command], cwd=BASE_DIR, capture_output=True)
+
+    assert start().returncode == 0
+    benchmark.pedantic(start, rounds=10, warmup_rounds=1)
@@ -0,0 +1,27 @@
+import os
+from typing import Any, Dict
+
+# Rough shapes of the tenants we run, a few large companies or many small ones, as
+# arguments of manage.services.synthetic_data.generate_synthetic_data
+TENANT_SHAPES = {
+    'small': {'companies': 2, 'users_per_company': 15, 'department_depth': 2, 'department_fan_out': 2,
+              'positions_per_company': 10, 'positions_per_department': 2, 'processes_per_company': 3,
+              'actions_per_process': 10, 'groups_per_company': 3, 'granted_ratio': 0.5},
+    'medium': {'companies': 10, 'users_per_company': 200, 'department_depth': 3, 'department_fan_out': 3,
+               'positions_per_company': 50, 'positions_per_department': 2, 'processes_per_company': 10,
+               'actions_per_process': 30, 'groups_per_company': 10, 'granted_ratio': 0.5},
+    'large': {'companies': 50, 'users_per_company': 1000, 'department_depth': 3, 'department_fan_out': 4,
+              'positions_per_company': 200, 'positions_per_department': 3, 'processes_per_company': 20,
+              'actions_per_process': 50, 'groups_per_company': 20, 'granted_ratio': 0.3},
+}
+
+
+def get_tenant_shape() -> Dict[str, Any]:
+    """
+    Shape picked by BENCHMARK_SHAPE (default ``small``), any of its values can be
+    overridden with BENCHMARK_<KEY>, e.g. BENCHMARK_COMPANIES=100.
+    """
+    shape = dict(TENANT_SHAPES[os.environ.get('BENCHMARK_SHAPE', 'small')])
+    for key, value in shape.items():
+        shape[key] = type(value)(os.environ.get(f'BENCHMARK_{key.upper()}', value))
+    return shape
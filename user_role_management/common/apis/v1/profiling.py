@@ -0,0 +1,104 @@
+import json
+
+from django.http import HttpRequest, HttpResponse
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, serializers
+from rest_framework.permissions import IsAdminUser
+from drf_spectacular.utils import extend_schema
+from user_role_management.api.mixins import ApiAuthMixin
+from user_role_management.common.models import Request_profile
+from user_role_management.common.profiling import to_collapsed_stacks
+from user_role_management.common.selectors import profiling as profiling_selector
+from user_role_management.api.pagination import LimitOffsetPagination, get_paginated_response_context
+from user_role_management.core.exceptions import error_response
+from user_role_management.utils.serializer_handler import CustomSingleResponseSerializerBase, \
+    CustomMultiResponseSerializerBase
+
+
+class OutPutRequestProfileSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Request_profile
+        exclude = ['speedscope', 'sql_timeline']
+
+
+class OutPutRequestProfileDetailSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Request_profile
+        exclude = ['speedscope']
+
+
+class CustomRequestProfileSingleResponseSerializer(CustomSingleResponseSerializerBase):
+    data = OutPutRequestProfileDetailSerializer()
+
+    class Meta:
+        fields = ('is_success', 'data')
+
+
+class CustomRequestProfileMultiResponseSerializer(CustomMultiResponseSerializerBase):
+    data = serializers.ListSerializer(child=OutPutRequestProfileSerializer())
+
+    class Meta:
+        fields = ('is_success', 'data')
+
+
+class RequestProfilesApi(ApiAuthMixin, APIView):
+    permission_classes = (IsAdminUser, )
+
+    class Pagination(LimitOffsetPagination):
+        default_limit = 50
+
+    @extend_schema(responses=CustomRequestProfileMultiResponseSerializer, tags=['Profiling'])
+    def get(self, request: HttpRequest):
+        try:
+            request_profiles = profiling_selector.get_request_profiles(request)
+            return get_paginated_response_context(
+                request=request,
+                pagination_class=self.Pagination,
+                serializer_class=OutPutRequestProfileSerializer,
+                queryset=request_profiles,
+                view=self,
+            )
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+
+class RequestProfileApi(ApiAuthMixin, APIView):
+    permission_classes = (IsAdminUser, )
+
+    @extend_schema(responses=CustomRequestProfileSingleResponseSerializer, tags=['Profiling'])
+    def get(self, request: HttpRequest, request_profile_id: int):
+        try:
+            request_profile = profiling_selector.get_request_profile(request=request, id=request_profile_id)
+            if not request_profile['is_success']:
+                raise Exception(request_profile['message'])
+            return Response(CustomRequestProfileSingleResponseSerializer(request_profile,
+                                                                         context={"request": request}).data)
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+
+class RequestProfileDownloadApi(ApiAuthMixin, APIView):
+    """
+    Downloads a profile as a speedscope file (https://www.speedscope.app) or as
+    collapsed stacks for flamegraph tools.
+    """
+    permission_classes = (IsAdminUser, )
+
+    @extend_schema(responses={(200, 'application/octet-stream'): bytes}, tags=['Profiling'])
+    def get(self, request: HttpRequest, request_profile_id: int, file_format: str):
+        request_profile = profiling_selector.get_request_profile(request=request, id=request_profile_id)
+        if not request_profile['is_success']:
+            return Response(error_response(message=request_profile['message']), status=status.HTTP_400_BAD_REQUEST)
+
+        speedscope = request_profile['data'].speedscope
+        if file_format == 'speedscope':
+            response = HttpResponse(json.dumps(speedscope), content_type='application/json')
+            filename = f"profile-{request_profile_id}.speedscope.json"
+        else:
+            response = HttpResponse(to_collapsed_stacks(speedscope), content_type='text/plain')
+            filename = f"profile-{request_profile_id}.collapsed.txt"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
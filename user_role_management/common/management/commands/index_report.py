@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from user_role_management.common.selectors import indexes as indexes_selector
+
+
+class Command(BaseCommand):
+    """
+    index_report command reports the declared indexes the database misses and,
+    on PostgreSQL, the unused indexes and the tables mostly read by sequential
+    scans from `pg_stat_user_indexes` / `pg_stat_user_tables`.
+
+    Usage::
+
+        $ python manage.py index_report --min-rows 10000
+
+    The usage statistics add up since their last reset, run it after the load
+    tests or a few days of production traffic.
+    """
+    help = "Reports missing and unused database indexes"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--max-scans', type=int, default=0,
+                            help="Indexes scanned at most this many times are reported as unused")
+        parser.add_argument('--min-rows', type=int, default=10000,
+                            help="Smaller tables are not reported, sequential scans are fine on them")
+
+    def handle(self, **options):
+        using = options['database']
+
+        missing = indexes_selector.get_missing_declared_indexes(using=using)
+        self.stdout.write("Declared indexes missing from the database:")
+        for index in missing:
+            self.stdout.write(f"  {index['table']}.{index['index']} ({', '.join(index['fields'])})")
+        if not missing:
+            self.stdout.write("  none")
+
+        if connections[using].vendor != 'postgresql':
+            self.stdout.write(self.style.WARNING("Index usage statistics need PostgreSQL."))
+            return
+
+        self.stdout.write(f"\nStatistics since: {indexes_selector.get_stats_reset(using=using) or 'unknown'}")
+
+        self.stdout.write(f"\nUnused indexes (at most {options['max_scans']} scans):")
+        unused = indexes_selector.get_unused_indexes(using=using, max_scans=options['max_scans'])
+        for index in unused:
+            self.stdout.write(f"  {index['table']}.{index['index']}: {index['scans']} scans, "
+                              f"{index['size'] / 1024 / 1024:.1f} MB")
+        if not unused:
+            self.stdout.write("  none")
+
+        self.stdout.write(f"\nTables read mostly by sequential scans (at least {options['min_rows']} rows):")
+        tables = indexes_selector.get_seq_scanned_tables(using=using, min_rows=options['min_rows'])
+        for table in tables:
+            self.stdout.write(f"  {table['table']}: {table['seq_scan']} sequential scans reading "
+                              f"{table['seq_tup_read']} rows, {table['idx_scan']} index scans, {table['rows']} rows")
+        if not tables:
+            self.stdout.write("  none")
@@ -1,6 +1,10 @@
+from typing import Optional
+
 from django.db import models
+from django.db.models import QuerySet
 from django.db.models.query import F, Q
 from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
 
 
 class BaseModel(models.Model):
@@ -26,3 +30,35 @@ class RandomModel(BaseModel):
                 check=Q(start_date__lt=F("end_date"))
             )
         ]
+
+
+class Request_profile(BaseModel):
+    """
+        Sampled stack profile and SQL timeline of one request, recorded by ``ProfilingMiddleware``.
+    """
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=2048)
+    view = models.CharField(max_length=255)
+    status_code = models.PositiveSmallIntegerField()
+    duration = models.FloatField()
+    query_count = models.PositiveIntegerField()
+    sql_timeline = models.JSONField(default=list)
+    speedscope = models.JSONField()
+
+    class Meta:
+        verbose_name = _("request profile")
+        verbose_name_plural = _("request profiles")
+
+    @classmethod
+    def _get_all(cls) -> QuerySet['Request_profile']:
+        return cls.objects.defer('speedscope', 'sql_timeline').order_by('-id')
+
+    @classmethod
+    def _get_by_id(cls, id: int) -> Optional['Request_profile']:
+        try:
+            return cls.objects.get(id=id)
+        except cls.DoesNotExist:
+            return None
+
+    def __str__(self):
+        return f"{self.method} {self.path} {self.duration:.3f}s"
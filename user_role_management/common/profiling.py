@@ -0,0 +1,97 @@
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+Frame = Tuple[str, str, int]
+
+
+class StackSampler:
+    """
+    Samples the stack of one thread from a background thread every `interval`
+    seconds, the sampled thread runs untouched.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: List[Tuple[float, Tuple[Frame, ...]]] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            self.samples.append((time.perf_counter(), tuple(reversed(stack))))
+
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.ended_at = time.perf_counter()
+
+    def get_weighted_stacks(self) -> List[Tuple[Tuple[Frame, ...], float]]:
+        """
+        Each sample weighs the time elapsed since the previous one.
+        """
+        weighted = []
+        previous = self.started_at
+        for sampled_at, stack in self.samples:
+            weighted.append((stack, sampled_at - previous))
+            previous = sampled_at
+        return weighted
+
+
+def to_speedscope(*, name: str, weighted_stacks: List[Tuple[Tuple[Frame, ...], float]]) -> Dict[str, Any]:
+    """
+    Sampled profile in the speedscope file format, https://www.speedscope.app/file-format-schema.json
+    """
+    frames, frame_index, samples, weights = [], {}, [], []
+    for stack, weight in weighted_stacks:
+        sample = []
+        for frame in stack:
+            if frame not in frame_index:
+                frame_index[frame] = len(frames)
+                frames.append({'name': frame[0], 'file': frame[1], 'line': frame[2]})
+            sample.append(frame_index[frame])
+        samples.append(sample)
+        weights.append(weight)
+
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': name,
+        'exporter': 'user_role_management',
+        'shared': {'frames': frames},
+        'profiles': [{
+            'type': 'sampled',
+            'name': name,
+            'unit': 'seconds',
+            'startValue': 0,
+            'endValue': sum(weights),
+            'samples': samples,
+            'weights': weights,
+        }],
+    }
+
+
+def to_collapsed_stacks(speedscope: Dict[str, Any]) -> str:
+    """
+    `frame;frame;frame microseconds` lines, as read by flamegraph.pl and most flamegraph tools.
+    """
+    frames = speedscope['shared']['frames']
+    profile = speedscope['profiles'][0]
+    collapsed = {}
+    for sample, weight in zip(profile['samples'], profile['weights']):
+        key = ";".join(f"{frames[index]['name']} ({frames[index]['file']}:{frames[index]['line']})"
+                       for index in sample)
+        collapsed[key] = collapsed.get(key, 0) + weight
+    return "\n".join(f"{key} {round(weight * 1_000_000)}" for key, weight in collapsed.items() if key)
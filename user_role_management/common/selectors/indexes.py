@@ -0,0 +1,67 @@
+from typing import Dict, List, Optional
+
+from django.apps import apps
+from django.db import connections
+
+UNUSED_INDEXES_SQL = """
+    SELECT s.relname, s.indexrelname, s.idx_scan, pg_relation_size(s.indexrelid)
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    WHERE s.idx_scan <= %s AND NOT i.indisunique AND NOT i.indisprimary
+    ORDER BY pg_relation_size(s.indexrelid) DESC
+"""
+
+SEQ_SCANNED_TABLES_SQL = """
+    SELECT relname, seq_scan, seq_tup_read, COALESCE(idx_scan, 0), n_live_tup
+    FROM pg_stat_user_tables
+    WHERE n_live_tup >= %s AND seq_scan > COALESCE(idx_scan, 0)
+    ORDER BY seq_tup_read DESC
+"""
+
+
+def get_missing_declared_indexes(*, using: str = 'default') -> List[Dict]:
+    """
+    Indexes of the models' `Meta.indexes` the database does not have, e.g. when
+    migrations are not applied.
+    """
+    connection = connections[using]
+    missing = []
+    with connection.cursor() as cursor:
+        tables = set(connection.introspection.table_names(cursor))
+        for model in apps.get_models():
+            table = model._meta.db_table
+            if not model._meta.managed or not model._meta.indexes or table not in tables:
+                continue
+            existing = connection.introspection.get_constraints(cursor, table)
+            missing.extend({'table': table, 'index': index.name, 'fields': index.fields}
+                           for index in model._meta.indexes if index.name not in existing)
+    return missing
+
+
+def get_unused_indexes(*, using: str = 'default', max_scans: int = 0) -> List[Dict]:
+    """
+    Non unique indexes scanned at most `max_scans` times since the statistics
+    were reset, largest first. PostgreSQL only.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(UNUSED_INDEXES_SQL, [max_scans])
+        return [{'table': table, 'index': index, 'scans': scans, 'size': size}
+                for table, index, scans, size in cursor.fetchall()]
+
+
+def get_seq_scanned_tables(*, using: str = 'default', min_rows: int = 10000) -> List[Dict]:
+    """
+    Tables of at least `min_rows` rows read more often by sequential scans than
+    by index scans, the usual sign of a missing index. PostgreSQL only.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(SEQ_SCANNED_TABLES_SQL, [min_rows])
+        return [{'table': table, 'seq_scan': seq_scan, 'seq_tup_read': seq_tup_read, 'idx_scan': idx_scan,
+                 'rows': rows} for table, seq_scan, seq_tup_read, idx_scan, rows in cursor.fetchall()]
+
+
+def get_stats_reset(*, using: str = 'default') -> Optional[str]:
+    with connections[using].cursor() as cursor:
+        cursor.execute("SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()")
+        row = cursor.fetchone()
+    return str(row[0]) if row and row[0] else None
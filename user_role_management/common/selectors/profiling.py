@@ -0,0 +1,16 @@
+from typing import Dict, Literal
+from django.http import HttpRequest
+from django.db.models import QuerySet
+from user_role_management.common.models import Request_profile
+from user_role_management.core.exceptions import error_response, success_response
+
+
+def get_request_profiles(request: HttpRequest, **kwargs) -> QuerySet[Request_profile]:
+    return Request_profile._get_all()
+
+
+def get_request_profile(request: HttpRequest, id: int) -> Dict[str, Literal['is_success', True, False]]:
+    obj = Request_profile._get_by_id(id=id)
+    if not isinstance(obj, Request_profile):
+        return error_response(message="There are no record")
+    return success_response(data=obj)
@@ -1,13 +1,34 @@
-from typing import List, Dict, Any, Tuple
+from collections import Counter
+from typing import List, Dict, Any, Tuple, Optional, Type
+
+from django.db import models, router, transaction
+from django.utils import timezone
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
 
 from user_role_management.common.types import DjangoModelType
 
 
+def _get_concrete_field(model: Type[models.Model], key: str) -> Optional[models.Field]:
+    """
+    Returns the concrete field ``key`` refers to, either by name (``company``)
+    or by attname (``company_id``). Returns ``None`` for unknown keys.
+    """
+    for field in model._meta.concrete_fields:
+        if key in (field.name, field.attname):
+            return field
+    return None
+
+
+def _get_auto_now_fields(model: Type[models.Model]) -> List[str]:
+    return [field.name for field in model._meta.concrete_fields if getattr(field, 'auto_now', False)]
+
+
 def model_update(
     *,
     instance: DjangoModelType,
     fields: List[str],
-    data: Dict[str, Any]
+    data: Dict[str, Any],
+    validate: bool = True
 ) -> Tuple[DjangoModelType, bool]:
     """
     Generic update service meant to be reused in local update services
@@ -22,27 +43,259 @@ def model_update(
 
         return user
 
+    Fields may be given by name or attname (``company`` or ``company_id``),
+    keys which are not concrete fields of the model are ignored.
+
+    Only the fields whose value actually changed are validated (when ``validate``
+    is set) and written, together with ``auto_now`` fields.
+
     Return value: Tuple with the following elements:
         1. The instance we updated
         2. A boolean value representing whether we performed an update or not.
     """
-    has_updated = False
+    model = type(instance)
+    changed_fields = []
 
     for field in fields:
         # Skip if a field is not present in the actual data
         if field not in data:
             continue
 
-        if getattr(instance, field) != data[field]:
-            has_updated = True
-            setattr(instance, field, data[field])
+        model_field = _get_concrete_field(model, field)
+        if model_field is None or model_field.primary_key:
+            continue
+
+        value = data[field]
+        if model_field.is_relation and isinstance(value, models.Model):
+            value = value.pk
+
+        if getattr(instance, model_field.attname) != value:
+            setattr(instance, model_field.attname, value)
+            changed_fields.append(model_field.name)
 
     # Perform an update only if any of the fields was actually changed
-    if has_updated:
-        instance.full_clean()
-        # Update only the fields that are meant to be updated.
-        # Django docs reference:
-        # https://docs.djangoproject.com/en/dev/ref/models/instances/#specifying-which-fields-to-save
-        instance.save(update_fields=fields)
-
-    return instance, has_updated
+    if not changed_fields:
+        return instance, False
+
+    if validate:
+        instance.full_clean(exclude=[field.name for field in model._meta.concrete_fields
+                                     if field.name not in changed_fields])
+
+    # Update only the fields that were changed.
+    # Django docs reference:
+    # https://docs.djangoproject.com/en/dev/ref/models/instances/#specifying-which-fields-to-save
+    instance.save(update_fields=[*changed_fields, *_get_auto_now_fields(model)])
+
+    return instance, True
+
+
+def model_update_by_id(
+    *,
+    model: Type[DjangoModelType],
+    id: int,
+    data: Dict[str, Any],
+    validate: bool = False
+) -> Tuple[DjangoModelType, bool]:
+    """
+    Loads the row ``id`` of ``model`` and updates it with ``data`` through ``model_update``.
+
+    Raises ``model.DoesNotExist`` when there is no such row.
+    """
+    instance = model.objects.get(pk=id)
+    return model_update(instance=instance, fields=list(data), data=data, validate=validate)
+
+
+def _prefetch_foreign_keys(
+    model: Type[models.Model],
+    instances: Dict[int, models.Model],
+    items: List[Dict[str, Any]]
+) -> Dict[str, set]:
+    """
+    Returns, per foreign key some item changes, the target values among the
+    new ones which exist (and match ``limit_choices_to``), with one query per
+    foreign key instead of one per item.
+    """
+    values = {}
+    for item in items:
+        instance = instances.get(item['id'])
+        if instance is None:
+            continue
+        for key, value in item['fields'].items():
+            model_field = _get_concrete_field(model, key)
+            if model_field is None or not model_field.many_to_one:
+                continue
+            if isinstance(value, models.Model):
+                value = value.pk
+            try:
+                value = model_field.to_python(value)
+            except ValidationError:
+                continue
+            if value is not None and getattr(instance, model_field.attname) != value:
+                values.setdefault(model_field, set()).add(value)
+
+    existing = {}
+    for model_field, targets in values.items():
+        remote_model = model_field.remote_field.model
+        target_field = model_field.remote_field.field_name
+        queryset = remote_model._base_manager.using(router.db_for_read(remote_model)).filter(
+            **{f'{target_field}__in': targets}).complex_filter(model_field.get_limit_choices_to())
+        existing[model_field.name] = set(queryset.values_list(target_field, flat=True))
+    return existing
+
+
+def _clean_changed_fields(instance: models.Model, changed_fields: List[str], foreign_keys: Dict[str, set]) -> None:
+    """
+    ``clean_fields`` of the changed fields, except that the targets of the
+    changed foreign keys are looked up in ``foreign_keys`` (see
+    ``_prefetch_foreign_keys``) instead of with a query each.
+    """
+    model = type(instance)
+    errors = {}
+    try:
+        instance.clean_fields(exclude=[field.name for field in model._meta.concrete_fields
+                                       if field.name not in changed_fields or field.name in foreign_keys])
+    except ValidationError as ex:
+        errors = ex.update_error_dict(errors)
+
+    for name in changed_fields:
+        if name not in foreign_keys:
+            continue
+        model_field = model._meta.get_field(name)
+        value = getattr(instance, model_field.attname)
+        if model_field.blank and value in model_field.empty_values:
+            continue
+        try:
+            value = model_field.to_python(value)
+            # ForeignKey.validate without its query
+            models.Field.validate(model_field, value, instance)
+            model_field.run_validators(value)
+            if value is not None and value not in foreign_keys[name]:
+                raise ValidationError(
+                    model_field.error_messages['invalid'],
+                    code='invalid',
+                    params={'model': model_field.remote_field.model._meta.verbose_name, 'pk': value,
+                            'field': model_field.remote_field.field_name, 'value': value},
+                )
+            setattr(instance, model_field.attname, value)
+        except ValidationError as ex:
+            errors[name] = ex.error_list
+
+    if errors:
+        raise ValidationError(errors)
+
+
+def _validate_changed_unique(
+    instance: models.Model,
+    changed_fields: List[str],
+    claimed: set
+) -> List[Tuple[Type[models.Model], Tuple[str, ...]]]:
+    """
+    ``validate_unique`` of the unique checks which involve a changed field,
+    against the table and against the values ``claimed`` by the items of the
+    same batch (which ``bulk_update`` would otherwise only find out about as
+    an IntegrityError failing the whole batch).
+
+    Returns the checks, to be claimed by the caller once the item is valid.
+    """
+    unique_checks = [(model_class, unique_check) for model_class, unique_check in instance._get_unique_checks()[0]
+                     if set(unique_check) & set(changed_fields)]
+    if not unique_checks:
+        return []
+
+    checked_fields = {name for _, unique_check in unique_checks for name in unique_check}
+    instance.validate_unique(exclude=[field.name for field in type(instance)._meta.concrete_fields
+                                      if field.name not in checked_fields])
+
+    errors = {}
+    for model_class, unique_check in unique_checks:
+        if _unique_key(instance, unique_check) in claimed:
+            key = unique_check[0] if len(unique_check) == 1 else NON_FIELD_ERRORS
+            errors.setdefault(key, []).append(instance.unique_error_message(model_class, unique_check))
+    if errors:
+        raise ValidationError(errors)
+    return unique_checks
+
+
+def _unique_key(instance: models.Model, unique_check: Tuple[str, ...]) -> Optional[tuple]:
+    values = tuple(getattr(instance, instance._meta.get_field(name).attname) for name in unique_check)
+    # NULLs never collide, as for validate_unique
+    return None if None in values else (unique_check, values)
+
+
+def model_bulk_update(
+    *,
+    model: Type[DjangoModelType],
+    items: List[Dict[str, Any]],
+    queryset: Optional[models.QuerySet] = None,
+    batch_size: int = 500
+) -> List[Dict[str, Any]]:
+    """
+    Applies many partial updates given as ``[{'id': 1, 'fields': {...}}, ...]``.
+
+    Items sharing an id are all rejected. Targets are loaded with one
+    ``in_bulk`` (from ``queryset`` when given, to scope the rows that may be
+    touched), the targets of the changed foreign keys with one query per
+    foreign key. Changed values are validated per item with ``clean_fields``
+    and the unique checks they are part of (against the table and the other
+    items), so one item can not fail the others, and every valid item is
+    written with ``bulk_update`` in batches of ``batch_size`` inside one
+    transaction.
+
+    Returns a status per item, in the order they were given:
+    ``{'id': 1, 'is_success': True, 'updated_fields': [...]}`` or
+    ``{'id': 1, 'is_success': False, 'message': '...'}``.
+    """
+    queryset = model.objects.all() if queryset is None else queryset
+    ids = Counter(item['id'] for item in items)
+    instances = queryset.in_bulk([id for id, count in ids.items() if count == 1])
+    foreign_keys = _prefetch_foreign_keys(model, instances, items)
+    statuses = []
+    to_update = {}
+    updated_fields = set()
+    claimed = set()
+
+    for item in items:
+        if ids[item['id']] > 1:
+            statuses.append({'id': item['id'], 'is_success': False, 'message': "The id is repeated in the request"})
+            continue
+        instance = instances.get(item['id'])
+        if instance is None:
+            statuses.append({'id': item['id'], 'is_success': False, 'message': "There are no record"})
+            continue
+
+        changed_fields = []
+        for key, value in item['fields'].items():
+            model_field = _get_concrete_field(model, key)
+            if model_field is None or model_field.primary_key:
+                continue
+            if model_field.is_relation and isinstance(value, models.Model):
+                value = value.pk
+            if getattr(instance, model_field.attname) != value:
+                setattr(instance, model_field.attname, value)
+                changed_fields.append(model_field.name)
+
+        try:
+            _clean_changed_fields(instance, changed_fields, foreign_keys)
+            unique_checks = _validate_changed_unique(instance, changed_fields, claimed)
+        except ValidationError as ex:
+            statuses.append({'id': item['id'], 'is_success': False, 'message': str(ex)})
+            continue
+
+        claimed.update(_unique_key(instance, unique_check) for _, unique_check in unique_checks)
+        claimed.discard(None)
+        if changed_fields:
+            to_update[item['id']] = instance
+            updated_fields.update(changed_fields)
+        statuses.append({'id': item['id'], 'is_success': True, 'updated_fields': changed_fields})
+
+    if to_update:
+        auto_now_fields = _get_auto_now_fields(model)
+        now = timezone.now()
+        for instance in to_update.values():
+            for field in auto_now_fields:
+                setattr(instance, field, now)
+        with transaction.atomic():
+            model.objects.bulk_update(list(to_update.values()), [*updated_fields, *auto_now_fields],
+                                      batch_size=batch_size)
+
+    return statuses
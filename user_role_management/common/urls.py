@@ -0,0 +1,13 @@
+from django.urls import path
+from user_role_management.common.apis.v1 import profiling
+
+urlpatterns = [
+
+    path('request_profile/', profiling.RequestProfilesApi.as_view(), name="request_profiles"),
+    path('request_profile/<int:request_profile_id>', profiling.RequestProfileApi.as_view(), name="request_profile"),
+    path('request_profile/<int:request_profile_id>/speedscope', profiling.RequestProfileDownloadApi.as_view(),
+         {'file_format': 'speedscope'}, name="request_profile_speedscope"),
+    path('request_profile/<int:request_profile_id>/flamegraph', profiling.RequestProfileDownloadApi.as_view(),
+         {'file_format': 'flamegraph'}, name="request_profile_flamegraph"),
+
+]
@@ -1,5 +1,22 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
+from django.conf import settings
+from django.core.signals import request_started
+from django.db.backends.signals import connection_created
 
 
 class CoreConfig(AppConfig):
     name = 'user_role_management.core'
+
+    def ready(self):
+        from user_role_management.core import instrumentation, tracing
+        from user_role_management.core.connections import check_connections, install_query_wrappers
+
+        connection_created.connect(install_query_wrappers)
+        # After Django's close_old_connections, which closes the expired ones
+        request_started.connect(check_connections)
+        if settings.TRACING_ENABLED:
+            tracing.configure_tracing()
+        if settings.TRACING_ENABLED or settings.SLOW_QUERY_ENABLED:
+            for app_config in apps.get_app_configs():
+                if app_config.name.startswith('user_role_management.'):
+                    instrumentation.instrument_selectors_and_services(app_config.name)
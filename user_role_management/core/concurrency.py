@@ -0,0 +1,59 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.FAN_OUT_MAX_WORKERS, thread_name_prefix='fan_out')
+    return _executor
+
+
+def _run(func: Callable[[], Any]) -> Any:
+    # The worker threads keep their connections like the request threads, up to CONN_MAX_AGE
+    close_old_connections()
+    try:
+        return func()
+    finally:
+        close_old_connections()
+
+
+def _run_sequentially(calls: Dict[str, Callable[[], Any]]) -> bool:
+    # Other connections wouldn't see the writes of an open transaction
+    return settings.FAN_OUT_MAX_WORKERS < 1 or len(calls) < 2 or connection.in_atomic_block
+
+
+def run_concurrently(calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    Runs independent read-only calls, like selectors with the serialization of
+    their results, in the FAN_OUT_MAX_WORKERS threads and returns their results by
+    name. Each thread has its own database connection. Sequential in the calling
+    thread inside a transaction.
+    """
+    if _run_sequentially(calls):
+        return {name: func() for name, func in calls.items()}
+    futures = {name: get_executor().submit(contextvars.copy_context().run, _run, func)
+               for name, func in calls.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+async def arun_concurrently(calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    `run_concurrently` for async views, gathering the calls in the same threads.
+    """
+    if await sync_to_async(_run_sequentially)(calls):
+        return await sync_to_async(lambda: {name: func() for name, func in calls.items()})()
+    results = await asyncio.gather(*(sync_to_async(_run, thread_sensitive=False, executor=get_executor())(func)
+                                     for func in calls.values()))
+    return dict(zip(calls, results))
@@ -0,0 +1,58 @@
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Tuple
+
+from django.db import connections
+
+# The execute wrappers of `query_wrapper` blocks, run on every connection
+_query_wrappers: ContextVar[Tuple[Callable, ...]] = ContextVar('query_wrappers', default=())
+
+
+def check_connections(**kwargs):
+    """
+    Closes the persistent connections (CONN_MAX_AGE) the database dropped since the
+    previous request, by a restart, a failover or an idle timeout, so the request
+    reconnects instead of failing on its first query. What CONN_HEALTH_CHECKS does
+    from Django 4.1, run for the databases with it set: the connection is checked
+    once per request, on its first use, requests which don't use it pay nothing.
+    """
+    for alias in connections:
+        connection = connections[alias]
+        if connection.connection is None or not connection.settings_dict.get('CONN_HEALTH_CHECKS'):
+            continue
+        connection.ensure_connection = functools.partial(_check_and_ensure_connection, connection)
+
+
+def _check_and_ensure_connection(connection):
+    # Back to the method of the backend for the rest of the request
+    del connection.ensure_connection
+    if connection.connection is not None and not connection.is_usable():
+        connection.close()
+    connection.ensure_connection()
+
+
+@contextmanager
+def query_wrapper(wrapper: Callable):
+    """
+    `connection.execute_wrapper` for every database and every thread running the
+    block's context: the connections are per thread, the threads of sync_to_async
+    and `core.concurrency` run in a copy of the context of their caller.
+    """
+    token = _query_wrappers.set(_query_wrappers.get() + (wrapper,))
+    try:
+        yield wrapper
+    finally:
+        _query_wrappers.reset(token)
+
+
+def execute_query_wrappers(execute, sql, params, many, context):
+    for wrapper in reversed(_query_wrappers.get()):
+        execute = functools.partial(wrapper, execute)
+    return execute(sql, params, many, context)
+
+
+def install_query_wrappers(sender, connection, **kwargs):
+    # First, `connection.execute_wrapper` blocks pop the last one when they exit
+    if execute_query_wrappers not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, execute_query_wrappers)
@@ -8,13 +8,23 @@ class ApplicationError(Exception):
         self.message = message
         self.extra = extra or {}
 
+
+def _first_error(detail):
+    # Nested serializers report their errors as dicts, list items as lists
+    # where valid items are left as empty entries
+    while isinstance(detail, (dict, list)):
+        values = detail.values() if isinstance(detail, dict) else detail
+        detail = next(value for value in values if value)
+    return detail
+
+
 def handle_validation_error(serializer):
     try:
         serializer.is_valid(raise_exception=True)
         return True  # Validation successful
     except ValidationError as ve:
         if (len(ve.detail.items())) == 1:
-            error_message = next(iter(ve.detail.values()))[0]
+            error_message = _first_error(next(iter(ve.detail.values())))
             response_data = {
                 "is_success": False,
                 "data": {
@@ -29,7 +39,7 @@ def handle_validation_error(serializer):
             error_type = ""
             for key, values in ve.detail.items():
                 error_type += str(key) + " "
-                error_messages += f"{str(key)}: {str(values[0])} "
+                error_messages += f"{str(key)}: {str(_first_error(values))} "
             response_data = {
                 "is_success": False,
                 "data": {
@@ -0,0 +1,102 @@
+import functools
+import inspect
+import sys
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import PathFinder
+from types import ModuleType
+from typing import List
+
+from django.db.models import QuerySet
+
+from user_role_management.core import tracing
+
+
+def instrument(func):
+    """
+    Runs `func` in a tracing span and tags the querysets it returns with its
+    name as `query.origin`. Querysets are lazy, their SQL runs later in the api
+    method, the tag tells the slow query log which selector built them. It is
+    kept by `.filter()`, slicing and the other chained calls.
+    """
+    origin = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with tracing.span(origin):
+            result = func(*args, **kwargs)
+        if isinstance(result, QuerySet):
+            result.query.origin = origin
+        return result
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+def instrument_module(module: ModuleType):
+    """
+    Replaces the public functions defined in `module` with instrumented ones.
+    The apis call selectors and services through their module,
+    `organization_chart_selector.get_employees(...)`, so they pick them up.
+    """
+    for attribute, value in list(vars(module).items()):
+        if attribute.startswith('_') or not inspect.isfunction(value):
+            continue
+        if value.__module__ != module.__name__ or getattr(value, '__instrumented__', False):
+            continue
+        setattr(module, attribute, instrument(value))
+
+
+class _InstrumentingLoader(Loader):
+    """
+    Instruments the module the wrapped loader executes. The rest, `get_source()`
+    for tracebacks and `inspect`, `is_package()`, `get_resource_reader()`, is
+    the wrapped loader's.
+    """
+
+    def __init__(self, loader: Loader):
+        self.loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.loader.exec_module(module)
+        instrument_module(module)
+
+
+class _InstrumentingFinder(MetaPathFinder):
+    """
+    Instruments the selectors and services modules when they are imported.
+    """
+
+    def __init__(self):
+        self.packages: List[str] = []
+
+    def find_spec(self, fullname, path, target=None):
+        if not any(fullname == package or fullname.startswith(f"{package}.") for package in self.packages):
+            return None
+        spec = PathFinder.find_spec(fullname, path)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _InstrumentingLoader(spec.loader)
+        return spec
+
+
+_finder = _InstrumentingFinder()
+
+
+def instrument_selectors_and_services(app_name: str):
+    """
+    Instruments the `selectors` and `services` modules of the app, those already
+    imported now and the others when they are imported, so startup doesn't import
+    them, and the apis and DRF with them, for commands and workers which don't.
+    """
+    if _finder not in sys.meta_path:
+        sys.meta_path.insert(0, _finder)
+    for layer in ('selectors', 'services'):
+        package = f"{app_name}.{layer}"
+        _finder.packages.append(package)
+        for name, module in list(sys.modules.items()):
+            if module is not None and (name == package or name.startswith(f"{package}.")):
+                instrument_module(module)
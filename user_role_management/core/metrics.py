@@ -0,0 +1,56 @@
+import os
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, \
+    multiprocess
+
+# Metrics are collected per process. Under gunicorn PROMETHEUS_MULTIPROC_DIR must
+# point to an empty directory shared by the workers (see docker/web_entrypoint.sh
+# and gunicorn.conf.py), /metrics then aggregates the files of all of them.
+REQUEST_LATENCY = Histogram(
+    'http_request_duration_seconds', 'Latency of the requests per view',
+    ['view', 'method', 'status'],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUEST_QUERIES = Histogram(
+    'http_request_db_queries', 'Database queries run per request',
+    ['view'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+REQUEST_DB_DURATION = Histogram(
+    'http_request_db_duration_seconds', 'Time spent in the database per request',
+    ['view'],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+URL_ACTION_PERM_CHECKS = Counter(
+    'url_action_perm_checks', 'Outcomes of url_action_perm checks',
+    ['process', 'action', 'outcome'],
+)
+OBJECT_PERMISSION_CACHE = Counter(
+    'object_permission_checker_cache', 'ObjectPermissionChecker local cache lookups',
+    ['result'],
+)
+OBJECT_PERMISSION_CACHE_HIT = OBJECT_PERMISSION_CACHE.labels(result='hit')
+OBJECT_PERMISSION_CACHE_MISS = OBJECT_PERMISSION_CACHE.labels(result='miss')
+
+
+def get_registry():
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Prometheus scrape endpoint, protected with METRICS_TOKEN. Without a token it is
+    only served when DEBUG is on.
+    """
+    if not settings.METRICS_TOKEN:
+        if not settings.DEBUG:
+            return HttpResponse(status=403)
+    elif request.headers.get('Authorization') != f"Bearer {settings.METRICS_TOKEN}":
+        return HttpResponse(status=401)
+    return HttpResponse(generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST)
@@ -1,10 +1,47 @@
 from functools import wraps
+from django.conf import settings
 from rest_framework import status
 from rest_framework.response import Response
 from user_role_management.manage.models import Process, Action
+from user_role_management.core import tracing
 from user_role_management.core.messages import errors as err_message
 from user_role_management.core.exceptions import error_response, success_response
-from user_role_management.guardian.models.models import UserObjectPermission, GroupObjectPermission
+from user_role_management.core.metrics import URL_ACTION_PERM_CHECKS
+from user_role_management.authentication.claims import has_action_perm_from_claims
+
+
+def _check_url_action_perm(*, user, token, process_name: str, action_name: str, permission_codename: str):
+    """
+    Returns the outcome of the check and the response to send instead of the view's when it is denied.
+    """
+    if settings.JWT_PERMISSION_CLAIMS:
+        has_permission = has_action_perm_from_claims(token=token, user=user, process_name=process_name,
+                                                     action_name=action_name, permission_codename=permission_codename)
+        if has_permission is not None:
+            if not has_permission:
+                return 'deny', Response(error_response(message=err_message.UNAUTHORIZED_ACTION),
+                                        status=status.HTTP_401_UNAUTHORIZED)
+            return 'allow', None
+
+    last_company_id = user.last_company_logged_in
+    if not last_company_id:
+        return 'no_company', Response(error_response(message=err_message.EMPTY_COMPANY),
+                                      status=status.HTTP_404_NOT_FOUND)
+    company_groups = user.company_groups.all()
+    process = Process.objects.filter(name=process_name, company_id=last_company_id).last()
+    if not process:
+        return 'no_process', Response(
+            error_response(message=err_message.NOT_FOUND_PROCESS_MESSAGE.format(process_name=process_name)),
+            status=status.HTTP_404_NOT_FOUND)
+
+    # One query, the action is joined to the permissions of the user's groups on its foreign key
+    has_permission = Action.objects.filter(code_name=action_name, process_id=process.id,
+                                           group_object_permissions__group__in=company_groups,
+                                           group_object_permissions__permission__codename=permission_codename).exists()
+    if not has_permission:
+        return 'deny', Response(error_response(message=err_message.UNAUTHORIZED_ACTION),
+                                status=status.HTTP_401_UNAUTHORIZED)
+    return 'allow', None
 
 
 def url_action_perm(*, process_name: str, action_name: str, permission_codename: str):
@@ -15,24 +52,17 @@ def url_action_perm(*, process_name: str, action_name: str, permission_codename:
     def decorator(view_func):
         @wraps(view_func)
         def wrapper(self, request, *args, **kwargs):
-            user = request.user
-            last_company_id = user.last_company_logged_in
-            if not last_company_id:
-                return Response(error_response(message=err_message.EMPTY_COMPANY), status=status.HTTP_404_NOT_FOUND)
-            company_groups = user.company_groups.all()
-            process = Process.objects.filter(name=process_name, company_id=last_company_id).last()
-            if not process:
-                return Response(error_response(message=err_message.NOT_FOUND_PROCESS_MESSAGE.format(process_name=process_name)), status=status.HTTP_404_NOT_FOUND)
-
-            all_action_permissions = GroupObjectPermission.objects.filter(group_id__in=company_groups, permission__codename=permission_codename, content_type__model='action')
-            if not all_action_permissions:
-                return Response(error_response(message=err_message.UNAUTHORIZED_ACTION), status=status.HTTP_401_UNAUTHORIZED)
-
-            action_ids = list(all_action_permissions.values_list('object_pk', flat=True))
-            has_permission = Action.objects.filter(pk__in=action_ids, code_name=action_name, process_id=process.id).last()
-            if not has_permission:
-                return Response(error_response(message=err_message.UNAUTHORIZED_ACTION), status=status.HTTP_401_UNAUTHORIZED)
+            with tracing.span('url_action_perm', **{
+                'url_action_perm.process': process_name,
+                'url_action_perm.action': action_name,
+            }) as span:
+                outcome, denied_response = _check_url_action_perm(
+                    user=request.user, token=getattr(request, 'auth', None), process_name=process_name,
+                    action_name=action_name, permission_codename=permission_codename)
+                span.set_attribute('url_action_perm.outcome', outcome)
+            URL_ACTION_PERM_CHECKS.labels(process=process_name, action=action_name, outcome=outcome).inc()
+            if denied_response is not None:
+                return denied_response
             return view_func(self, request, *args, **kwargs)
         return wrapper
     return decorator
-
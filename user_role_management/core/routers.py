@@ -0,0 +1,44 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+# On for the requests ReplicaRoutingMiddleware lets read from the replicas, turned
+# off by their first write so the rest of the request reads what it wrote
+_read_from_replicas: ContextVar[bool] = ContextVar('read_from_replicas', default=False)
+
+
+@contextmanager
+def replica_reads(enabled: bool = True):
+    token = _read_from_replicas.set(enabled)
+    try:
+        yield
+    finally:
+        _read_from_replicas.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Sends the reads of `replica_reads` blocks to a random DATABASE_REPLICAS alias
+    and everything else to the primary, also for instances loaded from a replica.
+    """
+
+    def db_for_read(self, model, **hints):
+        if settings.DATABASE_REPLICAS and _read_from_replicas.get():
+            return random.choice(settings.DATABASE_REPLICAS)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        _read_from_replicas.set(False)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replicas have the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -0,0 +1,112 @@
+import functools
+from contextlib import contextmanager
+
+from django.conf import settings
+
+# Set by configure_tracing(), spans are no-ops while it is None so nothing of
+# OpenTelemetry is imported or run unless TRACING_ENABLED is on.
+_tracer = None
+
+
+class _NoopSpan:
+    def set_attribute(self, key, value):
+        pass
+
+    def update_name(self, name):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def get_exporter():
+    if settings.TRACING_EXPORTER == 'file':
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+        # One JSON span per line, see README.md
+        return ConsoleSpanExporter(
+            out=open(settings.TRACING_FILE_PATH, 'a'),
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+    if settings.TRACING_EXPORTER == 'otlp':
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+    raise ValueError(f"Unknown TRACING_EXPORTER {settings.TRACING_EXPORTER!r}, expected 'otlp' or 'file'")
+
+
+def configure_tracing(exporter=None):
+    global _tracer
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    provider = TracerProvider(
+        resource=Resource.create({'service.name': settings.TRACING_SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATE)),
+    )
+    provider.add_span_processor(BatchSpanProcessor(exporter or get_exporter()))
+    _tracer = provider.get_tracer('user_role_management')
+    return provider
+
+
+@contextmanager
+def span(name: str, **attributes):
+    if _tracer is None:
+        yield _NOOP_SPAN
+        return
+    with _tracer.start_as_current_span(name, attributes=attributes) as current_span:
+        yield current_span
+
+
+@contextmanager
+def server_span(name: str, headers, **attributes):
+    """
+    Root span of a request, continuing the trace of an incoming `traceparent` header.
+    """
+    if _tracer is None:
+        yield _NOOP_SPAN
+        return
+    from opentelemetry import context, propagate
+    from opentelemetry.trace import SpanKind
+
+    token = context.attach(propagate.extract(headers))
+    try:
+        with _tracer.start_as_current_span(name, kind=SpanKind.SERVER, attributes=attributes) as current_span:
+            yield current_span
+    finally:
+        context.detach(token)
+
+
+def traced(func=None, *, name: str = None):
+    """
+    Runs the decorated function in a span named after it.
+    """
+    if func is None:
+        return functools.partial(traced, name=name)
+    span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _tracer is None:
+            return func(*args, **kwargs)
+        with _tracer.start_as_current_span(span_name):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def trace_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper running every query in a span.
+    """
+    connection = context['connection']
+    operation = sql.split(None, 1)[0].upper() if sql else 'QUERY'
+    with span(f"db {operation}", **{
+        'db.system': connection.vendor,
+        'db.name': connection.alias,
+        'db.statement': sql,
+        'db.operation': operation,
+    }):
+        return execute(sql, params, many, context)
@@ -9,7 +9,8 @@ from django.utils.translation import gettext_lazy as _
 from user_role_management.manage.models import Company_group
 from django.contrib.admin.widgets import FilteredSelectMultiple
 from django.shortcuts import get_object_or_404, redirect, render
-from user_role_management.guardian.models import GroupObjectPermission, UserObjectPermission
+from user_role_management.guardian.models import ActionGroupObjectPermission, GroupObjectPermission, \
+    ProcessGroupObjectPermission, UserObjectPermission
 from user_role_management.guardian.forms import GroupObjectPermissionsForm, UserObjectPermissionsForm
 from user_role_management.guardian.shortcuts import (get_group_perms, get_groups_with_perms, get_perms_for_model, get_user_perms,
                                 get_users_with_perms)
@@ -484,4 +485,10 @@ class GroupObjectPermissionAdmin(admin.ModelAdmin):
 @admin.register(UserObjectPermission)
 class UserObjectPermissionAdmin(admin.ModelAdmin):
     list_display = ['id', 'content_type', 'user', 'permission', 'object_pk']
-    list_display_links = ['id', 'content_type']
\ No newline at end of file
+    list_display_links = ['id', 'content_type']
+
+
+@admin.register(ActionGroupObjectPermission, ProcessGroupObjectPermission)
+class DirectGroupObjectPermissionAdmin(admin.ModelAdmin):
+    list_display = ['id', 'content_object', 'group', 'permission']
+    list_display_links = ['id', 'content_object']
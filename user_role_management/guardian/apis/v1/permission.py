@@ -6,11 +6,14 @@ from drf_spectacular.utils import extend_schema
 from user_role_management.api.mixins import ApiAuthMixin
 from user_role_management.guardian.services import permission as permission_services
 from user_role_management.guardian.selectors import permission as permission_selector
-from user_role_management.guardian.models.models import UserObjectPermission, GroupObjectPermission
+from user_role_management.guardian.utils import get_group_obj_perms_model, get_user_obj_perms_model
 from user_role_management.api.pagination import LimitOffsetPagination, get_paginated_response_context
 from user_role_management.core.exceptions import handle_validation_error, error_response, success_response
 from user_role_management.utils.serializer_handler import CustomSingleResponseSerializerBase, CustomMultiResponseSerializerBase
 
+UserObjectPermission = get_user_obj_perms_model()
+GroupObjectPermission = get_group_obj_perms_model()
+
 
 class OutPutUserObjectPermissionSerializer(serializers.ModelSerializer):
     class Meta:
@@ -228,3 +231,39 @@ class GroupObjectPermissionApi(ApiAuthMixin, APIView):
         except Exception as ex:
             response = error_response(message=str(ex))
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+
+class OutPutGroupObjectPermissionDiffSerializer(serializers.Serializer):
+    added = serializers.DictField(child=serializers.ListField(child=serializers.CharField()))
+    removed = serializers.DictField(child=serializers.ListField(child=serializers.CharField()))
+
+
+class CustomGroupObjectPermissionDiffResponseSerializer(CustomSingleResponseSerializerBase):
+    data = OutPutGroupObjectPermissionDiffSerializer()
+
+    class Meta:
+        fields = ('is_success', 'data')
+
+
+class GroupObjectPermissionSetApi(ApiAuthMixin, APIView):
+    class InputGroupObjectPermissionSetSerializer(serializers.Serializer):
+        group_id = serializers.IntegerField()
+        content_type_id = serializers.IntegerField()
+        permissions = serializers.DictField(child=serializers.ListField(child=serializers.CharField(max_length=100)))
+
+    @extend_schema(request=InputGroupObjectPermissionSetSerializer,
+                   responses=CustomGroupObjectPermissionDiffResponseSerializer, tags=['Permission'])
+    def put(self, request: HttpRequest):
+        serializer = self.InputGroupObjectPermissionSetSerializer(data=request.data)
+        validation_result = handle_validation_error(serializer=serializer)
+        if not isinstance(validation_result, bool):
+            return Response(validation_result, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            diff = permission_services.set_group_object_permissions(request=request, **serializer.validated_data)
+            if not diff['is_success']:
+                raise Exception(diff['message'])
+            return Response(CustomGroupObjectPermissionDiffResponseSerializer(diff, context={"request": request}).data)
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
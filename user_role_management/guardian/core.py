@@ -1,13 +1,14 @@
 from itertools import chain
 
-from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
 from django.db.models.query import QuerySet
 from django.utils.encoding import force_str
 
+from user_role_management.core.metrics import OBJECT_PERMISSION_CACHE_HIT, OBJECT_PERMISSION_CACHE_MISS
 from user_role_management.guardian.conf import settings as guardian_settings
 from user_role_management.guardian.ctypes import get_content_type
-from user_role_management.guardian.utils import get_group_obj_perms_model, get_identity, get_user_obj_perms_model
+from user_role_management.guardian.utils import get_group_obj_perms_model, get_identity, get_user_obj_perms_model, \
+    get_user_groups_field
 
 
 def _get_pks_model_and_ctype(objects):
@@ -78,7 +79,6 @@ class ObjectPermissionChecker:
         return perm in self.get_perms(obj)
 
     def get_group_filters(self, obj):
-        User = get_user_model()
         ctype = get_content_type(obj)
 
         group_model = get_group_obj_perms_model(obj)
@@ -86,7 +86,7 @@ class ObjectPermissionChecker:
         if self.user:
             fieldname = '{}__group__{}'.format(
                 group_rel_name,
-                User.groups.field.related_query_name(),
+                get_user_groups_field().related_query_name(),
             )
             group_filters = {fieldname: self.user}
         else:
@@ -152,7 +152,10 @@ class ObjectPermissionChecker:
 
         ctype = get_content_type(obj)
         key = self.get_local_cache_key(obj)
-        if key not in self._obj_perms_cache:
+        if key in self._obj_perms_cache:
+            OBJECT_PERMISSION_CACHE_HIT.inc()
+        else:
+            OBJECT_PERMISSION_CACHE_MISS.inc()
             # If auto-prefetching enabled, do not hit database
             if guardian_settings.AUTO_PREFETCH:
                 return []
@@ -188,7 +191,6 @@ class ObjectPermissionChecker:
         if self.user and not self.user.is_active:
             return []
 
-        User = get_user_model()
         pks, model, ctype = _get_pks_model_and_ctype(objects)
 
         if self.user and self.user.is_superuser:
@@ -206,7 +208,7 @@ class ObjectPermissionChecker:
 
         if self.user:
             fieldname = 'group__{}'.format(
-                User.groups.field.related_query_name(),
+                get_user_groups_field().related_query_name(),
             )
             group_filters = {fieldname: self.user}
         else:
@@ -254,7 +256,7 @@ class ObjectPermissionChecker:
 
         for perm in perms:
             if type(perm).objects.is_generic():
-                key = (ctype.id, perm.object_pk)
+                key = (ctype.id, force_str(perm.object_pk))
             else:
                 key = (ctype.id, force_str(perm.content_object_id))
 
@@ -269,9 +271,11 @@ class ObjectPermissionChecker:
             perms = qs.select_related('permission__codename').values_list('content_type_id', 'object_pk',
                                                                           'permission__codename')
             for p in perms:
-                if p[:2] not in cache:
-                    cache[p[:2]] = []
-                cache[p[:2]] += [p[2], ]
+                # Same keys as get_local_cache_key, object_pk is an int with integer object keys
+                key = (p[0], force_str(p[1]))
+                if key not in cache:
+                    cache[key] = []
+                cache[key] += [p[2], ]
         obj._guardian_perms_cache = cache
         return obj, cache
 
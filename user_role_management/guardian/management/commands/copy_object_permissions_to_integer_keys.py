@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from user_role_management.guardian.utils import copy_object_permissions_to_integer_keys
+
+
+class Command(BaseCommand):
+    """
+    copy_object_permissions_to_integer_keys command is a tiny wrapper around
+    :func:`guardian.utils.copy_object_permissions_to_integer_keys`.
+
+    Usage::
+
+        $ python manage.py copy_object_permissions_to_integer_keys
+        Copied 120000 group and 35 user object permissions, skipped 0 and 0 not integer keyed
+
+    Run it, restart with GUARDIAN_INTEGER_OBJECT_KEYS=true and run it again
+    for the rows written in between.
+    """
+    help = "Copies object permissions to the integer keyed object permission models"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, **options):
+        result = copy_object_permissions_to_integer_keys(batch_size=options['batch_size'])
+        if options['verbosity'] > 0:
+            self.stdout.write("Copied %d group and %d user object permissions, skipped %d and %d not integer keyed" % (
+                result['group'][0], result['user'][0], result['group'][1], result['user'][1]))
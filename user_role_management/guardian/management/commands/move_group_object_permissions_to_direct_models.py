@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from user_role_management.guardian.utils import move_group_object_permissions_to_direct_models
+
+
+class Command(BaseCommand):
+    """
+    move_group_object_permissions_to_direct_models command is a tiny wrapper
+    around :func:`guardian.utils.move_group_object_permissions_to_direct_models`.
+
+    Usage::
+
+        $ python manage.py move_group_object_permissions_to_direct_models
+        Moved 120000 action and 300 process group object permissions, left 12 and 0 orphaned
+
+    Run it once after the ``migrate`` creating the direct models, permissions on
+    actions and processes are only read from them, and again for the rows old
+    processes wrote meanwhile. Orphaned rows are left to ``clean_orphan_obj_perms``.
+    """
+    help = "Moves group object permissions on actions and processes to their direct foreign key models"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, **options):
+        result = move_group_object_permissions_to_direct_models(batch_size=options['batch_size'])
+        if options['verbosity'] > 0:
+            self.stdout.write("Moved %d action and %d process group object permissions, left %d and %d orphaned" % (
+                result['action'][0], result['process'][0], result['action'][1], result['process'][1]))
@@ -1,9 +1,10 @@
 from django.core.exceptions import FieldDoesNotExist
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from user_role_management.guardian.core import ObjectPermissionChecker
 from user_role_management.guardian.ctypes import get_content_type
 from user_role_management.guardian.exceptions import ObjectNotPersisted
+from user_role_management.guardian.signals import object_permissions_bulk_created
 from django.contrib.auth.models import Permission
 
 import warnings
@@ -78,6 +79,7 @@ class BaseObjectPermissionManager(models.Manager):
                     kwargs['content_object'] = instance
                 assigned_perms.append(self.model(**kwargs))
         self.model.objects.bulk_create(assigned_perms)
+        object_permissions_bulk_created.send(sender=self.model, users_or_groups=[user_or_group])
 
         return assigned_perms
 
@@ -107,7 +109,9 @@ class BaseObjectPermissionManager(models.Manager):
                 self.model(**kwargs)
             )
 
-        return self.model.objects.bulk_create(to_add)
+        created = self.model.objects.bulk_create(to_add)
+        object_permissions_bulk_created.send(sender=self.model, users_or_groups=users_or_groups)
+        return created
 
     def assign(self, perm, user_or_group, obj):
         """ Depreciated function name left in for compatibility"""
@@ -164,6 +168,74 @@ class BaseObjectPermissionManager(models.Manager):
 
         return self.filter(filters).delete()
 
+    def set_perms(self, user_or_group, ctype, perms):
+        """
+        Replaces the permission set of ``user_or_group`` for every object listed
+        in ``perms`` (a mapping of ``object_pk`` to iterable of codenames) with
+        exactly the given codenames. Objects not present in ``perms`` are left
+        untouched; an empty iterable revokes everything on that object.
+
+        The current rows are diffed against the requested ones and, inside one
+        transaction, removals are deleted with a single ``DELETE ... WHERE id IN``
+        and additions are inserted with ``bulk_create``.
+
+        Returns dictionary with ``added`` and ``removed`` keys, each mapping
+        ``object_pk`` to the sorted list of changed codenames.
+
+        Please note that, like ``bulk_remove_perm``, no ``post_delete`` signals
+        are fired for removed rows.
+        """
+        if self.is_generic():
+            object_field, object_filters = 'object_pk', {'content_type': ctype}
+        else:
+            object_field, object_filters = 'content_object_id', {}
+
+        requested = {str(pk): set(codenames) for pk, codenames in perms.items()}
+        ctype_perms = dict(Permission.objects.filter(content_type=ctype).values_list('codename', 'id'))
+        unknown = set().union(*requested.values()) - ctype_perms.keys()
+        if unknown:
+            raise Permission.DoesNotExist("Permissions %s do not exist for content type %s"
+                                          % (sorted(unknown), ctype))
+        codenames_by_id = {perm_id: codename for codename, perm_id in ctype_perms.items()}
+
+        wanted = {(pk, codename) for pk, codenames in requested.items() for codename in codenames}
+        with transaction.atomic(using=self.db):
+            current_rows = self.filter(**{
+                self.user_or_group_field: user_or_group,
+                **object_filters,
+                f'{object_field}__in': list(requested),
+            }).values_list('id', object_field, 'permission_id')
+            current = {(str(object_pk), codenames_by_id[perm_id]): row_id
+                       for row_id, object_pk, perm_id in current_rows}
+
+            to_remove = current.keys() - wanted
+            to_add = wanted - current.keys()
+            if to_remove:
+                self.filter(pk__in=[current[key] for key in to_remove]).delete()
+            if to_add:
+                self.bulk_create([
+                    self.model(**{
+                        self.user_or_group_field: user_or_group,
+                        'permission_id': ctype_perms[codename],
+                        **object_filters,
+                        object_field: pk,
+                    })
+                    for pk, codename in to_add
+                ])
+                object_permissions_bulk_created.send(sender=self.model, users_or_groups=[user_or_group])
+
+        return {
+            'added': _group_codenames_by_pk(to_add),
+            'removed': _group_codenames_by_pk(to_remove),
+        }
+
+
+def _group_codenames_by_pk(pairs):
+    grouped = {}
+    for pk, codename in sorted(pairs):
+        grouped.setdefault(pk, []).append(codename)
+    return grouped
+
 
 class UserObjectPermissionManager(BaseObjectPermissionManager):
     pass
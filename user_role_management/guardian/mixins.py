@@ -3,9 +3,7 @@ from collections.abc import Iterable
 from django.conf import settings
 from django.contrib.auth.decorators import login_required, REDIRECT_FIELD_NAME
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
-from user_role_management.guardian.utils import get_user_obj_perms_model
-UserObjectPermission = get_user_obj_perms_model()
-from user_role_management.guardian.utils import get_40x_or_None, get_anonymous_user
+from user_role_management.guardian.utils import get_40x_or_None, get_anonymous_user, get_user_obj_perms_model
 from user_role_management.guardian.shortcuts import get_objects_for_user
 
 
@@ -220,10 +218,10 @@ class GuardianUserMixin:
         return get_anonymous_user()
 
     def add_obj_perm(self, perm, obj):
-        return UserObjectPermission.objects.assign_perm(perm, self, obj)
+        return get_user_obj_perms_model().objects.assign_perm(perm, self, obj)
 
     def del_obj_perm(self, perm, obj):
-        return UserObjectPermission.objects.remove_perm(perm, self, obj)
+        return get_user_obj_perms_model().objects.remove_perm(perm, self, obj)
 
 
 class PermissionListMixin:
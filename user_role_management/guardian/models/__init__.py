@@ -1,12 +1,17 @@
 from .models import (
     BaseObjectPermission,
     BaseGenericObjectPermission,
+    BaseIntegerGenericObjectPermission,
     UserObjectPermissionBase,
     UserObjectPermissionAbstract,
     UserObjectPermission,
     GroupObjectPermissionBase,
     GroupObjectPermissionAbstract,
     GroupObjectPermission,
+    IntegerUserObjectPermission,
+    IntegerGroupObjectPermission,
+    ActionGroupObjectPermission,
+    ProcessGroupObjectPermission,
     Permission,
     Company_group
 )
@@ -15,6 +20,7 @@ from .models import (
 __all__ = [
     'BaseObjectPermission',
     'BaseGenericObjectPermission',
+    'BaseIntegerGenericObjectPermission',
     'UserObjectPermissionBase',
     'UserObjectPermissionAbstract',
     'GroupObjectPermissionBase',
@@ -22,5 +28,9 @@ __all__ = [
     'Permission',
     'Company_group',
     'UserObjectPermission',
-    'GroupObjectPermission'
+    'GroupObjectPermission',
+    'IntegerUserObjectPermission',
+    'IntegerGroupObjectPermission',
+    'ActionGroupObjectPermission',
+    'ProcessGroupObjectPermission'
 ]
@@ -7,6 +7,7 @@ from django.utils.translation import gettext_lazy as _
 from django.contrib.contenttypes.models import ContentType
 from user_role_management.manage.models import Company_group
 from user_role_management.utils.services import create_fields
+from user_role_management.common.services import model_update_by_id
 from django.contrib.contenttypes.fields import GenericForeignKey
 from user_role_management.guardian.compat import user_model_label
 from user_role_management.guardian.ctypes import get_content_type
@@ -51,6 +52,23 @@ class BaseGenericObjectPermission(models.Model):
         ]
 
 
+class BaseIntegerGenericObjectPermission(models.Model):
+    """
+    Generic object permission keyed by a bigint `object_pk`, for object models
+    with integer primary keys (all of ours). Object ids are joined without casts
+    and the indexes are smaller. Enabled with GUARDIAN_INTEGER_OBJECT_KEYS.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_pk = models.BigIntegerField(_('object ID'))
+    content_object = GenericForeignKey(fk_field='object_pk')
+
+    class Meta:
+        abstract = True
+        indexes = [
+            models.Index(fields=['content_type', 'object_pk']),
+        ]
+
+
 class UserObjectPermissionBase(BaseObjectPermission):
     """
     **Manager**: :manager:`UserObjectPermissionManager`
@@ -75,6 +93,12 @@ class UserObjectPermission(UserObjectPermissionAbstract):
 
     class Meta(UserObjectPermissionAbstract.Meta):
         abstract = False
+        indexes = [
+            *UserObjectPermissionAbstract.Meta.indexes,
+            # Object permissions of a user on a model, get_perms / get_objects_for_user
+            models.Index(fields=['user', 'content_type', 'permission'], include=['object_pk'],
+                         name='guardian_uop_user_ct_perm_idx'),
+        ]
 
 
     @classmethod
@@ -89,10 +113,7 @@ class UserObjectPermission(UserObjectPermissionAbstract):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -135,6 +156,13 @@ class GroupObjectPermission(GroupObjectPermissionAbstract):
 
     class Meta(GroupObjectPermissionAbstract.Meta):
         abstract = False
+        indexes = [
+            *GroupObjectPermissionAbstract.Meta.indexes,
+            # `group_id IN (...) AND permission_id = ... AND content_type_id = ...` of url_action_perm and
+            # get_objects_for_user, object_pk is included so the object ids come from the index alone
+            models.Index(fields=['group', 'permission', 'content_type'], include=['object_pk'],
+                         name='guardian_gop_grp_perm_ct_idx'),
+        ]
 
     @classmethod
     def _create(cls, **kwargs: Dict[str, Any]) -> Dict[str, Literal['is_success', True, False]]:
@@ -148,10 +176,7 @@ class GroupObjectPermission(GroupObjectPermissionAbstract):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -169,3 +194,171 @@ class GroupObjectPermission(GroupObjectPermissionAbstract):
 
     # def __str__(self):
     #     return f"{self.process}_{self.title}"
+
+
+class IntegerUserObjectPermission(UserObjectPermissionBase, BaseIntegerGenericObjectPermission):
+
+    class Meta(UserObjectPermissionBase.Meta, BaseIntegerGenericObjectPermission.Meta):
+        abstract = False
+        unique_together = ['user', 'permission', 'object_pk']
+        indexes = [
+            *BaseIntegerGenericObjectPermission.Meta.indexes,
+            models.Index(fields=['user', 'content_type', 'permission'], include=['object_pk'],
+                         name='guardian_iuop_user_ct_perm_idx'),
+        ]
+
+    @classmethod
+    def _create(cls, **kwargs: Dict[str, Any]) -> Dict[str, Literal['is_success', True, False]]:
+        try:
+            fields = create_fields(**kwargs)
+            new = cls.objects.create(**fields)
+            return success_response(data=new)
+        except Exception as ex:
+            return error_response(message=str(ex))
+
+    @classmethod
+    def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
+        try:
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
+            return success_response(data=obj)
+        except Exception as ex:
+            return error_response(message=str(ex))
+
+    @classmethod
+    def _get_all(cls) -> QuerySet['IntegerUserObjectPermission']:
+        return cls.objects.all()
+
+    @classmethod
+    def _get_by_id(cls, id: int) -> Optional['IntegerUserObjectPermission']:
+        try:
+            return cls.objects.get(id=id)
+        except cls.DoesNotExist:
+            return None
+
+
+class IntegerGroupObjectPermission(GroupObjectPermissionBase, BaseIntegerGenericObjectPermission):
+
+    class Meta(GroupObjectPermissionBase.Meta, BaseIntegerGenericObjectPermission.Meta):
+        abstract = False
+        unique_together = ['group', 'permission', 'object_pk']
+        indexes = [
+            *BaseIntegerGenericObjectPermission.Meta.indexes,
+            models.Index(fields=['group', 'permission', 'content_type'], include=['object_pk'],
+                         name='guardian_igop_grp_perm_ct_idx'),
+        ]
+
+    @classmethod
+    def _create(cls, **kwargs: Dict[str, Any]) -> Dict[str, Literal['is_success', True, False]]:
+        try:
+            fields = create_fields(**kwargs)
+            new = cls.objects.create(**fields)
+            return success_response(data=new)
+        except Exception as ex:
+            return error_response(message=str(ex))
+
+    @classmethod
+    def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
+        try:
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
+            return success_response(data=obj)
+        except Exception as ex:
+            return error_response(message=str(ex))
+
+    @classmethod
+    def _get_all(cls) -> QuerySet['IntegerGroupObjectPermission']:
+        return cls.objects.all()
+
+    @classmethod
+    def _get_by_id(cls, id: int) -> Optional['IntegerGroupObjectPermission']:
+        try:
+            return cls.objects.get(id=id)
+        except cls.DoesNotExist:
+            return None
+
+
+class ActionGroupObjectPermission(GroupObjectPermissionBase):
+    """
+    Group permissions on actions, with a real foreign key to the action instead of
+    the generic `content_type`/`object_pk` pair. `get_group_obj_perms_model(Action)`
+    returns it, so the shortcuts and the checker use it for actions.
+    """
+    content_object = models.ForeignKey('manage.Action', on_delete=models.CASCADE,
+                                       related_name='group_object_permissions')
+
+    class Meta(GroupObjectPermissionBase.Meta):
+        abstract = False
+        indexes = [
+            # The unique (group, permission, content_object) index serves url_action_perm,
+            # this one the permissions of the groups on a given action
+            models.Index(fields=['content_object', 'group'], name='guardian_agop_action_grp_idx'),
+        ]
+
+    @classmethod
+    def _create(cls, **kwargs: Dict[str, Any]) -> Dict[str, Literal['is_success', True, False]]:
+        try:
+            fields = create_fields(**kwargs)
+            new = cls.objects.create(**fields)
+            return success_response(data=new)
+        except Exception as ex:
+            return error_response(message=str(ex))
+
+    @classmethod
+    def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
+        try:
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
+            return success_response(data=obj)
+        except Exception as ex:
+            return error_response(message=str(ex))
+
+    @classmethod
+    def _get_all(cls) -> QuerySet['ActionGroupObjectPermission']:
+        return cls.objects.all()
+
+    @classmethod
+    def _get_by_id(cls, id: int) -> Optional['ActionGroupObjectPermission']:
+        try:
+            return cls.objects.get(id=id)
+        except cls.DoesNotExist:
+            return None
+
+
+class ProcessGroupObjectPermission(GroupObjectPermissionBase):
+    """
+    Group permissions on processes, see `ActionGroupObjectPermission`.
+    """
+    content_object = models.ForeignKey('manage.Process', on_delete=models.CASCADE,
+                                       related_name='group_object_permissions')
+
+    class Meta(GroupObjectPermissionBase.Meta):
+        abstract = False
+        indexes = [
+            models.Index(fields=['content_object', 'group'], name='guardian_pgop_process_grp_idx'),
+        ]
+
+    @classmethod
+    def _create(cls, **kwargs: Dict[str, Any]) -> Dict[str, Literal['is_success', True, False]]:
+        try:
+            fields = create_fields(**kwargs)
+            new = cls.objects.create(**fields)
+            return success_response(data=new)
+        except Exception as ex:
+            return error_response(message=str(ex))
+
+    @classmethod
+    def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
+        try:
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
+            return success_response(data=obj)
+        except Exception as ex:
+            return error_response(message=str(ex))
+
+    @classmethod
+    def _get_all(cls) -> QuerySet['ProcessGroupObjectPermission']:
+        return cls.objects.all()
+
+    @classmethod
+    def _get_by_id(cls, id: int) -> Optional['ProcessGroupObjectPermission']:
+        try:
+            return cls.objects.get(id=id)
+        except cls.DoesNotExist:
+            return None
@@ -1,19 +1,65 @@
 from django.http import HttpRequest
-from typing import Dict, Literal
-from user_role_management.guardian.models.models import UserObjectPermission, GroupObjectPermission
+from typing import Dict, Iterable, Literal, Optional
+from django.contrib.contenttypes.models import ContentType
+from user_role_management.manage.models import Company_group
+from user_role_management.guardian.shortcuts import set_group_object_perms
+from user_role_management.core.exceptions import error_response, success_response
+from user_role_management.guardian.utils import get_group_obj_perms_model, get_user_obj_perms_model
 
 
 def create_user_object_permission(*, request: HttpRequest, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
-    return UserObjectPermission._create(**kwargs)
+    return get_user_obj_perms_model()._create(**kwargs)
 
 
 def update_user_object_permission(*, request: HttpRequest, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
-    return UserObjectPermission._update(id=id, **kwargs)
+    return get_user_obj_perms_model()._update(id=id, **kwargs)
+
+
+def _check_generic_content_type(
+    content_type_id: Optional[int]
+) -> Optional[Dict[str, Literal['is_success', True, False]]]:
+    """
+    The error response for a content type with a direct object permission model,
+    actions and processes: nothing reads their grants from the generic model.
+    """
+    if content_type_id is None:
+        return None
+    try:
+        model_class = ContentType.objects.get_for_id(content_type_id).model_class()
+    except ContentType.DoesNotExist:
+        return error_response(message="There are no record")
+    direct_model = get_group_obj_perms_model(model_class)
+    if direct_model is not get_group_obj_perms_model():
+        return error_response(message=f"Permissions on {model_class._meta.verbose_name_plural} are stored in "
+                                      f"{direct_model.__name__}, set them with group_object_permission/set/")
+    return None
 
 
 def create_group_object_permission(*, request: HttpRequest, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
-    return GroupObjectPermission._create(**kwargs)
+    error = _check_generic_content_type(kwargs.get('content_type_id'))
+    if error is not None:
+        return error
+    return get_group_obj_perms_model()._create(**kwargs)
 
 
 def update_group_object_permission(*, request: HttpRequest, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
-    return GroupObjectPermission._update(id=id, **kwargs)
+    error = _check_generic_content_type(kwargs.get('content_type_id'))
+    if error is not None:
+        return error
+    return get_group_obj_perms_model()._update(id=id, **kwargs)
+
+
+def set_group_object_permissions(
+    *,
+    request: HttpRequest,
+    group_id: int,
+    content_type_id: int,
+    permissions: Dict[str, Iterable[str]]
+) -> Dict[str, Literal['is_success', True, False]]:
+    try:
+        group = Company_group.objects.get(id=group_id)
+        ctype = ContentType.objects.get_for_id(content_type_id)
+        diff = set_group_object_perms(group, ctype, permissions)
+        return success_response(data=diff)
+    except Exception as ex:
+        return error_response(message=str(ex))
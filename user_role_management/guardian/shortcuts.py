@@ -27,12 +27,12 @@ from django.db.models import (
     SmallIntegerField,
     UUIDField,
 )
+from user_role_management.core.instrumentation import instrument
 from user_role_management.guardian.core import ObjectPermissionChecker
 from user_role_management.guardian.ctypes import get_content_type
 from user_role_management.guardian.exceptions import MixedContentTypeError, WrongAppError, MultipleIdentityAndObjectError
-from user_role_management.guardian.utils import get_anonymous_user, get_group_obj_perms_model, get_identity, get_user_obj_perms_model
-GroupObjectPermission = get_group_obj_perms_model()
-UserObjectPermission = get_user_obj_perms_model()
+from user_role_management.guardian.utils import get_anonymous_user, get_group_obj_perms_model, get_identity, \
+    get_user_obj_perms_model, get_user_groups_field, has_integer_object_pk
 
 
 def assign_perm(perm, user_or_group, obj=None):
@@ -198,6 +198,34 @@ def remove_perm(perm, user_or_group=None, obj=None):
         return model.objects.remove_perm(perm, group, obj)
 
 
+def set_group_object_perms(group, ctype, perms):
+    """
+    Replaces object permissions of ``group`` for given objects in one go.
+
+    :param group: ``Company_group`` instance whose permissions are replaced.
+
+    :param ctype: ``ContentType`` instance (or model class / instance) of the
+      objects listed in ``perms``.
+
+    :param perms: mapping of ``object_pk`` to iterable of permission codenames
+      the group should have on that object afterwards. Objects missing from
+      the mapping are left untouched, an empty iterable revokes all of them.
+
+    Returns the applied diff as ``{'added': {pk: [...]}, 'removed': {pk: [...]}}``.
+
+    Example::
+
+        >>> from user_role_management.guardian.shortcuts import set_group_object_perms
+        >>> set_group_object_perms(group, Action, {1: {'dg_can_do_this_action'}, 2: set()})
+        {'added': {'1': ['dg_can_do_this_action']}, 'removed': {'2': ['dg_can_do_this_action']}}
+
+    """
+    if not isinstance(ctype, ContentType):
+        ctype = get_content_type(ctype)
+    model = get_group_obj_perms_model(ctype.model_class())
+    return model.objects.set_perms(group, ctype, perms)
+
+
 def get_perms(user_or_group, obj):
     """
     Returns permissions for given user/group and object pair, as list of
@@ -318,7 +346,7 @@ def get_users_with_perms(obj, attach_perms=False, with_superusers=False,
                     'permission_id__in': permission_ids,
                     })
             group_ids = set(group_model.objects.filter(**group_obj_perm_filters).values_list('group_id', flat=True).distinct())
-            qset = qset | Q(groups__in=group_ids)
+            qset = qset | Q(**{'%s__in' % get_user_groups_field().name: group_ids})
         if with_superusers:
             qset = qset | Q(is_superuser=True)
         return get_user_model().objects.filter(qset).distinct()
@@ -383,7 +411,7 @@ def get_groups_with_perms(obj, attach_perms=False):
         group_perms_mapping = defaultdict(list)
         groups_with_perms = get_groups_with_perms(obj)
         qs = group_model.objects.filter(group__in=groups_with_perms).prefetch_related('group', 'permission')
-        if group_model is GroupObjectPermission:
+        if group_model is get_group_obj_perms_model():
             qs = qs.filter(object_pk=obj.pk, content_type=ctype)
         else:
             qs = qs.filter(content_object_id=obj.pk)
@@ -393,6 +421,7 @@ def get_groups_with_perms(obj, attach_perms=False):
         return dict(group_perms_mapping)
 
 
+@instrument
 def get_objects_for_user(user, perms, klass=None, use_groups=True, any_perm=False,
                          with_superuser=True, accept_global_perms=True):
     """
@@ -595,7 +624,7 @@ def get_objects_for_user(user, perms, klass=None, use_groups=True, any_perm=Fals
         group_model = get_group_obj_perms_model(queryset.model)
         group_filters = {
             'permission__content_type': ctype,
-            'group__%s' % get_user_model().groups.field.related_query_name(): user,
+            'group__%s' % get_user_groups_field().related_query_name(): user,
         }
         if len(codenames):
             group_filters.update({
@@ -630,7 +659,7 @@ def get_objects_for_user(user, perms, klass=None, use_groups=True, any_perm=Fals
     field_pk = user_fields[0]
     values = user_obj_perms_queryset
 
-    handle_pk_field = _handle_pk_field(queryset)
+    handle_pk_field = _handle_pk_field(queryset, user_model)
     if handle_pk_field is not None:
         values = values.annotate(obj_pk=handle_pk_field(expression=field_pk))
         field_pk = 'obj_pk'
@@ -640,6 +669,7 @@ def get_objects_for_user(user, perms, klass=None, use_groups=True, any_perm=Fals
     if use_groups:
         field_pk = group_fields[0]
         values = groups_obj_perms_queryset
+        handle_pk_field = _handle_pk_field(queryset, group_model)
         if handle_pk_field is not None:
             values = values.annotate(obj_pk=handle_pk_field(expression=field_pk))
             field_pk = 'obj_pk'
@@ -792,7 +822,7 @@ def get_objects_for_group(group, perms, klass=None, any_perm=False, accept_globa
     field_pk = fields[0]
     values = groups_obj_perms_queryset
 
-    handle_pk_field = _handle_pk_field(queryset)
+    handle_pk_field = _handle_pk_field(queryset, group_model)
     if handle_pk_field is not None:
         values = values.annotate(obj_pk=handle_pk_field(expression=field_pk))
         field_pk = 'obj_pk'
@@ -801,7 +831,12 @@ def get_objects_for_group(group, perms, klass=None, any_perm=False, accept_globa
     return queryset.filter(pk__in=values)
 
 
-def _handle_pk_field(queryset):
+def _handle_pk_field(queryset, obj_perms_model=None):
+    # Integer object keys are compared to the primary keys as they are
+    if obj_perms_model is not None and obj_perms_model.objects.is_generic() \
+            and has_integer_object_pk(obj_perms_model):
+        return None
+
     pk = queryset.model._meta.pk
 
     if isinstance(pk, ForeignKey):
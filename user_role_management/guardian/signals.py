@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent by the object permission managers after they ``bulk_create`` rows, which
+# fires no ``post_save``. Receives the ``users_or_groups`` the rows were created for.
+object_permissions_bulk_created = Signal()
@@ -20,13 +20,14 @@ from user_role_management.guardian.shortcuts import get_users_with_perms
 from user_role_management.guardian.shortcuts import get_groups_with_perms
 from user_role_management.guardian.shortcuts import get_objects_for_user
 from user_role_management.guardian.shortcuts import get_objects_for_group
+from user_role_management.guardian.shortcuts import set_group_object_perms
 from user_role_management.guardian.exceptions import MixedContentTypeError
 from user_role_management.guardian.exceptions import NotUserNorGroup
 from user_role_management.guardian.exceptions import WrongAppError
 from user_role_management.guardian.exceptions import MultipleIdentityAndObjectError
 from user_role_management.guardian.testapp.models import CharPKModel, ChildTestModel, UUIDPKModel
 from user_role_management.guardian.testapp.tests.test_core import ObjectPermissionTestCase
-from user_role_management.guardian.models import Permission, Company_group
+from user_role_management.guardian.models import Permission, Company_group, GroupObjectPermission
 
 
 User = get_user_model()
@@ -293,6 +294,57 @@ class RemovePermTest(ObjectPermissionTestCase):
         self.assertFalse(perm_obj in self.group.permissions.all())
 
 
+class SetGroupObjectPermsTest(TestCase):
+
+    def setUp(self):
+        from django.contrib.auth.models import Group
+        from user_role_management.manage.models import Company
+        self.company, self.other = Company.objects.create(title='acme'), Company.objects.create(title='other')
+        self.group = Company_group.objects.create(company=self.company, group=Group.objects.create(name='editors'))
+        self.ctype = ContentType.objects.get_for_model(Company)
+
+    def get_current(self):
+        return set(GroupObjectPermission.objects.filter(group=self.group)
+                   .values_list('object_pk', 'permission__codename'))
+
+    def test_adds_and_removes_in_one_call(self):
+        assign_perm('change_company', self.group, self.company)
+        assign_perm('view_company', self.group, self.other)
+
+        diff = set_group_object_perms(self.group, self.ctype, {
+            self.company.pk: {'view_company'},
+            self.other.pk: [],
+        })
+
+        self.assertEqual(diff, {
+            'added': {str(self.company.pk): ['view_company']},
+            'removed': {str(self.company.pk): ['change_company'], str(self.other.pk): ['view_company']},
+        })
+        self.assertEqual(self.get_current(), {(str(self.company.pk), 'view_company')})
+
+    def test_objects_missing_from_mapping_are_untouched(self):
+        assign_perm('view_company', self.group, self.other)
+
+        set_group_object_perms(self.group, self.ctype, {self.company.pk: {'view_company'}})
+
+        self.assertEqual(self.get_current(), {
+            (str(self.company.pk), 'view_company'),
+            (str(self.other.pk), 'view_company'),
+        })
+
+    def test_unchanged_set_is_noop(self):
+        assign_perm('view_company', self.group, self.company)
+
+        diff = set_group_object_perms(self.group, self.ctype, {self.company.pk: {'view_company'}})
+
+        self.assertEqual(diff, {'added': {}, 'removed': {}})
+
+    def test_unknown_codename(self):
+        with self.assertRaises(Permission.DoesNotExist):
+            set_group_object_perms(self.group, self.ctype, {self.company.pk: {'fly_company'}})
+        self.assertEqual(self.get_current(), set())
+
+
 class GetPermsTest(ObjectPermissionTestCase):
     """
     Tests get_perms function (already done at core tests but left here as a
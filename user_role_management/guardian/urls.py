@@ -8,5 +8,7 @@ urlpatterns = [
 
     path('group_object_permission/', permission.GroupObjectPermissionsApi.as_view(), name="group_object_permissions"),
     path('group_object_permission/<int:group_object_permission_id>', permission.GroupObjectPermissionApi.as_view(), name="group_object_permission"),
+    path('group_object_permission/set/', permission.GroupObjectPermissionSetApi.as_view(),
+         name="group_object_permission_set"),
 
 ]
@@ -14,7 +14,8 @@ from django.contrib.auth import REDIRECT_FIELD_NAME, get_user_model
 from django.contrib.auth.models import AnonymousUser
 from user_role_management.manage.models import Company_group
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
-from django.db.models import Model, QuerySet
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import IntegerField, Model, QuerySet
 from django.http import HttpResponseForbidden, HttpResponseNotFound
 from django.shortcuts import render
 from user_role_management.guardian.conf import settings as guardian_settings
@@ -182,6 +183,89 @@ def clean_orphan_obj_perms():
     return deleted
 
 
+def copy_object_permissions_to_integer_keys(batch_size=5000):
+    """
+    Copies the rows of the string keyed ``UserObjectPermission`` and
+    ``GroupObjectPermission`` to their integer keyed counterparts, in batches
+    of ``batch_size`` rows. Rows already copied are skipped so it can be run
+    again for the rows written meanwhile, rows whose ``object_pk`` is not an
+    integer (objects with uuid primary keys) are left out.
+
+    Returns ``{'user': (copied, skipped), 'group': (copied, skipped)}``.
+    """
+    from user_role_management.guardian.models import GroupObjectPermission, IntegerGroupObjectPermission, \
+        IntegerUserObjectPermission, UserObjectPermission
+
+    result = {}
+    for key, source, target, owner_field in (
+        ('user', UserObjectPermission, IntegerUserObjectPermission, 'user_id'),
+        ('group', GroupObjectPermission, IntegerGroupObjectPermission, 'group_id'),
+    ):
+        copied = skipped = 0
+        last_id = 0
+        while True:
+            rows = list(source.objects.filter(id__gt=last_id).order_by('id').values_list(
+                'id', owner_field, 'permission_id', 'content_type_id', 'object_pk')[:batch_size])
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            objects = [target(**{owner_field: owner_id}, permission_id=permission_id, content_type_id=content_type_id,
+                              object_pk=int(object_pk))
+                       for _, owner_id, permission_id, content_type_id, object_pk in rows if object_pk.isdigit()]
+            with transaction.atomic():
+                target.objects.bulk_create(objects, ignore_conflicts=True)
+            copied += len(objects)
+            skipped += len(rows) - len(objects)
+        result[key] = (copied, skipped)
+    return result
+
+
+def move_group_object_permissions_to_direct_models(batch_size=5000, using=DEFAULT_DB_ALIAS):
+    """
+    Moves the group object permissions on actions and processes from the
+    generic ``GroupObjectPermission`` and ``IntegerGroupObjectPermission``
+    to ``ActionGroupObjectPermission`` and ``ProcessGroupObjectPermission``,
+    in batches of ``batch_size`` rows. Rows already in the direct model are
+    only deleted, rows pointing at objects which no longer exist are left for
+    ``clean_orphan_obj_perms``. It can be run again for the rows written by
+    processes started before the direct models existed.
+
+    Returns ``{'action': (moved, orphaned), 'process': (moved, orphaned)}``.
+    """
+    from user_role_management.guardian.models import ActionGroupObjectPermission, GroupObjectPermission, \
+        IntegerGroupObjectPermission, ProcessGroupObjectPermission
+
+    result = {}
+    for target in (ActionGroupObjectPermission, ProcessGroupObjectPermission):
+        object_model = target._meta.get_field('content_object').remote_field.model
+        content_type = get_content_type(object_model)
+        moved = orphaned = 0
+        for source in (GroupObjectPermission, IntegerGroupObjectPermission):
+            last_id = 0
+            while True:
+                rows = list(source.objects.using(using).filter(content_type=content_type, id__gt=last_id)
+                            .order_by('id').values_list('id', 'group_id', 'permission_id', 'object_pk')[:batch_size])
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                object_pks = {int(object_pk) for _, _, _, object_pk in rows if str(object_pk).isdigit()}
+                existing = set(object_model.objects.using(using).filter(pk__in=object_pks)
+                               .values_list('pk', flat=True))
+                rows = [row for row in rows if str(row[3]).isdigit() and int(row[3]) in existing]
+                objects = [target(group_id=group_id, permission_id=permission_id, content_object_id=int(object_pk))
+                           for _, group_id, permission_id, object_pk in rows]
+                with transaction.atomic(using=using):
+                    # ignore_conflicts doesn't tell how many rows it inserted
+                    targets = target.objects.using(using).filter(content_object_id__in=existing)
+                    before = targets.count()
+                    target.objects.using(using).bulk_create(objects, ignore_conflicts=True)
+                    moved += targets.count() - before
+                    source.objects.using(using).filter(id__in=[row[0] for row in rows]).delete()
+            orphaned += source.objects.using(using).filter(content_type=content_type).count()
+        result[object_model._meta.model_name] = (moved, orphaned)
+    return result
+
+
 # TODO: should raise error when multiple UserObjectPermission direct relations
 # are defined
 
@@ -238,6 +322,22 @@ def get_group_obj_perms_model(obj = None):
     return get_obj_perms_model(obj, GroupObjectPermissionBase, GroupObjectPermission)
 
 
+def has_integer_object_pk(model) -> bool:
+    """
+    Whether the generic object permission ``model`` keys objects by an integer
+    ``object_pk``, which is then compared to integer primary keys without casts.
+    """
+    return isinstance(model._meta.get_field('object_pk'), IntegerField)
+
+
+def get_user_groups_field():
+    """
+    Returns the user field holding the ``Company_group`` instances a user
+    belongs to, which is what group object permissions point at.
+    """
+    return get_user_model().company_groups.field
+
+
 def evict_obj_perms_cache(obj):
     if hasattr(obj, '_guardian_perms_cache'):
         delattr(obj, '_guardian_perms_cache')
@@ -109,6 +109,20 @@ class ActionAdmin(GuardedModelAdmin):
     list_display_links = ['id', 'name', 'code_name']
 
 
+@admin.register(models.Role_template)
+class RoleTemplateAdmin(admin.ModelAdmin):
+    list_display = ['id', 'name', 'group', 'source_company_group']
+    list_display_links = ['id', 'name']
+
+    filter_horizontal = ("permissions",)
+
+
+@admin.register(models.Role_template_object_permission)
+class RoleTemplateObjectPermissionAdmin(admin.ModelAdmin):
+    list_display = ['id', 'role_template', 'permission', 'process_name', 'action_code_name']
+    list_display_links = ['id', 'role_template']
+
+
 @admin.register(models.Order)
 class OrdersAdmin(GuardedModelAdmin):
     list_display = ['id', 'customer', 'order_total']
@@ -425,3 +425,106 @@ class CompanyBranchApi(ApiAuthMixin, APIView):
         except Exception as ex:
             response = error_response(message=str(ex))
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+
+# =================================================================
+
+class OutPutCompanyProvisioningSerializer(serializers.Serializer):
+    task_id = serializers.CharField()
+    state = serializers.CharField()
+    progress = serializers.DictField(required=False, allow_null=True)
+    result = serializers.DictField(required=False, allow_null=True)
+    error = serializers.CharField(required=False, allow_null=True)
+
+
+class CustomCompanyProvisioningSingleResponseSerializer(CustomSingleResponseSerializerBase):
+    data = OutPutCompanyProvisioningSerializer()
+
+    class Meta:
+        fields = ('is_success', 'data')
+
+
+class CompanyProvisioningsApi(ApiAuthMixin, APIView):
+    class InputGroupSpecSerializer(serializers.Serializer):
+        name = serializers.CharField(max_length=150)
+        permissions = serializers.ListField(child=serializers.CharField(max_length=255), required=False)
+
+    class InputActionSpecSerializer(serializers.Serializer):
+        name = serializers.CharField(max_length=355)
+        code_name = serializers.CharField(max_length=255)
+        route = serializers.CharField(max_length=355, required=False, allow_null=True)
+
+    class InputProcessSpecSerializer(serializers.Serializer):
+        name = serializers.CharField(max_length=255)
+        actions = serializers.ListField(required=False)
+
+        def validate_actions(self, actions):
+            serializer = CompanyProvisioningsApi.InputActionSpecSerializer(data=actions, many=True)
+            serializer.is_valid(raise_exception=True)
+            return serializer.validated_data
+
+    class InputPositionSpecSerializer(serializers.Serializer):
+        title = serializers.CharField(max_length=255)
+        abbreviation = serializers.CharField(max_length=55, required=False, allow_null=True)
+
+    class InputDepartmentSpecSerializer(serializers.Serializer):
+        department = serializers.CharField(max_length=255)
+        parent_department = serializers.CharField(max_length=255, required=False, allow_null=True)
+
+    class InputCompanyProvisioningSerializer(serializers.Serializer):
+        title = serializers.CharField(max_length=155)
+        groups = serializers.ListField(required=False)
+        processes = serializers.ListField(required=False)
+        positions = serializers.ListField(required=False)
+        departments = serializers.ListField(required=False)
+        role_templates = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+        def _validate_items(self, serializer_class, items):
+            serializer = serializer_class(data=items, many=True)
+            serializer.is_valid(raise_exception=True)
+            return serializer.validated_data
+
+        def validate_groups(self, groups):
+            return self._validate_items(CompanyProvisioningsApi.InputGroupSpecSerializer, groups)
+
+        def validate_processes(self, processes):
+            return self._validate_items(CompanyProvisioningsApi.InputProcessSpecSerializer, processes)
+
+        def validate_positions(self, positions):
+            return self._validate_items(CompanyProvisioningsApi.InputPositionSpecSerializer, positions)
+
+        def validate_departments(self, departments):
+            return self._validate_items(CompanyProvisioningsApi.InputDepartmentSpecSerializer, departments)
+
+    @extend_schema(request=InputCompanyProvisioningSerializer,
+                   responses=CustomCompanyProvisioningSingleResponseSerializer, tags=['Company'])
+    def post(self, request: HttpRequest):
+        serializer = self.InputCompanyProvisioningSerializer(data=request.data)
+        validation_result = handle_validation_error(serializer=serializer)
+        if not isinstance(validation_result, bool):
+            return Response(validation_result, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            provisioning = company_services.submit_company_provisioning(request=request, spec=serializer.validated_data)
+            if not provisioning['is_success']:
+                raise Exception(provisioning['message'])
+            return Response(CustomCompanyProvisioningSingleResponseSerializer(provisioning,
+                                                                              context={"request": request}).data,
+                            status=status.HTTP_202_ACCEPTED)
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+
+class CompanyProvisioningApi(ApiAuthMixin, APIView):
+
+    @extend_schema(responses=CustomCompanyProvisioningSingleResponseSerializer, tags=['Company'])
+    def get(self, request: HttpRequest, task_id: str):
+        try:
+            provisioning = company_selector.get_company_provisioning(request=request, task_id=task_id)
+            if not provisioning['is_success']:
+                raise Exception(provisioning['message'])
+            return Response(CustomCompanyProvisioningSingleResponseSerializer(provisioning,
+                                                                              context={"request": request}).data)
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
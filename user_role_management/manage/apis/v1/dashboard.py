@@ -0,0 +1,94 @@
+from typing import Any, Callable, Dict
+
+from django.http import HttpRequest
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status, serializers
+from drf_spectacular.utils import extend_schema
+from user_role_management.api.mixins import ApiAuthMixin
+from user_role_management.core.concurrency import arun_concurrently, run_concurrently
+from user_role_management.manage.apis.v1.organization_chart import OutPutEmployeeSerializer
+from user_role_management.manage.apis.v1.permission import CustomUserPermissionMultiResponseSerializer
+from user_role_management.manage.apis.v1.process_action import OutPutActionSerializer, OutPutProcessSerializer
+from user_role_management.manage.selectors import organization_chart as organization_chart_selector
+from user_role_management.manage.selectors import permission as permission_selector
+from user_role_management.manage.selectors import process_action as process_action_selector
+from user_role_management.api.pagination import LimitOffsetPagination, get_paginated_response_context
+from user_role_management.core.exceptions import handle_validation_error, error_response, success_response
+from user_role_management.utils.serializer_handler import CustomSingleResponseSerializerBase, FilterSerializerBase
+
+DASHBOARD_SECTIONS = ('permissions', 'employees', 'processes', 'actions')
+
+
+class CustomDashboardResponseSerializer(CustomSingleResponseSerializerBase):
+    data = serializers.DictField(help_text="The user permissions and the first page of each list, by section")
+
+    class Meta:
+        fields = ('is_success', 'data')
+
+
+class DashboardApi(ApiAuthMixin, APIView):
+    """
+    The sections of the dashboard in one response, their selectors run concurrently,
+    see `core.concurrency`.
+    """
+
+    class Pagination(LimitOffsetPagination):
+        default_limit = 10
+
+    class FilterDashboardSerializer(FilterSerializerBase):
+        sections = serializers.MultipleChoiceField(choices=DASHBOARD_SECTIONS, required=False)
+
+    def paginate(self, request: HttpRequest, queryset, serializer_class) -> Dict[str, Any]:
+        return get_paginated_response_context(
+            request=request,
+            pagination_class=self.Pagination,
+            serializer_class=serializer_class,
+            queryset=queryset,
+            view=self,
+        ).data
+
+    def get_sections(self, request: HttpRequest, filters: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+        sections = {
+            'permissions': lambda: CustomUserPermissionMultiResponseSerializer(
+                permission_selector.get_user_permissions(request)).data,
+            'employees': lambda: self.paginate(
+                request, organization_chart_selector.get_filtered_employees(request), OutPutEmployeeSerializer),
+            'processes': lambda: self.paginate(
+                request, process_action_selector.get_filtered_processes(request), OutPutProcessSerializer),
+            'actions': lambda: self.paginate(
+                request, process_action_selector.get_filtered_actions(request), OutPutActionSerializer),
+        }
+        names = filters.get('sections') or DASHBOARD_SECTIONS
+        return {name: sections[name] for name in DASHBOARD_SECTIONS if name in names}
+
+    @extend_schema(parameters=[FilterDashboardSerializer], responses=CustomDashboardResponseSerializer,
+                   tags=['Dashboard'])
+    def get(self, request: HttpRequest):
+        filter_serializer = self.FilterDashboardSerializer(data=request.query_params)
+        validation_result = handle_validation_error(serializer=filter_serializer)
+        if not isinstance(validation_result, bool):  # if validation_result response is not boolean
+            return Response(validation_result, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            sections = run_concurrently(self.get_sections(request, filter_serializer.validated_data))
+            return Response(success_response(data=sections))
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+    async def aget(self, request: HttpRequest):
+        """
+        `get` for the async view of ASYNC_READ_APIS.
+        """
+        filter_serializer = self.FilterDashboardSerializer(data=request.query_params)
+        validation_result = handle_validation_error(serializer=filter_serializer)
+        if not isinstance(validation_result, bool):
+            return Response(validation_result, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            sections = await arun_concurrently(self.get_sections(request, filter_serializer.validated_data))
+            return Response(success_response(data=sections))
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
@@ -10,7 +10,9 @@ from user_role_management.manage.services import organization_chart as organizat
 from user_role_management.manage.selectors import organization_chart as organization_chart_selector
 from user_role_management.api.pagination import LimitOffsetPagination, get_paginated_response_context
 from user_role_management.core.exceptions import handle_validation_error, error_response, success_response
-from user_role_management.utils.serializer_handler import CustomSingleResponseSerializerBase, CustomMultiResponseSerializerBase, FilterWithSearchSerializerBase
+from user_role_management.utils.serializer_handler import BatchUpdateSerializerBase, \
+    CustomBatchUpdateResponseSerializer, CustomSingleResponseSerializerBase, CustomMultiResponseSerializerBase, \
+    FilterWithSearchSerializerBase
 
 
 class OutPutEmployeeSerializer(serializers.ModelSerializer):
@@ -33,6 +35,21 @@ class CustomEmployeeMultiResponseSerializer(CustomMultiResponseSerializerBase):
         fields = ('is_success', 'data')
 
 
+class BatchUpdateEmployeeFieldsSerializer(serializers.Serializer):
+    company_id = serializers.IntegerField(required=False)
+    personnel_code = serializers.CharField(max_length=45, required=False)
+    user_id = serializers.IntegerField(required=False)
+
+
+class BatchUpdateEmployeeItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    fields = BatchUpdateEmployeeFieldsSerializer()
+
+
+class InputBatchUpdateEmployeeSerializer(BatchUpdateSerializerBase):
+    items = BatchUpdateEmployeeItemSerializer(many=True, allow_empty=False)
+
+
 class EmployeesApi(ApiAuthMixin, APIView):
     class Pagination(LimitOffsetPagination):
         default_limit = 50
@@ -82,6 +99,23 @@ class EmployeesApi(ApiAuthMixin, APIView):
             response = error_response(message=str(ex))
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
+    @extend_schema(request=InputBatchUpdateEmployeeSerializer, responses=CustomBatchUpdateResponseSerializer,
+                   tags=['Employee'])
+    def patch(self, request: HttpRequest):
+        serializer = InputBatchUpdateEmployeeSerializer(data=request.data)
+        validation_result = handle_validation_error(serializer=serializer)
+        if not isinstance(validation_result, bool):
+            return Response(validation_result, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            employees = organization_chart_services.bulk_update_employees(request=request, **serializer.validated_data)
+            if not employees['is_success']:
+                raise Exception(employees['message'])
+            return Response(CustomBatchUpdateResponseSerializer(employees, context={"request": request}).data)
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
 
 class EmployeeApi(ApiAuthMixin, APIView):
     class UpdateEmployeeSerializer(EmployeesApi.InputEmployeeSerializer):
@@ -142,6 +176,20 @@ class CustomCompanyPositionMultiResponseSerializer(CustomMultiResponseSerializer
         fields = ('is_success', 'data')
 
 
+class BatchUpdateCompanyPositionFieldsSerializer(serializers.Serializer):
+    title = serializers.CharField(max_length=155, required=False)
+    abbreviation = serializers.CharField(max_length=55, required=False)
+
+
+class BatchUpdateCompanyPositionItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    fields = BatchUpdateCompanyPositionFieldsSerializer()
+
+
+class InputBatchUpdateCompanyPositionSerializer(BatchUpdateSerializerBase):
+    items = BatchUpdateCompanyPositionItemSerializer(many=True, allow_empty=False)
+
+
 class CompanyPositionsApi(ApiAuthMixin, APIView):
     class Pagination(LimitOffsetPagination):
         default_limit = 50
@@ -189,6 +237,23 @@ class CompanyPositionsApi(ApiAuthMixin, APIView):
             response = error_response(message=str(ex))
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
+    @extend_schema(request=InputBatchUpdateCompanyPositionSerializer, responses=CustomBatchUpdateResponseSerializer,
+                   tags=['Position'])
+    def patch(self, request: HttpRequest):
+        serializer = InputBatchUpdateCompanyPositionSerializer(data=request.data)
+        validation_result = handle_validation_error(serializer=serializer)
+        if not isinstance(validation_result, bool):
+            return Response(validation_result, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            positions = organization_chart_services.bulk_update_positions(request=request, **serializer.validated_data)
+            if not positions['is_success']:
+                raise Exception(positions['message'])
+            return Response(CustomBatchUpdateResponseSerializer(positions, context={"request": request}).data)
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
 
 class CompanyPositionApi(ApiAuthMixin, APIView):
     class UpdateCompanyPositionSerializer(CompanyPositionsApi.InputCompanyPositionSerializer):
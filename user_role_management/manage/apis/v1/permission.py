@@ -5,7 +5,7 @@ from rest_framework import status, serializers
 from drf_spectacular.utils import extend_schema
 from django.contrib.auth.models import Permission
 from user_role_management.api.mixins import ApiAuthMixin
-from user_role_management.manage.models import Process, Action
+from user_role_management.manage.models import Process, Action, Company_group, Role_template
 from user_role_management.manage.services import permission as permission_services
 from user_role_management.manage.selectors import permission as permission_selector
 from user_role_management.api.pagination import LimitOffsetPagination, get_paginated_response_context
@@ -169,3 +169,115 @@ class UserPermissionsApi(ApiAuthMixin, APIView):
         except Exception as ex:
             response = error_response(message=str(ex))
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+
+# =================================================================
+
+class OutPutRoleTemplateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Role_template
+        fields = '__all__'
+
+
+class CustomRoleTemplateSingleResponseSerializer(CustomSingleResponseSerializerBase):
+    data = OutPutRoleTemplateSerializer()
+
+    class Meta:
+        fields = ('is_success', 'data')
+
+
+class CustomRoleTemplateMultiResponseSerializer(CustomMultiResponseSerializerBase):
+    data = serializers.ListSerializer(child=OutPutRoleTemplateSerializer())
+
+    class Meta:
+        fields = ('is_success', 'data')
+
+
+class OutPutInstantiatedCompanyGroupSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Company_group
+        fields = ('id', 'company', 'group', 'name')
+
+
+class CustomInstantiatedCompanyGroupMultiResponseSerializer(CustomSingleResponseSerializerBase):
+    data = serializers.ListSerializer(child=OutPutInstantiatedCompanyGroupSerializer())
+
+    class Meta:
+        fields = ('is_success', 'data')
+
+
+class RoleTemplatesApi(ApiAuthMixin, APIView):
+    class Pagination(LimitOffsetPagination):
+        default_limit = 50
+
+    class InputRoleTemplateSerializer(serializers.Serializer):
+        name = serializers.CharField(max_length=255)
+        company_group_id = serializers.IntegerField()
+
+    @extend_schema(request=InputRoleTemplateSerializer, responses=CustomRoleTemplateSingleResponseSerializer,
+                   tags=['Permission'])
+    def post(self, request: HttpRequest):
+        serializer = self.InputRoleTemplateSerializer(data=request.data)
+        validation_result = handle_validation_error(serializer=serializer)
+        if not isinstance(validation_result, bool):
+            return Response(validation_result, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            role_template = permission_services.create_role_template(request=request, **serializer.validated_data)
+            if not role_template['is_success']:
+                raise Exception(role_template['message'])
+            return Response(CustomRoleTemplateSingleResponseSerializer(role_template,
+                                                                       context={"request": request}).data)
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+    @extend_schema(responses=CustomRoleTemplateMultiResponseSerializer, tags=['Permission'])
+    def get(self, request: HttpRequest):
+        try:
+            role_templates = permission_selector.get_role_templates(request)
+            return get_paginated_response_context(
+                request=request,
+                pagination_class=self.Pagination,
+                serializer_class=OutPutRoleTemplateSerializer,
+                queryset=role_templates,
+                view=self,
+            )
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+
+class RoleTemplateApi(ApiAuthMixin, APIView):
+    class InputInstantiateSerializer(serializers.Serializer):
+        company_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+    @extend_schema(responses=CustomRoleTemplateSingleResponseSerializer, tags=['Permission'])
+    def get(self, request: HttpRequest, role_template_id: int):
+        try:
+            role_template = permission_selector.get_role_template(request=request, id=role_template_id)
+            if not role_template['is_success']:
+                raise Exception(role_template['message'])
+            return Response(CustomRoleTemplateSingleResponseSerializer(role_template,
+                                                                       context={"request": request}).data)
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
+    @extend_schema(request=InputInstantiateSerializer, responses=CustomInstantiatedCompanyGroupMultiResponseSerializer,
+                   tags=['Permission'])
+    def post(self, request: HttpRequest, role_template_id: int):
+        serializer = self.InputInstantiateSerializer(data=request.data)
+        validation_result = handle_validation_error(serializer=serializer)
+        if not isinstance(validation_result, bool):
+            return Response(validation_result, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            company_groups = permission_services.instantiate_role_template(request=request, id=role_template_id,
+                                                                           **serializer.validated_data)
+            if not company_groups['is_success']:
+                raise Exception(company_groups['message'])
+            return Response(CustomInstantiatedCompanyGroupMultiResponseSerializer(company_groups,
+                                                                                  context={"request": request}).data)
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
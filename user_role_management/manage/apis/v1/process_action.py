@@ -9,7 +9,8 @@ from user_role_management.manage.services import process_action as process_actio
 from user_role_management.manage.selectors import process_action as process_action_selector
 from user_role_management.api.pagination import LimitOffsetPagination, get_paginated_response_context
 from user_role_management.core.exceptions import handle_validation_error, error_response, success_response
-from user_role_management.utils.serializer_handler import CustomSingleResponseSerializerBase, \
+from user_role_management.utils.serializer_handler import BatchUpdateSerializerBase, \
+    CustomBatchUpdateResponseSerializer, CustomSingleResponseSerializerBase, \
     CustomMultiResponseSerializerBase, FilterWithSearchSerializerBase
 
 
@@ -140,6 +141,22 @@ class CustomActionMultiResponseSerializer(CustomMultiResponseSerializerBase):
         fields = ('is_success', 'data')
 
 
+class BatchUpdateActionFieldsSerializer(serializers.Serializer):
+    process_id = serializers.IntegerField(required=False)
+    name = serializers.CharField(max_length=155, required=False)
+    code_name = serializers.CharField(max_length=155, required=False)
+    route = serializers.CharField(max_length=155, required=False)
+
+
+class BatchUpdateActionItemSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    fields = BatchUpdateActionFieldsSerializer()
+
+
+class InputBatchUpdateActionSerializer(BatchUpdateSerializerBase):
+    items = BatchUpdateActionItemSerializer(many=True, allow_empty=False)
+
+
 class ActionsApi(ApiAuthMixin, APIView):
     class Pagination(LimitOffsetPagination):
         default_limit = 50
@@ -191,6 +208,23 @@ class ActionsApi(ApiAuthMixin, APIView):
             response = error_response(message=str(ex))
             return Response(response, status=status.HTTP_400_BAD_REQUEST)
 
+    @extend_schema(request=InputBatchUpdateActionSerializer, responses=CustomBatchUpdateResponseSerializer,
+                   tags=['Action'])
+    def patch(self, request: HttpRequest):
+        serializer = InputBatchUpdateActionSerializer(data=request.data)
+        validation_result = handle_validation_error(serializer=serializer)
+        if not isinstance(validation_result, bool):
+            return Response(validation_result, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            actions = process_action_services.bulk_update_actions(request=request, **serializer.validated_data)
+            if not actions['is_success']:
+                raise Exception(actions['message'])
+            return Response(CustomBatchUpdateResponseSerializer(actions, context={"request": request}).data)
+        except Exception as ex:
+            response = error_response(message=str(ex))
+            return Response(response, status=status.HTTP_400_BAD_REQUEST)
+
 
 class ActionApi(ApiAuthMixin, APIView):
     class UpdateActionSerializer(ActionsApi.InputActionSerializer):
@@ -5,6 +5,7 @@ from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from user_role_management.common.models import BaseModel
 from user_role_management.utils.services import create_fields
+from user_role_management.common.services import model_update_by_id
 from user_role_management.core.exceptions import error_response, success_response
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager as BUM, PermissionsMixin, Group, GroupManager, \
     Permission
@@ -78,10 +79,7 @@ class Company(BaseModel):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -130,10 +128,7 @@ class Company_group(models.Model):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -153,7 +148,12 @@ class Company_group(models.Model):
         return f"{self.company} - {self.group}"
 
     def save(self, *args, **kwargs):
-        self.name = f"{self.company.title}_{self.group.name}"
+        update_fields = kwargs.get('update_fields')
+        # Only rebuild the name when it may have changed, it costs a query per relation
+        if update_fields is None or {'company', 'company_id', 'group', 'group_id'} & set(update_fields):
+            self.name = f"{self.company.title}_{self.group.name}"
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'name'}
 
         super().save(*args, **kwargs)
 
@@ -205,11 +205,7 @@ class BaseUser(BaseModel, AbstractBaseUser, PermissionsMixin):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.full_clean()
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs), validate=True)
             return success_response(data=obj)
         # except ValidationError as ve:
         #     sdf = ''
@@ -268,10 +264,7 @@ class Company_position(models.Model):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -311,6 +304,10 @@ class Employee(BaseModel):
             ('company', 'personnel_code'),
             ('user', 'company', 'personnel_code')
         ]
+        indexes = [
+            # Employees of the company, newest first
+            models.Index(fields=['company', '-id'], name='manage_employee_company_id_idx'),
+        ]
 
     @classmethod
     def _create(cls, **kwargs: Dict[str, Any]) -> Dict[str, Literal['is_success', True, False]]:
@@ -324,10 +321,7 @@ class Employee(BaseModel):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -361,6 +355,10 @@ class Company_department(models.Model):
 
     class Meta:
         unique_together = ['company', 'department']
+        indexes = [
+            # Departments of the company, newest first
+            models.Index(fields=['company', '-id'], name='manage_department_company_idx'),
+        ]
         verbose_name = _("company department")
         verbose_name_plural = _("company departments")
 
@@ -376,10 +374,7 @@ class Company_department(models.Model):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -431,10 +426,7 @@ class Company_department_employee(models.Model):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -480,10 +472,7 @@ class Company_department_position(models.Model):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -530,10 +519,7 @@ class Company_branch(BaseModel):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -576,10 +562,7 @@ class Shift(BaseModel):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -608,7 +591,12 @@ class Process(models.Model):
     class Meta:
         verbose_name = _("process")
         verbose_name_plural = _("processes")
+        # The unique (company, name) index serves the url_action_perm lookup
         unique_together = ['company', 'name']
+        indexes = [
+            # Processes of the company, newest first
+            models.Index(fields=['company', '-id'], name='manage_process_company_idx'),
+        ]
         permissions = [('dg_can_view_process', 'OBP can view process'),
                        ('dg_can_start_process', 'OBP can start process')]
 
@@ -624,10 +612,7 @@ class Process(models.Model):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -674,10 +659,7 @@ class Action(models.Model):
     @classmethod
     def _update(cls, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
         try:
-            obj = cls.objects.get(id=id)
-            fields = create_fields(**kwargs)
-            obj.__dict__.update(**fields)
-            obj.save()
+            obj, _ = model_update_by_id(model=cls, id=id, data=create_fields(**kwargs))
             return success_response(data=obj)
         except Exception as ex:
             return error_response(message=str(ex))
@@ -703,6 +685,56 @@ class Action(models.Model):
         return f"{self.process}_{self.name}"
 
 
+class Role_template(BaseModel):
+    """
+        Company independent snapshot of a ``Company_group`` permission set.
+        Object permissions are stored by ``Process.name`` / ``Action.code_name``
+        so the template can be instantiated into any company.
+    """
+    name = models.CharField(max_length=255, unique=True)
+    group = models.ForeignKey(Group, on_delete=models.DO_NOTHING)
+    source_company_group = models.ForeignKey(Company_group, on_delete=models.SET_NULL, null=True, blank=True)
+    permissions = models.ManyToManyField(
+        Permission,
+        verbose_name=_("permissions"),
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name = _("role template")
+        verbose_name_plural = _("role templates")
+
+    @classmethod
+    def _get_all(cls) -> QuerySet['Role_template']:
+        return cls.objects.all()
+
+    @classmethod
+    def _get_by_id(cls, id: int) -> Optional['Role_template']:
+        try:
+            return cls.objects.get(id=id)
+        except cls.DoesNotExist:
+            return None
+
+    def __str__(self):
+        return str(self.name)
+
+
+class Role_template_object_permission(models.Model):
+    role_template = models.ForeignKey(Role_template, on_delete=models.CASCADE, related_name='object_permissions')
+    permission = models.ForeignKey(Permission, on_delete=models.CASCADE)
+    process_name = models.CharField(max_length=255)
+    # Empty for permissions granted on the process itself
+    action_code_name = models.CharField(max_length=255, null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("role template object permission")
+        verbose_name_plural = _("role template object permissions")
+        unique_together = ['role_template', 'permission', 'process_name', 'action_code_name']
+
+    def __str__(self):
+        return f"{self.role_template}-{self.process_name}-{self.action_code_name or ''}"
+
+
 # class CustomPermission(models.Model):
 #     description = models.CharField(max_length=255)
 #     company = models.ForeignKey(Company, on_delete=models.DO_NOTHING)
@@ -1,10 +1,14 @@
 from typing import Dict, Literal
+from celery.result import AsyncResult
+from django.core.cache import cache
 from django.http import HttpRequest
 from django.db.models import QuerySet
 from django.contrib.auth.models import Group
 from user_role_management.manage.models import Company, Company_group, Company_branch
 from user_role_management.core.exceptions import error_response, success_response
 
+PROVISIONING_PROGRESS_KEY = 'company_provisioning_progress:{task_id}'
+
 
 def get_companies(request, **kwargs) -> QuerySet[Company]:
     return Company._get_all()
@@ -57,3 +61,15 @@ def get_company_branch(request: HttpRequest, id: int) -> Dict[str, Literal['is_s
     return success_response(data=obj)
 
 
+def get_company_provisioning(request: HttpRequest, task_id: str) -> Dict[str, Literal['is_success', True, False]]:
+    result = AsyncResult(task_id)
+    provisioning = {'task_id': task_id, 'state': result.state, 'progress': None, 'result': None, 'error': None}
+    if not result.ready():
+        provisioning['progress'] = cache.get(PROVISIONING_PROGRESS_KEY.format(task_id=task_id))
+        if provisioning['progress'] is not None:
+            provisioning['state'] = 'PROGRESS'
+    elif result.successful():
+        provisioning['result'] = result.result
+    elif result.failed():
+        provisioning['error'] = str(result.result)
+    return success_response(data=provisioning)
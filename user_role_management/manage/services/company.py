@@ -1,8 +1,12 @@
+from django.db import transaction
 from django.http import HttpRequest
-from typing import Dict, Literal
-from django.contrib.auth.models import Group
+from typing import Any, Callable, Dict, List, Literal, Optional
+from django.contrib.auth.models import Group, Permission
 from user_role_management.utils.services import create_fields
-from user_role_management.manage.models import Company, Company_group, Company_branch
+from user_role_management.common.services import model_update_by_id
+from user_role_management.manage.services import permission as permission_services
+from user_role_management.manage.models import Company, Company_group, Company_branch, Process, Action, \
+    Company_position, Company_department
 from user_role_management.core.exceptions import error_response, success_response
 
 
@@ -25,10 +29,7 @@ def create_group(*, request: HttpRequest, **kwargs) -> Dict[str, Literal['is_suc
 
 def update_group(*, request: HttpRequest, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
     try:
-        obj = Group.objects.get(id=id)
-        fields = create_fields(**kwargs)
-        obj.__dict__.update(**fields)
-        obj.save()
+        obj, _ = model_update_by_id(model=Group, id=id, data=create_fields(**kwargs))
         return success_response(data=obj)
     except Exception as ex:
         return error_response(message=str(ex))
@@ -48,3 +49,142 @@ def create_company_branch(*, request: HttpRequest, **kwargs) -> Dict[str, Litera
 
 def update_company_branch(*, request: HttpRequest, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
     return Company_branch._update(id=id, **kwargs)
+
+
+PROVISIONING_STEPS = ['company', 'groups', 'processes', 'actions', 'positions', 'departments', 'role_templates']
+
+
+def provision_company(
+    *,
+    spec: Dict[str, Any],
+    created_by_id: int,
+    progress: Optional[Callable[[str, int, int], None]] = None
+) -> Dict[str, Literal['is_success', True, False]]:
+    """
+        Create a company and everything it needs from a declarative ``spec`` in dependency order,
+        using one bulk insert per model (per tree level for departments), inside one transaction.
+
+        spec = {
+            "title": "Acme",
+            "groups": [{"name": "operators", "permissions": ["manage.view_company"]}],
+            "processes": [{"name": "user_management",
+                           "actions": [{"name": "Add employee", "code_name": "can_add_employee", "route": None}]}],
+            "positions": [{"title": "CTO", "abbreviation": "cto"}],
+            "departments": [{"department": "R&D", "parent_department": None}],
+            "role_templates": [1, 2],
+        }
+
+        ``progress`` is called with ``(step, current, total)`` after every step, inside the
+        transaction: report through something it doesn't hold back, like the cache.
+    """
+    def report(step):
+        if progress is not None:
+            progress(step, PROVISIONING_STEPS.index(step) + 1, len(PROVISIONING_STEPS))
+
+    try:
+        with transaction.atomic():
+            company = Company.objects.create(title=spec['title'])
+            report('company')
+
+            group_specs = spec.get('groups', [])
+            groups = _get_or_create_groups([group_spec['name'] for group_spec in group_specs])
+            Company_group.objects.bulk_create([
+                Company_group(company=company, group=groups[group_spec['name']],
+                              name=f"{company.title}_{group_spec['name']}")
+                for group_spec in group_specs
+            ])
+            company_groups = {company_group.group.name: company_group for company_group in
+                              Company_group.objects.filter(company=company).select_related('group')}
+            _add_company_group_permissions(company_groups=company_groups, group_specs=group_specs)
+            report('groups')
+
+            process_specs = spec.get('processes', [])
+            Process.objects.bulk_create([
+                Process(company=company, created_by_id=created_by_id, name=process_spec['name'])
+                for process_spec in process_specs
+            ])
+            processes = dict(Process.objects.filter(company=company).values_list('name', 'id'))
+            report('processes')
+
+            Action.objects.bulk_create([
+                Action(process_id=processes[process_spec['name']], name=action_spec['name'],
+                       code_name=action_spec['code_name'], route=action_spec.get('route'))
+                for process_spec in process_specs for action_spec in process_spec.get('actions', [])
+            ])
+            report('actions')
+
+            Company_position.objects.bulk_create([
+                Company_position(company_id=company, title=position_spec['title'],
+                                 abbreviation=position_spec.get('abbreviation'))
+                for position_spec in spec.get('positions', [])
+            ])
+            report('positions')
+
+            _bulk_create_departments(company=company, department_specs=spec.get('departments', []))
+            report('departments')
+
+            for role_template_id in spec.get('role_templates', []):
+                instantiated = permission_services.instantiate_role_template(request=None, id=role_template_id,
+                                                                             company_ids=[company.id])
+                if not instantiated['is_success']:
+                    raise Exception(instantiated['message'])
+            report('role_templates')
+
+        return success_response(data=company)
+    except Exception as ex:
+        return error_response(message=str(ex))
+
+
+def submit_company_provisioning(*, request: HttpRequest,
+                                spec: Dict[str, Any]) -> Dict[str, Literal['is_success', True, False]]:
+    from user_role_management.manage.tasks import provision_company as provision_company_task
+    try:
+        task = provision_company_task.delay(spec=spec, created_by_id=request.user.id)
+        return success_response(data={'task_id': task.id, 'state': task.state})
+    except Exception as ex:
+        return error_response(message=str(ex))
+
+
+def _get_or_create_groups(names: List[str]) -> Dict[str, Group]:
+    Group.objects.bulk_create([Group(name=name) for name in names], ignore_conflicts=True)
+    return {group.name: group for group in Group.objects.filter(name__in=names)}
+
+
+def _add_company_group_permissions(*, company_groups: Dict[str, Company_group], group_specs: List[Dict[str, Any]]):
+    wanted = {perm for group_spec in group_specs for perm in group_spec.get('permissions', [])}
+    if not wanted:
+        return
+    permissions = {
+        f"{app_label}.{codename}": perm_id for perm_id, app_label, codename in
+        Permission.objects.filter(codename__in=[perm.split('.', 1)[-1] for perm in wanted])
+        .values_list('id', 'content_type__app_label', 'codename')
+    }
+    unknown = wanted - permissions.keys()
+    if unknown:
+        raise Exception(f"Unknown permissions: {', '.join(sorted(unknown))}")
+
+    through = Company_group.permissions.through
+    through.objects.bulk_create([
+        through(company_group_id=company_groups[group_spec['name']].id, permission_id=permissions[perm])
+        for group_spec in group_specs for perm in set(group_spec.get('permissions', []))
+    ])
+
+
+def _bulk_create_departments(*, company: Company, department_specs: List[Dict[str, Any]]):
+    """
+        Departments reference their parent, so each tree level is inserted with its own bulk insert.
+    """
+    remaining = list(department_specs)
+    created = {}
+    while remaining:
+        level = [department_spec for department_spec in remaining
+                 if not department_spec.get('parent_department') or department_spec['parent_department'] in created]
+        if not level:
+            raise Exception("Departments have unknown or circular parent_department references")
+        Company_department.objects.bulk_create([
+            Company_department(company=company, department=department_spec['department'],
+                               parent_department_id=created.get(department_spec.get('parent_department')))
+            for department_spec in level
+        ])
+        created = dict(Company_department.objects.filter(company=company).values_list('department', 'id'))
+        remaining = [department_spec for department_spec in remaining if department_spec not in level]
@@ -1,9 +1,10 @@
 from django.http import HttpRequest
-from typing import Dict, Literal
+from typing import Dict, List, Literal
 from user_role_management.core.exceptions import error_response, success_response
 from user_role_management.guardian.models.models import GroupObjectPermission, UserObjectPermission
 from user_role_management.manage.models import Company_position, Employee, Company_department, Company_department_employee, Action, Process, Company_department_position
 from user_role_management.core.permission import url_action_perm
+from user_role_management.common.services import model_bulk_update
 
 
 
@@ -15,6 +16,13 @@ def update_employee(*, request: HttpRequest, id: int, **kwargs) -> Dict[str, Lit
     return Employee._update(id=id, **kwargs)
 
 
+def bulk_update_employees(*, request: HttpRequest, items: List[Dict]) -> Dict[str, Literal['is_success', True, False]]:
+    try:
+        return success_response(data=model_bulk_update(model=Employee, items=items))
+    except Exception as ex:
+        return error_response(message=str(ex))
+
+
 def create_position(request: HttpRequest, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
     return Company_position._create(**kwargs)
 
@@ -23,6 +31,13 @@ def update_position(*, request: HttpRequest, id: int, **kwargs) -> Dict[str, Lit
     return Company_position._update(id=id, **kwargs)
 
 
+def bulk_update_positions(*, request: HttpRequest, items: List[Dict]) -> Dict[str, Literal['is_success', True, False]]:
+    try:
+        return success_response(data=model_bulk_update(model=Company_position, items=items))
+    except Exception as ex:
+        return error_response(message=str(ex))
+
+
 def create_company_department(request: HttpRequest, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
     return Company_department._create(**kwargs)
 
@@ -1,7 +1,13 @@
-from typing import Dict, Literal
+from typing import Dict, List, Literal
 from django.http import HttpRequest
+from django.db import connection, transaction
 from django.contrib.auth.models import Permission
 from user_role_management.utils.services import create_fields
+from user_role_management.common.services import model_update_by_id
+from user_role_management.authentication.claims import bump_permission_versions
+from user_role_management.guardian.models import ActionGroupObjectPermission, ProcessGroupObjectPermission
+from user_role_management.manage.models import Company, Company_group, Process, Action, Role_template, \
+    Role_template_object_permission
 from user_role_management.core.exceptions import error_response, success_response
 
 
@@ -16,10 +22,122 @@ def create_permission(*, request: HttpRequest, **kwargs) -> Dict[str, Literal['i
 
 def update_permission(*, request: HttpRequest, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
     try:
-        obj = Permission.objects.get(id=id)
-        fields = create_fields(**kwargs)
-        obj.__dict__.update(**fields)
-        obj.save()
+        obj, _ = model_update_by_id(model=Permission, id=id, data=create_fields(**kwargs))
         return success_response(data=obj)
     except Exception as ex:
         return error_response(message=str(ex))
+
+
+def create_role_template(*, request: HttpRequest, company_group_id: int,
+                         name: str) -> Dict[str, Literal['is_success', True, False]]:
+    """
+        Snapshot the global and object permissions of a company group into a ``Role_template``.
+    """
+    try:
+        with transaction.atomic():
+            company_group = Company_group.objects.select_related('group').get(id=company_group_id)
+            template = Role_template.objects.create(name=name, group=company_group.group,
+                                                    source_company_group=company_group)
+            template.permissions.add(*company_group.permissions.values_list('id', flat=True))
+
+            process_perms = ProcessGroupObjectPermission.objects.filter(group=company_group) \
+                .values_list('content_object_id', 'permission_id')
+            action_perms = ActionGroupObjectPermission.objects.filter(group=company_group) \
+                .values_list('content_object_id', 'permission_id')
+
+            process_names = dict(Process.objects.filter(
+                pk__in=[pk for pk, _ in process_perms]).values_list('id', 'name'))
+            actions = {action_id: (process_name, code_name) for action_id, process_name, code_name in
+                       Action.objects.filter(pk__in=[pk for pk, _ in action_perms])
+                       .values_list('id', 'process__name', 'code_name')}
+
+            rows = [Role_template_object_permission(role_template=template, permission_id=permission_id,
+                                                    process_name=process_names[pk])
+                    for pk, permission_id in process_perms if pk in process_names]
+            rows += [Role_template_object_permission(role_template=template, permission_id=permission_id,
+                                                     process_name=actions[pk][0],
+                                                     action_code_name=actions[pk][1])
+                     for pk, permission_id in action_perms if pk in actions]
+            Role_template_object_permission.objects.bulk_create(rows)
+        return success_response(data=template)
+    except Exception as ex:
+        return error_response(message=str(ex))
+
+
+def instantiate_role_template(*, request: HttpRequest, id: int,
+                              company_ids: List[int]) -> Dict[str, Literal['is_success', True, False]]:
+    """
+        Create the template's company group in every company of ``company_ids`` and copy its global
+        and object permissions with three ``INSERT ... SELECT`` statements, whatever the number of companies.
+        Processes and actions are matched by name, rows which already exist are skipped.
+    """
+    try:
+        template = Role_template.objects.select_related('group').get(id=id)
+        company_ids = list(Company.objects.filter(id__in=company_ids).values_list('id', flat=True))
+        if not company_ids:
+            return error_response(message="There are no record")
+
+        with transaction.atomic():
+            # Company_group.save builds the name, so new groups are created one by one
+            existing = set(Company_group.objects.filter(group=template.group, company_id__in=company_ids)
+                           .values_list('company_id', flat=True))
+            for company in Company.objects.filter(id__in=set(company_ids) - existing):
+                Company_group.objects.create(company=company, group=template.group)
+
+            _insert_role_template_rows(template=template, company_ids=company_ids)
+            # The rows are inserted with raw SQL, no signal bumps the permission claims
+            bump_permission_versions(company_ids)
+
+        company_groups = Company_group.objects.filter(group=template.group, company_id__in=company_ids)
+        return success_response(data=company_groups)
+    except Exception as ex:
+        return error_response(message=str(ex))
+
+
+def _insert_role_template_rows(*, template: Role_template, company_ids: List[int]) -> None:
+    qn = connection.ops.quote_name
+    company_group_table = qn(Company_group._meta.db_table)
+    company_group_perms_table = qn(Company_group.permissions.through._meta.db_table)
+    template_perms_table = qn(Role_template.permissions.through._meta.db_table)
+    template_obj_perms_table = qn(Role_template_object_permission._meta.db_table)
+    process_perms_table = qn(ProcessGroupObjectPermission._meta.db_table)
+    action_perms_table = qn(ActionGroupObjectPermission._meta.db_table)
+    process_table = qn(Process._meta.db_table)
+    action_table = qn(Action._meta.db_table)
+    companies = ', '.join(['%s'] * len(company_ids))
+    not_exists_obj_perm = """
+        NOT EXISTS (SELECT 1 FROM {table} gop
+                    WHERE gop.group_id = cg.id AND gop.permission_id = t.permission_id
+                    AND gop.content_object_id = {pk})
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"""
+            INSERT INTO {company_group_perms_table} (company_group_id, permission_id)
+            SELECT cg.id, t.permission_id
+            FROM {company_group_table} cg, {template_perms_table} t
+            WHERE cg.group_id = %s AND cg.company_id IN ({companies}) AND t.role_template_id = %s
+            AND NOT EXISTS (SELECT 1 FROM {company_group_perms_table} cgp
+                            WHERE cgp.company_group_id = cg.id AND cgp.permission_id = t.permission_id)
+        """, [template.group_id, *company_ids, template.id])
+
+        cursor.execute(f"""
+            INSERT INTO {process_perms_table} (group_id, permission_id, content_object_id)
+            SELECT cg.id, t.permission_id, p.id
+            FROM {template_obj_perms_table} t
+            JOIN {process_table} p ON p.name = t.process_name
+            JOIN {company_group_table} cg ON cg.company_id = p.company_id AND cg.group_id = %s
+            WHERE t.role_template_id = %s AND t.action_code_name IS NULL AND p.company_id IN ({companies})
+            AND {not_exists_obj_perm.format(table=process_perms_table, pk='p.id')}
+        """, [template.group_id, template.id, *company_ids])
+
+        cursor.execute(f"""
+            INSERT INTO {action_perms_table} (group_id, permission_id, content_object_id)
+            SELECT cg.id, t.permission_id, a.id
+            FROM {template_obj_perms_table} t
+            JOIN {process_table} p ON p.name = t.process_name
+            JOIN {action_table} a ON a.process_id = p.id AND a.code_name = t.action_code_name
+            JOIN {company_group_table} cg ON cg.company_id = p.company_id AND cg.group_id = %s
+            WHERE t.role_template_id = %s AND p.company_id IN ({companies})
+            AND {not_exists_obj_perm.format(table=action_perms_table, pk='a.id')}
+        """, [template.group_id, template.id, *company_ids])
@@ -1,8 +1,9 @@
-from typing import Dict, Literal
+from typing import Dict, List, Literal
 from django.http import HttpRequest
 from user_role_management.manage.models import BaseUser, Process, Action
 from django.contrib.auth.decorators import login_required, permission_required
 from user_role_management.core.exceptions import error_response, success_response
+from user_role_management.common.services import model_bulk_update
 
 
 @login_required
@@ -35,3 +36,10 @@ def create_action(*, request: HttpRequest, **kwargs) -> Dict[str, Literal['is_su
 
 def update_action(*, request: HttpRequest, id: int, **kwargs) -> Dict[str, Literal['is_success', True, False]]:
     return Action._update(id=id, **kwargs)
+
+
+def bulk_update_actions(*, request: HttpRequest, items: List[Dict]) -> Dict[str, Literal['is_success', True, False]]:
+    try:
+        return success_response(data=model_bulk_update(model=Action, items=items))
+    except Exception as ex:
+        return error_response(message=str(ex))
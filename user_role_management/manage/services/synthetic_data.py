@@ -0,0 +1,182 @@
+import random
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+
+from user_role_management.guardian.models import ActionGroupObjectPermission
+from user_role_management.manage.models import Action, BaseUser, Company, Company_department, \
+    Company_department_employee, Company_department_position, Company_group, Company_position, Employee, Process
+
+ACTION_PERMISSION = 'dg_can_do_this_action'
+# Processes and actions the APIs check with url_action_perm, granted to every company group
+APP_PROCESS_ACTIONS = {'user_management': ['can_add_employee']}
+
+
+def _insert_rows(*, model, columns: Sequence[str], rows: Iterable[Tuple], batch_size: int) -> int:
+    """
+    Multi row ``INSERT ... VALUES`` without building model instances, used for
+    the tables which get millions of rows.
+    """
+    rows = list(rows)
+    batch_size = connection.ops.bulk_batch_size(columns, rows) if connection.vendor == 'sqlite' else batch_size
+    table = connection.ops.quote_name(model._meta.db_table)
+    column_names = ", ".join(connection.ops.quote_name(column) for column in columns)
+    placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            cursor.execute(f"INSERT INTO {table} ({column_names}) VALUES {', '.join([placeholders] * len(batch))}",
+                           [value for row in batch for value in row])
+    return len(rows)
+
+
+def _create_department_tree(*, company: Company, depth: int, fan_out: int, managers: List[Employee],
+                            batch_size: int) -> List[Company_department]:
+    """
+    Builds a tree of ``fan_out`` children per department, ``depth`` levels deep,
+    inserting each level with its own bulk insert as children reference their parent.
+    """
+    departments = []
+    parents = [None]
+    for level in range(depth):
+        level_departments = Company_department.objects.bulk_create([
+            Company_department(
+                company=company,
+                department=f"{parent.department if parent else 'department'}.{child}",
+                parent_department=parent,
+                manager=managers[(len(departments) + index) % len(managers)] if managers else None,
+            )
+            for index, (parent, child) in enumerate((parent, child) for parent in parents for child in range(fan_out))
+        ], batch_size=batch_size)
+        departments.extend(level_departments)
+        parents = level_departments
+    return departments
+
+
+def generate_synthetic_data(
+    *,
+    companies: int,
+    users_per_company: int,
+    department_depth: int,
+    department_fan_out: int,
+    positions_per_company: int,
+    positions_per_department: int,
+    processes_per_company: int,
+    actions_per_process: int,
+    groups_per_company: int,
+    granted_ratio: float,
+    seed: int = 0,
+    password: Optional[str] = None,
+    batch_size: int = 5000,
+    progress: Optional[Callable[[int, Dict[str, int]], None]] = None,
+    manifest: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, int]:
+    """
+    Generates ``companies`` tenants, one transaction per company.
+
+    Every company gets its users (each one an employee and member of one of the
+    company groups), a department tree, positions, processes with their actions
+    and a ``granted_ratio`` share of its actions granted to each company group.
+    The processes of APP_PROCESS_ACTIONS are added to every company and fully
+    granted, so generated users pass the ``url_action_perm`` checks.
+
+    Names and the granted actions only depend on ``seed``, so the same arguments
+    generate the same dataset on an empty database. When ``manifest`` is given,
+    the ids of what was generated for each company are appended to it.
+    """
+    totals = {'companies': 0, 'users': 0, 'employees': 0, 'departments': 0, 'positions': 0, 'processes': 0,
+              'actions': 0, 'company_groups': 0, 'group_object_permissions': 0}
+    password = make_password(password) if password else '!'
+    action_ctype = ContentType.objects.get_for_model(Action)
+    action_permission = Permission.objects.get(content_type=action_ctype, codename=ACTION_PERMISSION)
+
+    with transaction.atomic():
+        owner, _ = BaseUser.objects.get_or_create(email=f'synthetic-{seed}-owner@example.com',
+                                                  defaults={'password': password})
+        groups = [Group.objects.get_or_create(name=f'synthetic-{seed}-role-{g}')[0] for g in range(groups_per_company)]
+
+    for c in range(companies):
+        rnd = random.Random(f'{seed}-{c}')
+        with transaction.atomic():
+            company = Company.objects.create(title=f'synthetic-{seed}-company-{c}')
+            company_groups = Company_group.objects.bulk_create(
+                [Company_group(company=company, group=group, name=f'{company.title}_{group.name}') for group in groups])
+
+            users = BaseUser.objects.bulk_create(
+                [BaseUser(email=f'synthetic-{seed}-{c}-{u}@example.com', password=password,
+                          last_company_logged_in=company) for u in range(users_per_company)],
+                batch_size=batch_size)
+            BaseUser.companies.through.objects.bulk_create(
+                [BaseUser.companies.through(baseuser_id=user.pk, company_id=company.pk) for user in users],
+                batch_size=batch_size)
+            if company_groups:
+                BaseUser.company_groups.through.objects.bulk_create(
+                    [BaseUser.company_groups.through(baseuser_id=user.pk,
+                                                     company_group_id=company_groups[u % len(company_groups)].pk)
+                     for u, user in enumerate(users)],
+                    batch_size=batch_size)
+            employees = Employee.objects.bulk_create(
+                [Employee(company=company, user=user, personnel_code=str(u)) for u, user in enumerate(users)],
+                batch_size=batch_size)
+
+            positions = Company_position.objects.bulk_create(
+                [Company_position(company_id=company, title=f'{company.title}-position-{p}')
+                 for p in range(positions_per_company)],
+                batch_size=batch_size)
+            departments = _create_department_tree(company=company, depth=department_depth, fan_out=department_fan_out,
+                                                  managers=employees, batch_size=batch_size)
+            if departments:
+                Company_department_employee.objects.bulk_create(
+                    [Company_department_employee(company_department=departments[e % len(departments)],
+                                                 employee=employee)
+                     for e, employee in enumerate(employees)],
+                    batch_size=batch_size)
+            if positions:
+                Company_department_position.objects.bulk_create(
+                    [Company_department_position(company_department=department, company_position=position)
+                     for department in departments
+                     for position in rnd.sample(positions, min(positions_per_department, len(positions)))],
+                    batch_size=batch_size)
+
+            processes = Process.objects.bulk_create(
+                [Process(company=company, created_by=owner, name=f'process-{p}') for p in range(processes_per_company)])
+            actions = Action.objects.bulk_create(
+                [Action(process=process, name=f'action-{a}', code_name=f'action-{a}',
+                        route=f'/{process.name}/action-{a}')
+                 for process in processes for a in range(actions_per_process)],
+                batch_size=batch_size)
+            app_processes = Process.objects.bulk_create(
+                [Process(company=company, created_by=owner, name=name) for name in APP_PROCESS_ACTIONS])
+            app_actions = Action.objects.bulk_create(
+                [Action(process=process, name=code_name, code_name=code_name)
+                 for process in app_processes for code_name in APP_PROCESS_ACTIONS[process.name]])
+
+            granted = int(len(actions) * granted_ratio)
+            permission_rows = (
+                (company_group.pk, action_permission.pk, action.pk)
+                for company_group in company_groups for action in [*app_actions, *rnd.sample(actions, granted)])
+            granted_count = _insert_rows(model=ActionGroupObjectPermission,
+                                         columns=['group_id', 'permission_id', 'content_object_id'],
+                                         rows=permission_rows, batch_size=batch_size)
+
+        if manifest is not None:
+            manifest.append({
+                'company_id': company.pk,
+                'users': [{'id': user.pk, 'email': user.email} for user in users],
+                'company_group_ids': [company_group.pk for company_group in company_groups],
+                'action_ids': [action.pk for action in actions],
+            })
+        for key, count in (('companies', 1), ('users', len(users)), ('employees', len(employees)),
+                           ('departments', len(departments)), ('positions', len(positions)),
+                           ('processes', len(processes) + len(app_processes)),
+                           ('actions', len(actions) + len(app_actions)),
+                           ('company_groups', len(company_groups)), ('group_object_permissions', granted_count)):
+            totals[key] += count
+        if progress:
+            progress(c + 1, totals)
+
+    return totals
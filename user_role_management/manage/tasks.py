@@ -0,0 +1,23 @@
+from typing import Any, Dict
+from celery import shared_task
+from django.core.cache import cache
+from user_role_management.core.exceptions import ApplicationError
+from user_role_management.manage.services import company as company_services
+from user_role_management.manage.selectors.company import PROVISIONING_PROGRESS_KEY
+
+# Large tenants take longer than the global CELERY_TASK_SOFT_TIME_LIMIT
+PROVISION_COMPANY_SOFT_TIME_LIMIT = 60 * 30  # seconds
+
+
+@shared_task(bind=True, soft_time_limit=PROVISION_COMPANY_SOFT_TIME_LIMIT,
+             time_limit=PROVISION_COMPANY_SOFT_TIME_LIMIT + 60)
+def provision_company(self, spec: Dict[str, Any], created_by_id: int) -> Dict[str, Any]:
+    # In the cache, the result backend is written in the transaction of the provisioning
+    def report(step, current, total):
+        cache.set(PROVISIONING_PROGRESS_KEY.format(task_id=self.request.id),
+                  {'step': step, 'current': current, 'total': total}, timeout=PROVISION_COMPANY_SOFT_TIME_LIMIT + 60)
+
+    provisioned = company_services.provision_company(spec=spec, created_by_id=created_by_id, progress=report)
+    if not provisioned['is_success']:
+        raise ApplicationError(provisioned['message'])
+    return {'company_id': provisioned['data'].id}
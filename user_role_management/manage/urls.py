@@ -1,12 +1,15 @@
 from django.urls import path
-from user_role_management.manage.apis.v1 import user, process_action, company, organization_chart, permission
+from user_role_management.api.asynchronous import read_api
+from user_role_management.manage.apis.v1 import user, process_action, company, organization_chart, permission, dashboard
 
 urlpatterns = [
-    path('user/', user.UsersApi.as_view(), name="users"),
+    path('user/', read_api(user.UsersApi), name="users"),
     path('user/<int:user_id>', user.UserApi.as_view(), name="user"),
 
     path('company/', company.CompaniesApi.as_view(), name="companies"),
     path('company/<int:company_id>', company.CompanyApi.as_view(), name="company"),
+    path('company/provisioning/', company.CompanyProvisioningsApi.as_view(), name="company_provisionings"),
+    path('company/provisioning/<str:task_id>', company.CompanyProvisioningApi.as_view(), name="company_provisioning"),
 
     path('group/', company.GroupsApi.as_view(), name="groups"),
     path('group/<int:group_id>', company.GroupApi.as_view(), name="group"),
@@ -20,9 +23,12 @@ urlpatterns = [
     path('permission/', permission.PermissionsApi.as_view(), name="permissions"),
     path('permission/<int:permission_id>', permission.PermissionApi.as_view(), name="permission"),
 
-    path('user_permissions/', permission.UserPermissionsApi.as_view(), name="user_permissions"),
+    path('user_permissions/', read_api(permission.UserPermissionsApi), name="user_permissions"),
 
-    path('employee/', organization_chart.EmployeesApi.as_view(), name="employees"),
+    path('role_template/', permission.RoleTemplatesApi.as_view(), name="role_templates"),
+    path('role_template/<int:role_template_id>', permission.RoleTemplateApi.as_view(), name="role_template"),
+
+    path('employee/', read_api(organization_chart.EmployeesApi), name="employees"),
     path('employee/<int:employee_id>', organization_chart.EmployeeApi.as_view(), name="employee"),
 
     path('Company_position/', organization_chart.CompanyPositionsApi.as_view(), name="Company_positions"),
@@ -43,4 +49,5 @@ urlpatterns = [
     path('action/', process_action.ActionsApi.as_view(), name="actions"),
     path('action/<int:action_id>', process_action.ActionApi.as_view(), name="action"),
 
+    path('dashboard/', read_api(dashboard.DashboardApi), name="dashboard"),
 ]
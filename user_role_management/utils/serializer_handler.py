@@ -21,3 +21,29 @@ class FilterSerializerBase(serializers.Serializer):
 
 class FilterWithSearchSerializerBase(FilterSerializerBase):
     search = serializers.CharField(max_length=100, required=False)
+
+
+class BatchUpdateSerializerBase(serializers.Serializer):
+    """
+    Subclasses declare ``items`` as a ``many=True`` serializer of ``{id, fields}`` items.
+    """
+    max_items = 1000
+
+    def validate_items(self, items):
+        if len(items) > self.max_items:
+            raise serializers.ValidationError(f"Ensure this field has no more than {self.max_items} elements.")
+        return items
+
+
+class BatchUpdateItemStatusSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    is_success = serializers.BooleanField()
+    updated_fields = serializers.ListField(child=serializers.CharField(), required=False)
+    message = serializers.CharField(required=False)
+
+
+class CustomBatchUpdateResponseSerializer(CustomSingleResponseSerializerBase):
+    data = serializers.ListSerializer(child=BatchUpdateItemStatusSerializer())
+
+    class Meta:
+        fields = ('is_success', 'data')
@@ -1,7 +1,3 @@
-from rest_framework import serializers
-from django.core.exceptions import ValidationError
-
-
 def create_fields(**kwargs):
     fields = {}
     for key, value in kwargs.items():
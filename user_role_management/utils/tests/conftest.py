@@ -0,0 +1,112 @@
+from contextlib import contextmanager
+
+import pytest
+from django.contrib.auth.models import Group
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from user_role_management.api.middleware import QueryCountMiddleware, collect_queries
+from user_role_management.manage.models import BaseUser, Company, Company_group, Employee
+from user_role_management.utils.tests.base import faker
+
+
+@pytest.fixture
+def company():
+    return Company.objects.create(title=faker.company())
+
+
+@pytest.fixture
+def company_group(company):
+    return Company_group.objects.create(company=company, group=Group.objects.create(name=faker.job()))
+
+
+@pytest.fixture
+def password():
+    return faker.password()
+
+
+@pytest.fixture
+def user(company, company_group, password):
+    """
+    A user logged in `company` and a member of its `company_group`; `password`
+    is their password.
+    """
+    user = BaseUser.objects.create_user(email=faker.email(), password=password)
+    user.last_company_logged_in = company
+    user.save()
+    user.company_groups.add(company_group)
+    return user
+
+
+@pytest.fixture
+def employee(user, company):
+    return Employee.objects.create(company=company, user=user, personnel_code='1')
+
+
+@pytest.fixture
+def api_client(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+@pytest.fixture
+def authorization(user):
+    return f'Bearer {AccessToken.for_user(user)}'
+
+
+@pytest.fixture
+def jwt_client(authorization):
+    """
+    Authenticated by the JWT authentication class, unlike `api_client`.
+    """
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=authorization)
+    return client
+
+
+@pytest.fixture
+def query_budget(monkeypatch, settings):
+    """
+    Fails the test when a request made inside the block goes over the query
+    budget declared for the API class, or is served by another API:
+
+        def test_employees_list(api_client, query_budget):
+            with query_budget(EmployeesApi, 4):
+                api_client.get(reverse('api:manage:employees'))
+
+    The block yields the `query_stats` of its requests, as QueryCountMiddleware
+    recorded them.
+    """
+    settings.QUERY_COUNT_ENABLED = True
+    recorded = []
+    record = QueryCountMiddleware.record
+
+    def record_query_stats(self, request, response, collector):
+        response = record(self, request, response, collector)
+        recorded.append(request.query_stats)
+        return response
+
+    monkeypatch.setattr(QueryCountMiddleware, 'record', record_query_stats)
+
+    @contextmanager
+    def _query_budget(api_class, budget: int):
+        start = len(recorded)
+        requests = []
+        with collect_queries() as collector:
+            yield requests
+        requests.extend(recorded[start:])
+
+        if not requests:
+            pytest.fail(f"No request to {api_class.__name__} was made.")
+        other_views = sorted({stats['view'] for stats in requests} - {api_class.__name__})
+        if other_views:
+            pytest.fail(f"The block is budgeted for {api_class.__name__}, it requested {', '.join(other_views)}.")
+        over = [stats['count'] for stats in requests if stats['count'] > budget]
+        if over:
+            duplicates = "\n".join(f"  {duplicate['count']}x {duplicate['sql']}"
+                                   for duplicate in collector.get_duplicates().values())
+            pytest.fail(f"{api_class.__name__} ran {max(over)} queries, budget is {budget}.\n"
+                        f"Repeated queries:\n{duplicates or '  -'}")
+
+    return _query_budget
@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.base import BaseHandler
+from django.test import AsyncClient, AsyncRequestFactory, RequestFactory
+from django.urls import path
+
+from user_role_management.api.asynchronous import async_api
+from user_role_management.manage.apis.v1.organization_chart import EmployeesApi
+
+urlpatterns = [
+    path('employees/', async_api(EmployeesApi)),
+]
+
+
+@pytest.mark.django_db
+def test_async_view_responds_like_the_api(authorization, employee):
+    view = async_api(EmployeesApi)
+    # ASGI headers, without the HTTP_ prefix of WSGI
+    response = async_to_sync(view)(AsyncRequestFactory().get('/', {'limit': 10}, AUTHORIZATION=authorization))
+    response.render()
+
+    expected = EmployeesApi.as_view()(RequestFactory().get('/', {'limit': 10}, HTTP_AUTHORIZATION=authorization))
+    expected.render()
+    assert response.status_code == 200
+    assert json.loads(response.content) == json.loads(expected.content)
+    assert json.loads(response.content)['count'] == 1
+
+
+@pytest.mark.django_db
+def test_async_view_authenticates():
+    view = async_to_sync(async_api(EmployeesApi))
+    assert view(AsyncRequestFactory().get('/')).status_code == 401
+    assert view(AsyncRequestFactory().get('/', AUTHORIZATION='Bearer invalid')).status_code == 401
+    # Served by the sync API
+    assert view(AsyncRequestFactory().post('/')).status_code == 401
+
+
+def test_middleware_chain_stays_async(settings, monkeypatch):
+    settings.TRACING_ENABLED = settings.SLOW_QUERY_ENABLED = True
+    settings.DATABASE_REPLICAS = ['replica']
+    adapted = []
+    adapt_method_mode = BaseHandler.adapt_method_mode
+
+    def record_adapted(self, is_async, method, method_is_async=None, debug=False, name=None):
+        if name and name.startswith('middleware') and is_async != (
+                method_is_async if method_is_async is not None else asyncio.iscoroutinefunction(method)):
+            adapted.append(name)
+        return adapt_method_mode(self, is_async, method, method_is_async, debug, name)
+    monkeypatch.setattr(BaseHandler, 'adapt_method_mode', record_adapted)
+
+    ASGIHandler()
+    # Sync only, the adapted handler is dropped with the middleware, disabled
+    assert adapted == ['middleware user_role_management.api.middleware.ProfilingMiddleware']
+
+
+@pytest.mark.django_db
+@pytest.mark.urls(__name__)
+def test_asgi_handler_serves_the_async_view(authorization, employee, settings):
+    settings.SLOW_QUERY_ENABLED = True
+
+    async def get():
+        return await AsyncClient().get('/employees/', AUTHORIZATION=authorization)
+    response = async_to_sync(get)()
+
+    assert response.status_code == 200
+    assert json.loads(response.content)['count'] == 1
+    # Collected from the thread the queries run in
+    assert response.asgi_request.query_stats['count'] >= 1
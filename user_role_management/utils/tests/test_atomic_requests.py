@@ -0,0 +1,45 @@
+import pytest
+from django.core.handlers.base import BaseHandler
+from django.db import connection
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from user_role_management.api.mixins import ApiAuthMixin
+from user_role_management.manage.models import Company
+
+
+class CompanyApi(ApiAuthMixin, APIView):
+    authentication_classes = ()
+    permission_classes = ()
+
+    def get(self, request):
+        return Response({'in_transaction': connection.in_atomic_block})
+
+    def post(self, request):
+        Company.objects.create(title=request.data['title'])
+        if request.data.get('unhandled'):
+            raise RuntimeError('unhandled')
+        raise ValidationError('invalid')
+
+
+@pytest.fixture
+def view(monkeypatch):
+    monkeypatch.setitem(connection.settings_dict, 'ATOMIC_REQUESTS', True)
+    # Wrapped like the request handler does
+    return BaseHandler().make_view_atomic(CompanyApi.as_view())
+
+
+@pytest.mark.django_db(transaction=True)
+def test_safe_methods_run_in_autocommit(view):
+    assert view(APIRequestFactory().get('/')).data == {'in_transaction': False}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_writes_roll_back_on_errors(view):
+    assert view(APIRequestFactory().post('/', {'title': 'handled'})).status_code == 400
+    with pytest.raises(RuntimeError):
+        view(APIRequestFactory().post('/', {'title': 'unhandled', 'unhandled': True}))
+
+    assert not Company.objects.filter(title__in=['handled', 'unhandled']).exists()
@@ -0,0 +1,86 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from user_role_management.common.services import model_bulk_update
+from user_role_management.manage.models import BaseUser, Company, Company_position, Employee
+from user_role_management.utils.tests.base import faker
+
+
+@pytest.fixture
+def companies():
+    return [Company.objects.create(title=title) for title in ('Acme', 'Globex')]
+
+
+@pytest.fixture
+def positions(companies):
+    return [Company_position.objects.create(company_id=companies[0], title=f'position {index}')
+            for index in range(5)]
+
+
+@pytest.mark.django_db
+def test_repeated_ids_are_rejected(positions):
+    statuses = model_bulk_update(model=Company_position, items=[
+        {'id': positions[0].id, 'fields': {'title': 'first'}},
+        {'id': positions[1].id, 'fields': {'title': 'other'}},
+        {'id': positions[0].id, 'fields': {'title': 'second'}},
+    ])
+
+    assert [status['is_success'] for status in statuses] == [False, True, False]
+    positions[0].refresh_from_db()
+    assert positions[0].title == 'position 0'
+    assert Company_position.objects.get(id=positions[1].id).title == 'other'
+
+
+@pytest.mark.django_db
+def test_unique_values_fail_only_their_item(positions):
+    statuses = model_bulk_update(model=Company_position, items=[
+        {'id': positions[0].id, 'fields': {'title': 'position 4'}},
+        {'id': positions[1].id, 'fields': {'title': 'new'}},
+        {'id': positions[2].id, 'fields': {'title': 'new'}},
+        {'id': positions[3].id, 'fields': {'abbreviation': 'p3'}},
+    ])
+
+    assert [status['is_success'] for status in statuses] == [False, True, False, True]
+    assert 'already exists' in statuses[0]['message']
+    assert 'already exists' in statuses[2]['message']
+    assert dict(Company_position.objects.values_list('id', 'title')) == {
+        positions[0].id: 'position 0', positions[1].id: 'new', positions[2].id: 'position 2',
+        positions[3].id: 'position 3', positions[4].id: 'position 4',
+    }
+    assert Company_position.objects.get(id=positions[3].id).abbreviation == 'p3'
+
+
+@pytest.mark.django_db
+def test_unique_together_is_checked_when_one_of_its_fields_changes(companies):
+    users = [BaseUser.objects.create_user(email=faker.email(), password=faker.password()) for _ in range(2)]
+    employees = [Employee.objects.create(company=company, user=user, personnel_code='1')
+                 for company, user in zip(companies, users)]
+
+    statuses = model_bulk_update(model=Employee, items=[
+        {'id': employees[1].id, 'fields': {'company': companies[0].id, 'user': users[0].id}},
+    ])
+
+    assert not statuses[0]['is_success']
+    assert Employee.objects.get(id=employees[1].id).company_id == companies[1].id
+
+
+@pytest.mark.django_db
+def test_foreign_keys_are_checked_with_one_query(companies, positions):
+    def run(items):
+        with CaptureQueriesContext(connection) as queries:
+            statuses = model_bulk_update(model=Company_position, items=items)
+        return statuses, len(queries)
+
+    _, few = run([{'id': position.id, 'fields': {'company_id': companies[1].id}} for position in positions[:1]])
+    statuses, many = run([{'id': position.id, 'fields': {'company_id': companies[1].id}} for position in positions[1:]])
+
+    assert all(status['is_success'] for status in statuses)
+    assert many == few
+    assert set(Company_position.objects.values_list('company_id', flat=True)) == {companies[1].id}
+
+    statuses, _ = run([{'id': positions[0].id, 'fields': {'company_id': companies[0].id}},
+                       {'id': positions[1].id, 'fields': {'company_id': 0}}])
+    assert [status['is_success'] for status in statuses] == [True, False]
+    assert 'does not exist' in statuses[1]['message']
+    assert Company_position.objects.get(id=positions[1].id).company_id_id == companies[1].id
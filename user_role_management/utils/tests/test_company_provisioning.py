@@ -0,0 +1,84 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from user_role_management.manage.models import Action, Company, Company_department, Company_group, Process
+from user_role_management.manage.selectors.company import get_company_provisioning
+from user_role_management.manage.services import company as company_services
+from user_role_management.manage.tasks import provision_company
+
+SPEC = {
+    'title': 'Acme',
+    'groups': [{'name': 'operators', 'permissions': ['manage.view_company']}],
+    'processes': [{'name': 'user_management',
+                   'actions': [{'name': 'Add employee', 'code_name': 'can_add_employee', 'route': None}]}],
+    'positions': [{'title': 'CTO', 'abbreviation': 'cto'}],
+    'departments': [{'department': 'R&D', 'parent_department': None},
+                    {'department': 'Platform', 'parent_department': 'R&D'}],
+}
+
+
+@pytest.mark.django_db
+def test_provisioning_runs_the_steps_in_order(user):
+    steps = []
+    provisioned = company_services.provision_company(
+        spec=SPEC, created_by_id=user.id, progress=lambda *step: steps.append(step))
+
+    assert provisioned['is_success']
+    total = len(company_services.PROVISIONING_STEPS)
+    assert steps == [(step, index + 1, total) for index, step in enumerate(company_services.PROVISIONING_STEPS)]
+    company = provisioned['data']
+    assert Company_group.objects.get(company=company).permissions.get().codename == 'view_company'
+    assert Action.objects.get(process__company=company).code_name == 'can_add_employee'
+    assert Company_department.objects.get(company=company, department='Platform').parent_department.department == 'R&D'
+
+
+@pytest.mark.django_db
+def test_failed_provisioning_is_rolled_back(user):
+    spec = {**SPEC, 'departments': [{'department': 'Platform', 'parent_department': 'R&D'}]}
+    provisioned = company_services.provision_company(spec=spec, created_by_id=user.id)
+
+    assert not provisioned['is_success']
+    assert not Company.objects.filter(title='Acme').exists()
+    assert not Process.objects.exists()
+
+
+def poll(task_id):
+    # From another connection, like the pollers of the API
+    try:
+        return get_company_provisioning(request=None, task_id=task_id)['data']
+    finally:
+        connection.close()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_progress_is_visible_during_the_transaction(user, monkeypatch):
+    seen = []
+    create_departments = company_services._bulk_create_departments
+
+    def poll_then_create_departments(**kwargs):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            seen.append(executor.submit(poll, 'provisioning').result())
+        return create_departments(**kwargs)
+    monkeypatch.setattr(company_services, '_bulk_create_departments', poll_then_create_departments)
+
+    provision_company.apply(kwargs={'spec': SPEC, 'created_by_id': user.id}, task_id='provisioning')
+    assert seen[0]['state'] == 'PROGRESS'
+    assert seen[0]['progress'] == {'step': 'positions', 'current': 5, 'total': 7}
+
+
+@pytest.mark.django_db
+def test_provisioning_endpoints(api_client, monkeypatch):
+    monkeypatch.setattr(provision_company, 'store_eager_result', True)
+    response = api_client.post(reverse('api:manage:company_provisionings'), SPEC, format='json')
+    assert response.status_code == 202
+    task_id = response.data['data']['task_id']
+
+    data = api_client.get(reverse('api:manage:company_provisioning', args=[task_id])).data['data']
+    assert data['state'] == 'SUCCESS'
+    assert data['result'] == {'company_id': Company.objects.get(title='Acme').id}
+
+    response = api_client.post(reverse('api:manage:company_provisionings'), {'groups': []}, format='json')
+    assert response.status_code == 400
@@ -0,0 +1,41 @@
+import pytest
+from django.db import connection
+
+from user_role_management.core.connections import check_connections
+
+
+@pytest.fixture
+def checked_connection(monkeypatch):
+    checks, closed = [], []
+    usable = [True]
+    monkeypatch.setattr(connection, 'close', lambda: closed.append(connection.alias))
+    monkeypatch.setattr(connection, 'is_usable', lambda: checks.append(connection.alias) or usable[0])
+    monkeypatch.setitem(connection.settings_dict, 'CONN_HEALTH_CHECKS', True)
+    connection.ensure_connection()
+    return checks, closed, usable
+
+
+@pytest.mark.django_db
+def test_connections_are_checked_once_on_first_use(checked_connection):
+    checks, closed, _ = checked_connection
+
+    check_connections()
+    assert checks == []
+
+    for _ in range(2):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+    assert checks == [connection.alias]
+    assert closed == []
+
+
+@pytest.mark.django_db
+def test_dropped_connections_are_closed(checked_connection):
+    checks, closed, usable = checked_connection
+    usable[0] = False
+
+    check_connections()
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+
+    assert closed == [connection.alias]
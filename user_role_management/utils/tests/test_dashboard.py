@@ -0,0 +1,57 @@
+import json
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory
+from django.urls import reverse
+
+from user_role_management.api.asynchronous import async_api
+from user_role_management.api.middleware import collect_queries
+from user_role_management.core.concurrency import run_concurrently
+from user_role_management.manage.apis.v1.dashboard import DashboardApi
+from user_role_management.manage.models import Process
+
+
+@pytest.fixture
+def process(user, company):
+    return Process.objects.create(company=company, created_by=user, name='user_management')
+
+
+@pytest.mark.django_db
+def test_dashboard_sections(jwt_client, employee, process):
+    data = jwt_client.get(reverse('api:manage:dashboard')).data['data']
+    assert set(data) == {'permissions', 'employees', 'processes', 'actions'}
+    assert (data['employees']['count'], data['processes']['count'], data['actions']['count']) == (1, 1, 0)
+
+    data = jwt_client.get(reverse('api:manage:dashboard'), {'sections': 'employees'}).data['data']
+    assert set(data) == {'employees'}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sections_run_concurrently(authorization, employee, process):
+    def count_processes():
+        return threading.current_thread().name, Process.objects.count()
+
+    results = run_concurrently({'first': count_processes, 'second': count_processes})
+    assert [count for _, count in results.values()] == [1, 1]
+    assert all(name.startswith('fan_out') for name, _ in results.values())
+
+    response = async_to_sync(async_api(DashboardApi))(AsyncRequestFactory().get('/', AUTHORIZATION=authorization))
+    response.render()
+    assert json.loads(response.content)['data']['employees']['count'] == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_queries_of_the_sections_are_collected(jwt_client, employee, process, settings):
+    with collect_queries() as collector:
+        run_concurrently({'first': lambda: Process.objects.count(), 'second': lambda: Process.objects.count()})
+    assert collector.count == 2
+
+    # Caches the user snapshot
+    jwt_client.get(reverse('api:manage:dashboard'))
+    counts = []
+    for workers in (0, 4):
+        settings.FAN_OUT_MAX_WORKERS = workers
+        counts.append(jwt_client.get(reverse('api:manage:dashboard')).wsgi_request.query_stats['count'])
+    assert counts[0] == counts[1]
@@ -0,0 +1,119 @@
+import pytest
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import DEFAULT_DB_ALIAS
+from django.urls import reverse
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from user_role_management.core.permission import url_action_perm
+from user_role_management.guardian.models import ActionGroupObjectPermission, GroupObjectPermission, \
+    ProcessGroupObjectPermission
+from user_role_management.guardian.shortcuts import assign_perm, set_group_object_perms
+from user_role_management.guardian.utils import move_group_object_permissions_to_direct_models
+from user_role_management.manage.models import Action, Company, Process
+from user_role_management.manage.selectors.permission import get_user_permissions
+
+PERMISSION = 'dg_can_do_this_action'
+
+
+@pytest.fixture
+def actions(user, company):
+    process = Process.objects.create(company=company, created_by=user, name='process')
+    return [Action.objects.create(process=process, name=name, code_name=name) for name in ('a', 'b')]
+
+
+def check_url_action_perm(user, action):
+    @url_action_perm(process_name=action.process.name, action_name=action.code_name, permission_codename=PERMISSION)
+    def view(self, request):
+        return Response()
+
+    request = APIRequestFactory().get('/')
+    request.user = user
+    return view(None, request).status_code
+
+
+def create_generic_grants(company_group, object_pks):
+    action_ctype = ContentType.objects.get_for_model(Action)
+    permission = Permission.objects.get(content_type=action_ctype, codename=PERMISSION)
+    GroupObjectPermission.objects.bulk_create([
+        GroupObjectPermission(group=company_group, permission=permission, content_type=action_ctype, object_pk=pk)
+        for pk in object_pks])
+    return permission
+
+
+@pytest.mark.django_db
+def test_move_to_direct_models(user, company_group, actions):
+    granted, other = actions
+    permission = create_generic_grants(company_group, [str(granted.pk), str(other.pk), '999999'])
+    assert check_url_action_perm(user, granted) == 401
+    # Moved by an earlier run, its generic row written again by an old process
+    ActionGroupObjectPermission.objects.create(group=company_group, permission=permission, content_object=other)
+
+    assert move_group_object_permissions_to_direct_models() == {'action': (1, 1), 'process': (0, 0)}
+
+    # The orphan is left to clean_orphan_obj_perms
+    assert list(GroupObjectPermission.objects.values_list('object_pk', flat=True)) == ['999999']
+    assert sorted(ActionGroupObjectPermission.objects.values_list('content_object_id', flat=True)) == \
+        [granted.pk, other.pk]
+    assert check_url_action_perm(user, granted) == 200
+
+
+@pytest.mark.django_db
+def test_migrate_leaves_the_generic_rows(user, company_group, actions):
+    granted, other = actions
+    create_generic_grants(company_group, [str(granted.pk), '999999'])
+
+    emit_post_migrate_signal(verbosity=0, interactive=False, db=DEFAULT_DB_ALIAS)
+
+    assert GroupObjectPermission.objects.count() == 2
+    assert not ActionGroupObjectPermission.objects.exists()
+
+
+@pytest.mark.django_db
+def test_permissions_are_assigned_and_read_through_direct_models(user, company_group, actions, rf):
+    granted, _ = actions
+    assign_perm(PERMISSION, company_group, granted)
+    assign_perm('view_process', company_group, granted.process)
+
+    assert ActionGroupObjectPermission.objects.filter(group=company_group, content_object=granted).exists()
+    assert ProcessGroupObjectPermission.objects.filter(group=company_group, content_object=granted.process).exists()
+    assert not GroupObjectPermission.objects.exists()
+
+    request = rf.get('/')
+    request.user = user
+    permissions = get_user_permissions(request)
+    assert list(permissions['access_processes']) == [granted.process]
+    assert list(permissions['access_actions']) == [granted]
+
+
+@pytest.mark.django_db
+def test_set_perms_on_direct_models(company_group, actions):
+    granted, other = actions
+    action_ctype = ContentType.objects.get_for_model(Action)
+    assign_perm(PERMISSION, company_group, other)
+
+    diff = set_group_object_perms(company_group, action_ctype, {granted.pk: [PERMISSION], other.pk: []})
+
+    assert diff == {'added': {str(granted.pk): [PERMISSION]}, 'removed': {str(other.pk): [PERMISSION]}}
+    assert list(ActionGroupObjectPermission.objects.values_list('content_object_id', flat=True)) == [granted.pk]
+
+
+@pytest.mark.django_db
+def test_generic_endpoint_rejects_direct_model_content_types(api_client, company, company_group, actions):
+    granted, _ = actions
+    grant = {'group_id': company_group.id, 'content_type_id': ContentType.objects.get_for_model(Action).id,
+             'permission_id': Permission.objects.get(codename=PERMISSION).id, 'object_pk': granted.pk}
+
+    response = api_client.post(reverse('api:permission:group_object_permissions'), grant)
+    assert response.status_code == 400
+    assert 'ActionGroupObjectPermission' in response.data['message']
+    assert not GroupObjectPermission.objects.exists()
+
+    company_ctype = ContentType.objects.get_for_model(Company)
+    response = api_client.post(reverse('api:permission:group_object_permissions'), {
+        **grant, 'content_type_id': company_ctype.id, 'object_pk': company.id,
+        'permission_id': Permission.objects.get(content_type=company_ctype, codename='view_company').id})
+    assert response.status_code == 200
+    assert GroupObjectPermission.objects.get().content_type == company_ctype
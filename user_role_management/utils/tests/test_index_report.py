@@ -0,0 +1,23 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from user_role_management.common.selectors import indexes as indexes_selector
+
+
+@pytest.mark.django_db
+def test_declared_indexes_are_created():
+    assert indexes_selector.get_missing_declared_indexes() == []
+
+
+@pytest.mark.django_db
+def test_index_report_lists_a_dropped_index():
+    with connection.cursor() as cursor:
+        cursor.execute('DROP INDEX "manage_employee_company_id_idx"')
+    out = StringIO()
+
+    call_command('index_report', stdout=out)
+
+    assert 'manage_employee.manage_employee_company_id_idx (company, -id)' in out.getvalue()
@@ -0,0 +1,53 @@
+import pytest
+from django.core.management import call_command
+
+from user_role_management.guardian.conf import settings as guardian_settings
+from user_role_management.guardian.core import ObjectPermissionChecker
+from user_role_management.guardian.models import GroupObjectPermission, IntegerGroupObjectPermission
+from user_role_management.guardian.shortcuts import assign_perm, get_objects_for_user
+from user_role_management.manage.models import Company_position
+
+PERMISSION = 'change_company_position'
+
+
+@pytest.fixture
+def positions(company, company_group):
+    granted, other = [Company_position.objects.create(company_id=company, title=title) for title in ('a', 'b')]
+    assign_perm(PERMISSION, company_group, granted)
+    return granted, other
+
+
+@pytest.fixture
+def integer_object_keys(monkeypatch):
+    monkeypatch.setattr(guardian_settings, 'USER_OBJ_PERMS_MODEL', 'guardian.IntegerUserObjectPermission')
+    monkeypatch.setattr(guardian_settings, 'GROUP_OBJ_PERMS_MODEL', 'guardian.IntegerGroupObjectPermission')
+
+
+@pytest.mark.django_db
+def test_copy_to_integer_keys_skips_copied_and_not_integer_rows(positions):
+    granted, _ = positions
+    not_integer = GroupObjectPermission.objects.get()
+    # bulk_create skips the save() check of the object the permission is on
+    GroupObjectPermission.objects.bulk_create([GroupObjectPermission(
+        group=not_integer.group, permission=not_integer.permission, content_type=not_integer.content_type,
+        object_pk='not-an-integer')])
+
+    call_command('copy_object_permissions_to_integer_keys', verbosity=0)
+    call_command('copy_object_permissions_to_integer_keys', verbosity=0)
+
+    assert list(IntegerGroupObjectPermission.objects.values_list('object_pk', flat=True)) == [granted.pk]
+
+
+@pytest.mark.django_db
+def test_integer_keys_are_checked_without_casts(user, positions, integer_object_keys):
+    granted, other = positions
+    call_command('copy_object_permissions_to_integer_keys', verbosity=0)
+
+    permitted = get_objects_for_user(user, f'manage.{PERMISSION}', klass=Company_position, accept_global_perms=False)
+    assert 'CAST' not in str(permitted.query)
+    assert list(permitted) == [granted]
+
+    checker = ObjectPermissionChecker(user)
+    checker.prefetch_perms([granted, other])
+    assert checker.has_perm(PERMISSION, granted) and not checker.has_perm(PERMISSION, other)
+    assert ObjectPermissionChecker(user).has_perm(PERMISSION, granted)
@@ -0,0 +1,43 @@
+import pytest
+from django.urls import reverse
+
+from user_role_management.core.metrics import URL_ACTION_PERM_CHECKS
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_exposes_view_latency(api_client, settings):
+    settings.DEBUG = True
+    api_client.get(reverse('api:manage:employees'))
+    response = api_client.get(reverse('metrics'))
+
+    assert response.status_code == 200
+    assert b'http_request_duration_seconds_count{method="GET",status="200",view="EmployeesApi"}' in response.content
+    assert b'http_request_db_queries_count{view="EmployeesApi"}' in response.content
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_requires_token_when_set(api_client, settings):
+    settings.METRICS_TOKEN = 'secret'
+
+    assert api_client.get(reverse('metrics')).status_code == 401
+    assert api_client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer secret').status_code == 200
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_is_closed_without_token_unless_debug(api_client, settings):
+    settings.METRICS_TOKEN = ''
+
+    settings.DEBUG = False
+    assert api_client.get(reverse('metrics')).status_code == 403
+    settings.DEBUG = True
+    assert api_client.get(reverse('metrics')).status_code == 200
+
+
+@pytest.mark.django_db
+def test_url_action_perm_outcome_is_counted(api_client):
+    denied = URL_ACTION_PERM_CHECKS.labels(process='user_management', action='can_add_employee', outcome='no_process')
+    before = denied._value.get()
+
+    api_client.post(reverse('api:manage:employees'), {'company_id': 1, 'personnel_code': '1', 'user_id': 1})
+
+    assert denied._value.get() == before + 1
@@ -0,0 +1,93 @@
+import pytest
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.db.models.signals import pre_save
+from django.test.utils import CaptureQueriesContext
+
+from user_role_management.common.services import model_update, model_update_by_id
+from user_role_management.manage.models import BaseUser, Company, Company_group
+from user_role_management.utils.tests.base import faker
+
+
+@pytest.fixture
+def saved_fields():
+    saved = []
+
+    def receiver(sender, update_fields, **kwargs):
+        saved.append(set(update_fields) if update_fields is not None else None)
+
+    pre_save.connect(receiver)
+    yield saved
+    pre_save.disconnect(receiver)
+
+
+@pytest.mark.django_db
+def test_nothing_changed_is_not_written(django_assert_num_queries, saved_fields):
+    company = Company.objects.create(title='Acme')
+    saved_fields.clear()
+
+    with django_assert_num_queries(0):
+        instance, has_updated = model_update(instance=company, fields=['title', 'unknown'],
+                                             data={'title': 'Acme', 'unknown': 1}, validate=True)
+
+    assert (instance, has_updated) == (company, False)
+    assert saved_fields == []
+
+
+@pytest.mark.django_db
+def test_only_changed_fields_are_written(saved_fields):
+    company = Company.objects.create(title='Acme')
+    updated_at = company.updated_at
+    saved_fields.clear()
+
+    instance, has_updated = model_update_by_id(model=Company, id=company.id,
+                                               data={'title': 'Globex', 'created_at': company.created_at})
+
+    assert has_updated
+    assert saved_fields == [{'title', 'updated_at'}]
+    company.refresh_from_db()
+    assert company.title == 'Globex'
+    assert company.updated_at > updated_at
+
+
+@pytest.mark.django_db
+def test_missing_row_raises():
+    with pytest.raises(Company.DoesNotExist):
+        model_update_by_id(model=Company, id=0, data={'title': 'Acme'})
+
+
+@pytest.mark.django_db
+def test_company_group_name_follows_its_relations(saved_fields):
+    company, other_company = Company.objects.create(title='Acme'), Company.objects.create(title='Globex')
+    group, other_group = Group.objects.create(name='operators'), Group.objects.create(name='admins')
+    company_group = Company_group.objects.create(company=company, group=group)
+    saved_fields.clear()
+
+    company_group, _ = model_update_by_id(model=Company_group, id=company_group.id,
+                                          data={'company_id': other_company.id, 'group': other_group})
+    assert saved_fields == [{'company', 'group', 'name'}]
+    assert Company_group.objects.get(id=company_group.id).name == 'Globex_admins'
+
+    saved_fields.clear()
+    model_update_by_id(model=Company_group, id=company_group.id, data={'name': 'custom'})
+    assert saved_fields == [{'name'}]
+    assert Company_group.objects.get(id=company_group.id).name == 'custom'
+
+
+@pytest.mark.django_db
+def test_base_user_update_is_validated():
+    taken = BaseUser.objects.create_user(email=faker.email(), password=faker.password())
+    user = BaseUser.objects.create_user(email=faker.email(), password=faker.password())
+
+    assert not BaseUser._update(user.id, email='not an email')['is_success']
+    updated = BaseUser._update(user.id, email=taken.email)
+    assert not updated['is_success']
+    assert 'already exists' in updated['message']
+    assert BaseUser.objects.get(id=user.id).email == user.email
+
+    # The unique email is only checked when the email changes
+    with CaptureQueriesContext(connection) as queries:
+        updated = BaseUser._update(user.id, email=user.email, first_name='Ada')
+    assert updated['is_success']
+    assert updated['data'].first_name == 'Ada'
+    assert not [query for query in queries if query['sql'].startswith('SELECT') and '"email" =' in query['sql']]
@@ -0,0 +1,67 @@
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from user_role_management.authentication.claims import decode_ids, encode_ids, get_permission_version
+from user_role_management.core.permission import _check_url_action_perm
+from user_role_management.guardian.shortcuts import assign_perm, remove_perm
+from user_role_management.manage.models import Action, Process
+
+PERMISSION = 'dg_can_do_this_action'
+
+
+@pytest.fixture
+def action(user, company, company_group):
+    process = Process.objects.create(company=company, created_by=user, name='user_management')
+    action = Action.objects.create(process=process, name='can_add_employee', code_name='can_add_employee')
+    assign_perm(PERMISSION, company_group, action)
+    return action
+
+
+@pytest.fixture
+def tokens(settings, user, password, action):
+    settings.JWT_PERMISSION_CLAIMS = True
+    return APIClient().post(reverse('api:auth:login'), {'email': user.email, 'password': password}).data
+
+
+def check(user, token):
+    return _check_url_action_perm(user=user, token=AccessToken(token), process_name='user_management',
+                                  action_name='can_add_employee', permission_codename=PERMISSION)[0]
+
+
+def test_ids_round_trip():
+    assert decode_ids(encode_ids([70000, 1, 5, 300, 5])) == {1, 5, 300, 70000}
+    assert decode_ids(encode_ids([])) == set()
+
+
+@pytest.mark.django_db
+def test_url_action_perm_is_checked_from_the_claims(user, action, tokens, django_assert_num_queries):
+    assert decode_ids(AccessToken(tokens['access'])['perms'][PERMISSION]) == {action.pk}
+
+    assert check(user, tokens['access']) == 'allow'
+    with django_assert_num_queries(0):
+        assert check(user, tokens['access']) == 'allow'
+
+
+@pytest.mark.django_db
+def test_stale_claims_fall_back_to_the_database(user, company_group, action, tokens):
+    remove_perm(PERMISSION, company_group, action)
+
+    assert check(user, tokens['access']) == 'deny'
+    refreshed = APIClient().post(reverse('api:auth:refresh'), {'refresh': tokens['refresh']}).data
+    assert AccessToken(refreshed['access'])['perms'] == {}
+
+
+@pytest.mark.django_db
+def test_tokens_minted_before_the_commit_are_stale(user, company_group, action, tokens,
+                                                   django_capture_on_commit_callbacks):
+
+    with django_capture_on_commit_callbacks(execute=True):
+        remove_perm(PERMISSION, company_group, action)
+        # A concurrent login still reads the committed grant, under the version it creates
+        token = AccessToken(tokens['access'])
+        token['pv'] = get_permission_version(user.last_company_logged_in_id)
+        assert check(user, str(token)) == 'allow'
+
+    assert check(user, str(token)) == 'deny'
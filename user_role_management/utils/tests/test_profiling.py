@@ -0,0 +1,45 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+from user_role_management.common.models import Request_profile
+
+
+@pytest.fixture
+def admin_client(user, api_client):
+    user.is_staff = True
+    user.save()
+    return api_client
+
+
+@pytest.fixture
+def profiling(settings):
+    settings.PROFILING_ENABLED = True
+    settings.PROFILING_TOKEN = 'secret'
+
+
+@pytest.mark.django_db
+def test_requests_are_not_profiled_without_token(profiling, admin_client):
+    admin_client.get(reverse('api:manage:employees'))
+
+    assert not Request_profile.objects.exists()
+
+
+@pytest.mark.django_db
+def test_profile_is_recorded_and_downloadable(profiling, admin_client):
+    response = admin_client.get(reverse('api:manage:employees'), HTTP_X_PROFILE='secret')
+
+    profile = Request_profile.objects.get(id=response['X-Profile-Id'])
+    assert profile.view == 'EmployeesApi'
+    assert profile.query_count == len(profile.sql_timeline)
+
+    speedscope = admin_client.get(reverse('api:profiling:request_profile_speedscope', args=[profile.id]))
+    assert json.loads(speedscope.content)['profiles'][0]['type'] == 'sampled'
+    flamegraph = admin_client.get(reverse('api:profiling:request_profile_flamegraph', args=[profile.id]))
+    assert flamegraph['Content-Disposition'] == f'attachment; filename="profile-{profile.id}.collapsed.txt"'
+
+
+@pytest.mark.django_db
+def test_profiles_are_admin_only(profiling, api_client):
+    assert api_client.get(reverse('api:profiling:request_profiles')).status_code == 403
@@ -0,0 +1,55 @@
+import pytest
+from django.urls import reverse
+
+from user_role_management.manage.apis.v1.organization_chart import EmployeesApi
+
+
+@pytest.mark.django_db
+def test_query_count_headers_in_debug(api_client, settings):
+    settings.DEBUG = True
+    response = api_client.get(reverse('api:manage:employees'))
+
+    assert int(response['X-DB-Query-Count']) >= 1
+    assert float(response['X-DB-Time-Ms']) >= 0
+    assert response.wsgi_request.query_stats['view'] == 'EmployeesApi'
+
+
+@pytest.mark.django_db
+def test_query_count_headers_hidden_without_debug(api_client, settings):
+    settings.DEBUG = False
+    response = api_client.get(reverse('api:manage:employees'))
+
+    assert not response.has_header('X-DB-Query-Count')
+    assert response.wsgi_request.query_stats['count'] >= 1
+
+
+@pytest.mark.django_db
+def test_query_budget_fails_when_exceeded(api_client, query_budget):
+    with pytest.raises(pytest.fail.Exception, match="EmployeesApi ran"):
+        with query_budget(EmployeesApi, 0):
+            api_client.get(reverse('api:manage:employees'))
+
+
+@pytest.mark.django_db
+def test_query_budget_passes_within_budget(api_client, query_budget):
+    with query_budget(EmployeesApi, 10) as requests:
+        api_client.get(reverse('api:manage:employees'))
+        api_client.get(reverse('api:manage:employees'))
+
+    assert [stats['view'] for stats in requests] == ['EmployeesApi', 'EmployeesApi']
+    assert all(stats['count'] <= 10 for stats in requests)
+
+
+@pytest.mark.django_db
+def test_query_budget_fails_on_another_api(api_client, query_budget):
+    with pytest.raises(pytest.fail.Exception, match="budgeted for EmployeesApi, it requested CompaniesApi"):
+        with query_budget(EmployeesApi, 10):
+            api_client.get(reverse('api:manage:employees'))
+            api_client.get(reverse('api:manage:companies'))
+
+
+@pytest.mark.django_db
+def test_query_budget_fails_without_request(query_budget):
+    with pytest.raises(pytest.fail.Exception, match="No request to EmployeesApi"):
+        with query_budget(EmployeesApi, 10):
+            pass
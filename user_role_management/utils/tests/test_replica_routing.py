@@ -0,0 +1,42 @@
+import pytest
+from django.db import router
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from user_role_management.api.middleware import ReplicaRoutingMiddleware
+from user_role_management.manage.models import BaseUser
+
+
+def read_database(request):
+    before = router.db_for_read(BaseUser)
+    router.db_for_write(BaseUser)
+    return HttpResponse(f'{before} {router.db_for_read(BaseUser)}')
+
+
+@pytest.fixture
+def middleware(settings):
+    settings.DATABASE_REPLICAS = ['replica']
+    return ReplicaRoutingMiddleware(read_database)
+
+
+def test_safe_requests_read_from_replicas_until_they_write(middleware):
+    assert middleware(RequestFactory().get('/')).content == b'replica default'
+    assert middleware(RequestFactory().post('/')).content == b'default default'
+    assert router.db_for_read(BaseUser) == 'default'
+
+
+@pytest.mark.django_db
+def test_writers_read_from_the_primary(middleware):
+    user = BaseUser.objects.create_user(email='writer@example.com', password='password')
+    authorization = f'Bearer {AccessToken.for_user(user)}'
+
+    response = middleware(RequestFactory().post('/', HTTP_AUTHORIZATION=authorization))
+    assert ReplicaRoutingMiddleware.STICKY_PRIMARY_COOKIE in response.cookies
+
+    request = RequestFactory().get('/')
+    request.COOKIES[ReplicaRoutingMiddleware.STICKY_PRIMARY_COOKIE] = '1'
+    assert middleware(request).content.startswith(b'default')
+    # Other clients of the same user, without the cookie
+    assert middleware(RequestFactory().get('/', HTTP_AUTHORIZATION=authorization)).content.startswith(b'default')
+    assert middleware(RequestFactory().get('/')).content.startswith(b'replica')
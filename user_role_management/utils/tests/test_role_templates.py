@@ -0,0 +1,87 @@
+import pytest
+from django.contrib.auth.models import Group, Permission
+
+from user_role_management.guardian.models import ActionGroupObjectPermission, ProcessGroupObjectPermission
+from user_role_management.guardian.shortcuts import assign_perm
+from user_role_management.manage.models import Action, Company, Company_group, Process, \
+    Role_template_object_permission
+from user_role_management.manage.services.permission import create_role_template, instantiate_role_template
+
+
+def create_process(company, user, name, code_names):
+    process = Process.objects.create(company=company, created_by=user, name=name)
+    return process, [Action.objects.create(process=process, name=code_name, code_name=code_name)
+                     for code_name in code_names]
+
+
+@pytest.fixture
+def template(user):
+    company = Company.objects.create(title='Source')
+    company_group = Company_group.objects.create(company=company, group=Group.objects.create(name='operators'))
+    company_group.permissions.add(Permission.objects.get(codename='view_company'))
+    process, actions = create_process(company, user, 'user_management', ['add_employee', 'remove_employee'])
+    assign_perm('manage.dg_can_view_process', company_group, process)
+    for action in actions:
+        assign_perm('manage.dg_can_do_this_action', company_group, action)
+
+    created = create_role_template(request=None, company_group_id=company_group.id, name='operator')
+    assert created['is_success']
+    return created['data']
+
+
+def object_permissions(company):
+    company_group = Company_group.objects.get(company=company)
+    return (
+        sorted(ProcessGroupObjectPermission.objects.filter(group=company_group)
+               .values_list('content_object__name', 'permission__codename')),
+        sorted(ActionGroupObjectPermission.objects.filter(group=company_group)
+               .values_list('content_object__code_name', 'permission__codename')),
+    )
+
+
+@pytest.mark.django_db
+def test_template_snapshots_the_company_group(template):
+    assert list(template.permissions.values_list('codename', flat=True)) == ['view_company']
+    assert sorted(Role_template_object_permission.objects.filter(role_template=template)
+                  .values_list('process_name', 'action_code_name', 'permission__codename'),
+                  key=lambda row: (row[1] or '', row[2])) == [
+        ('user_management', None, 'dg_can_view_process'),
+        ('user_management', 'add_employee', 'dg_can_do_this_action'),
+        ('user_management', 'remove_employee', 'dg_can_do_this_action'),
+    ]
+
+
+@pytest.mark.django_db
+def test_instantiate_into_companies_by_name(user, template):
+    matching, other = Company.objects.create(title='Matching'), Company.objects.create(title='Other')
+    create_process(matching, user, 'user_management', ['add_employee', 'archive_employee'])
+    create_process(other, user, 'billing', ['add_employee'])
+
+    instantiated = instantiate_role_template(request=None, id=template.id, company_ids=[matching.id, other.id])
+
+    assert instantiated['is_success']
+    assert sorted(instantiated['data'].values_list('company__title', flat=True)) == ['Matching', 'Other']
+    for company_group in instantiated['data']:
+        assert company_group.group_id == template.group_id
+        assert list(company_group.permissions.values_list('codename', flat=True)) == ['view_company']
+    assert object_permissions(matching) == ([('user_management', 'dg_can_view_process')],
+                                            [('add_employee', 'dg_can_do_this_action')])
+    assert object_permissions(other) == ([], [])
+
+
+@pytest.mark.django_db
+def test_instantiating_again_inserts_nothing(user, template):
+    company = Company.objects.create(title='Matching')
+    create_process(company, user, 'user_management', ['add_employee', 'remove_employee'])
+
+    def count():
+        return (Company_group.objects.count(), Company_group.permissions.through.objects.count(),
+                ProcessGroupObjectPermission.objects.count(), ActionGroupObjectPermission.objects.count())
+
+    assert instantiate_role_template(request=None, id=template.id, company_ids=[company.id])['is_success']
+    instantiated = count()
+    assert instantiate_role_template(request=None, id=template.id, company_ids=[company.id])['is_success']
+
+    assert count() == instantiated
+    assert object_permissions(company)[1] == [('add_employee', 'dg_can_do_this_action'),
+                                              ('remove_employee', 'dg_can_do_this_action')]
@@ -0,0 +1,33 @@
+import json
+import logging
+
+import pytest
+from django.urls import reverse
+
+from user_role_management.core.json_logging import JsonFormatter
+
+
+@pytest.mark.django_db
+def test_slow_query_is_logged_with_its_selector_and_plan(api_client, settings, caplog, monkeypatch):
+    # The logger writes JSON to its own handler, caplog listens on the root one
+    monkeypatch.setattr(logging.getLogger('user_role_management.slow_queries'), 'propagate', True)
+    settings.SLOW_QUERY_THRESHOLD_MS = 0
+    settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE = 1
+
+    with caplog.at_level(logging.WARNING, logger='user_role_management.slow_queries'):
+        api_client.get(reverse('api:manage:employees'))
+
+    slow_queries = [record.slow_query for record in caplog.records if hasattr(record, 'slow_query')]
+    employee_query = next(slow_query for slow_query in slow_queries if 'manage_employee' in slow_query['sql'])
+    assert employee_query['origin'] == 'user_role_management.manage.selectors.organization_chart.get_filtered_employees'
+    assert employee_query['explain']
+
+
+def test_json_formatter_puts_extra_fields_at_the_top_level():
+    record = logging.makeLogRecord({'name': 'slow', 'levelname': 'WARNING', 'msg': 'Slow query %s',
+                                    'args': ('x',), 'slow_query': {'duration_ms': 120.5}})
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry['message'] == 'Slow query x'
+    assert entry['slow_query'] == {'duration_ms': 120.5}
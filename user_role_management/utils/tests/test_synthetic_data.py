@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import transaction
+
+from user_role_management.guardian.models import ActionGroupObjectPermission
+from user_role_management.manage.models import Action, BaseUser, Company, Company_department, \
+    Company_department_employee, Company_department_position, Company_group, Company_position, Employee, Process
+from user_role_management.manage.services.synthetic_data import ACTION_PERMISSION, generate_synthetic_data
+
+SHAPE = {
+    'companies': 2, 'users_per_company': 3, 'department_depth': 2, 'department_fan_out': 2,
+    'positions_per_company': 4, 'positions_per_department': 2, 'processes_per_company': 2,
+    'actions_per_process': 3, 'groups_per_company': 2, 'granted_ratio': 0.5,
+}
+
+
+def generated_rows():
+    # Without the ids, which depend on what the database held before
+    return (
+        sorted(ActionGroupObjectPermission.objects.values_list(
+            'group__name', 'content_object__process__name', 'content_object__code_name')),
+        sorted(Company_department_position.objects.values_list(
+            'company_department__department', 'company_position__title')),
+        sorted(Company_department_employee.objects.values_list(
+            'company_department__department', 'employee__user__email')),
+    )
+
+
+def generate_and_roll_back(seed):
+    with transaction.atomic():
+        generate_synthetic_data(**SHAPE, seed=seed)
+        rows = generated_rows()
+        transaction.set_rollback(True)
+    return rows
+
+
+@pytest.mark.django_db
+def test_generated_row_counts():
+    call_command('generate_synthetic_data', *[f"--{key.replace('_', '-')}={value}" for key, value in SHAPE.items()],
+                 '--seed=7', verbosity=0)
+
+    # An owner creating the processes, plus 3 users per company
+    assert BaseUser.objects.filter(email__startswith='synthetic-7-').count() == 1 + 2 * 3
+    assert {model: model.objects.count() for model in (
+        Company, Employee, Company_department, Company_department_employee, Company_department_position,
+        Company_position, Process, Action, Company_group, ActionGroupObjectPermission)} == {
+        Company: 2,
+        Employee: 2 * 3,
+        Company_department: 2 * (2 + 2 * 2),
+        Company_department_employee: 2 * 3,
+        Company_department_position: 2 * 6 * 2,
+        Company_position: 2 * 4,
+        # The processes of APP_PROCESS_ACTIONS come on top
+        Process: 2 * (2 + 1),
+        Action: 2 * (2 * 3 + 1),
+        Company_group: 2 * 2,
+        # Half the 6 actions and the app action, per company group
+        ActionGroupObjectPermission: 2 * 2 * (3 + 1),
+    }
+
+
+@pytest.mark.django_db
+def test_same_seed_generates_the_same_rows():
+    rows = generate_and_roll_back(seed=7)
+
+    assert rows == generate_and_roll_back(seed=7)
+    assert rows[0] and rows[1] and rows[2]
+
+
+@pytest.mark.django_db
+def test_manifest(tmp_path):
+    path = tmp_path / 'manifest.json'
+    call_command('generate_synthetic_data', '--companies=2', '--users-per-company=2', '--processes-per-company=1',
+                 '--actions-per-process=2', '--seed=3', f'--manifest={path}', verbosity=0)
+
+    manifest = json.loads(path.read_text())
+    assert manifest['seed'] == 3
+    assert manifest['action_permission'] == ACTION_PERMISSION
+    assert manifest['action_content_type_id'] == ContentType.objects.get_for_model(Action).pk
+    assert [company['company_id'] for company in manifest['companies']] == \
+        list(Company.objects.order_by('id').values_list('id', flat=True))
+    for company in manifest['companies']:
+        assert sorted((user['id'], user['email']) for user in company['users']) == sorted(
+            Employee.objects.filter(company_id=company['company_id']).values_list('user_id', 'user__email'))
+        assert sorted(company['company_group_ids']) == sorted(
+            Company_group.objects.filter(company_id=company['company_id']).values_list('id', flat=True))
+        assert sorted(company['action_ids']) == sorted(Action.objects.filter(
+            process__company_id=company['company_id'], process__name='process-0').values_list('id', flat=True))
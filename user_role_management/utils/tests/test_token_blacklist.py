@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from user_role_management.authentication import blacklist
+from user_role_management.authentication.blacklist import CachedBlacklistRefreshToken, prune_expired_tokens
+from user_role_management.utils.tests.base import faker
+
+
+@pytest.fixture
+def refresh_token(user, password):
+    return APIClient().post(reverse('api:auth:login'), {'email': user.email, 'password': password}).data['refresh']
+
+
+@pytest.mark.django_db
+def test_refresh_checks_the_cached_blacklist(refresh_token, django_assert_num_queries):
+    CachedBlacklistRefreshToken(refresh_token)
+    with django_assert_num_queries(0):
+        CachedBlacklistRefreshToken(refresh_token)
+
+    assert APIClient().post(reverse('api:auth:logout'), {'refresh': refresh_token}).status_code == 200
+
+    with django_assert_num_queries(0), pytest.raises(TokenError):
+        CachedBlacklistRefreshToken(refresh_token)
+    assert APIClient().post(reverse('api:auth:refresh'), {'refresh': refresh_token}).status_code == 401
+
+
+@pytest.mark.django_db
+def test_lost_cache_is_filled_from_the_database(refresh_token):
+    CachedBlacklistRefreshToken(refresh_token).blacklist()
+    cache.clear()
+    blacklist._local_blacklist.clear()
+
+    with pytest.raises(TokenError):
+        CachedBlacklistRefreshToken(refresh_token)
+
+
+@pytest.mark.django_db
+def test_evicted_entries_are_read_from_the_database(refresh_token, django_assert_num_queries):
+    token = CachedBlacklistRefreshToken(refresh_token)
+    token.blacklist()
+    # The cache dropped the entry of the token only, as an LRU eviction does
+    cache.delete(blacklist.BLACKLISTED_TOKEN_KEY.format(jti=token['jti']))
+    blacklist._local_blacklist.clear()
+
+    with django_assert_num_queries(1), pytest.raises(TokenError):
+        CachedBlacklistRefreshToken(refresh_token)
+    blacklist._local_blacklist.clear()
+    with django_assert_num_queries(0), pytest.raises(TokenError):
+        CachedBlacklistRefreshToken(refresh_token)
+
+
+@pytest.mark.django_db
+def test_expired_tokens_are_pruned(refresh_token):
+    expired = [OutstandingToken.objects.create(jti=faker.uuid4(), token='',
+                                               expires_at=aware_utcnow() - timedelta(minutes=1))
+               for _ in range(5)]
+    BlacklistedToken.objects.create(token=expired[0])
+
+    assert prune_expired_tokens(batch_size=2) == 5
+    assert list(OutstandingToken.objects.values_list('jti', flat=True)) == \
+        [CachedBlacklistRefreshToken(refresh_token)['jti']]
+    assert not BlacklistedToken.objects.exists()
@@ -0,0 +1,62 @@
+import importlib
+import inspect
+import sys
+
+import pytest
+from django.urls import reverse
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from user_role_management.core import instrumentation, tracing
+from user_role_management.manage import selectors
+
+
+@pytest.fixture
+def finished_spans(settings, monkeypatch):
+    settings.TRACING_ENABLED = True
+    monkeypatch.setattr(tracing, '_tracer', None)
+    exporter = InMemorySpanExporter()
+    provider = tracing.configure_tracing(exporter=exporter)
+    instrumentation.instrument_selectors_and_services('user_role_management.manage')
+
+    def _finished_spans():
+        provider.force_flush()
+        return exporter.get_finished_spans()
+    yield _finished_spans
+    provider.shutdown()
+
+
+@pytest.mark.django_db
+def test_request_spans_nest_api_selector_and_permission_check(finished_spans, api_client):
+    api_client.get(reverse('api:manage:employees'))
+    api_client.post(reverse('api:manage:employees'), {'company_id': 1, 'personnel_code': '1', 'user_id': 1})
+    finished = finished_spans()
+    spans = {span.name: span for span in finished}
+
+    server, api = spans['GET EmployeesApi'], spans['EmployeesApi.get']
+    selector = spans['user_role_management.manage.selectors.organization_chart.get_filtered_employees']
+    assert api.parent.span_id == server.context.span_id
+    assert selector.parent.span_id == api.context.span_id
+    # The selector returns a lazy queryset, it is run while serializing in the api method
+    assert any(span.name == 'db SELECT' and span.parent.span_id == api.context.span_id for span in finished)
+    assert spans['url_action_perm'].attributes['url_action_perm.outcome'] == 'no_process'
+
+
+def test_spans_are_noops_when_disabled(monkeypatch):
+    monkeypatch.setattr(tracing, '_tracer', None)
+
+    with tracing.span('disabled') as span:
+        span.set_attribute('key', 'value')
+    assert tracing.traced(lambda: 1)() == 1
+
+
+def test_selectors_are_instrumented_when_imported(monkeypatch):
+    name = 'user_role_management.manage.selectors.process_action'
+    monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(selectors, 'process_action', selectors.process_action)
+    instrumentation.instrument_selectors_and_services('user_role_management.manage')
+
+    module = importlib.import_module(name)
+    assert module.get_filtered_processes.__instrumented__
+    # Answered by the wrapped loader
+    assert not module.__loader__.is_package(name)
+    assert 'def get_filtered_processes' in inspect.getsource(module)
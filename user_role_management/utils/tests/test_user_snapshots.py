@@ -0,0 +1,44 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from user_role_management.authentication.snapshots import USER_SNAPSHOT_KEY, get_user_snapshot, get_user_version
+from user_role_management.manage.models import BaseUser
+
+
+@pytest.mark.django_db
+def test_read_endpoints_run_no_auth_queries(jwt_client):
+    assert jwt_client.get(reverse('api:manage:employees')).status_code == 200
+
+    with CaptureQueriesContext(connection) as queries:
+        assert jwt_client.get(reverse('api:manage:employees')).status_code == 200
+
+    tables = ('"manage_baseuser"', '"manage_company"', '"manage_baseuser_company_groups"')
+    assert not [query['sql'] for query in queries if any(f'FROM {table}' in query['sql'] for table in tables)]
+
+
+@pytest.mark.django_db
+def test_snapshots_are_invalidated(user, company_group, jwt_client):
+    jwt_client.get(reverse('api:manage:employees'))
+
+    company_group.base_user_set.remove(user)
+    response = jwt_client.get(reverse('api:manage:employees'))
+    assert response.wsgi_request.user.company_groups.all().count() == 0
+
+    BaseUser._update(id=user.id, is_active=False)
+    assert jwt_client.get(reverse('api:manage:employees')).status_code == 401
+
+
+@pytest.mark.django_db
+def test_snapshots_cached_before_the_commit_are_stale(user, django_capture_on_commit_callbacks):
+    snapshot = get_user_snapshot(user.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        BaseUser._update(id=user.id, is_active=False)
+        # A concurrent request still reads the committed user, under the version it creates
+        cache.set(USER_SNAPSHOT_KEY.format(user_id=user.id, version=get_user_version(user.id)), snapshot)
+        assert get_user_snapshot(user.id)['is_active']
+
+    assert not get_user_snapshot(user.id)['is_active']